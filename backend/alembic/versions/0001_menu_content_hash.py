@@ -0,0 +1,32 @@
+"""Add menus.content_hash.
+
+Revision ID: 0001_menu_content_hash
+Revises:
+Create Date: 2026-10-17
+
+Tables are created by ``init_db`` (``SQLModel.metadata.create_all``), so
+a fresh database already has the column; only databases created before
+it was added need it.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0001_menu_content_hash"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _has_column(table: str, column: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return any(col["name"] == column for col in inspector.get_columns(table))
+
+
+def upgrade() -> None:
+    if not _has_column("menus", "content_hash"):
+        op.add_column("menus", sa.Column("content_hash", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("menus", "content_hash")
@@ -0,0 +1,40 @@
+"""Add per-stage timing columns to parser_runs.
+
+Revision ID: 0002_parser_run_stage_timings
+Revises: 0001_menu_content_hash
+Create Date: 2026-10-17
+
+Skips columns ``create_all`` already added on databases created after
+the model change.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0002_parser_run_stage_timings"
+down_revision = "0001_menu_content_hash"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = (
+    "fetch_ms",
+    "parse_ms",
+    "validate_ms",
+    "persist_ms",
+    "cache_write_ms",
+    "payload_size",
+    "item_count",
+)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    existing = {col["name"] for col in inspector.get_columns("parser_runs")}
+    for name in _COLUMNS:
+        if name not in existing:
+            op.add_column("parser_runs", sa.Column(name, sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    for name in reversed(_COLUMNS):
+        op.drop_column("parser_runs", name)
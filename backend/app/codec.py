@@ -0,0 +1,62 @@
+"""Pluggable JSON codec for vendor payloads and cached menus.
+
+Uses orjson when installed, then msgspec, then the stdlib ``json``
+module. Every backend produces compact output (no spaces) and keeps
+non-ASCII characters as-is, so the same value encodes to the same text
+whichever backend is active.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - depends on installed extras
+    msgspec = None
+
+if orjson is not None:
+    BACKEND = "orjson"
+elif msgspec is not None:
+    BACKEND = "msgspec"
+else:
+    BACKEND = "json"
+
+if msgspec is not None:
+    _msgspec_encoder = msgspec.json.Encoder()
+    _msgspec_sorted_encoder = msgspec.json.Encoder(order="sorted")
+    _msgspec_decoder = msgspec.json.Decoder()
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode a JSON document.
+
+    Raises:
+        ValueError: If ``data`` is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if msgspec is not None:
+        try:
+            return _msgspec_decoder.decode(data)
+        except msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, sort_keys: bool = False) -> str:
+    """Encode ``obj`` as compact JSON text.
+
+    ``sort_keys=True`` gives a canonical form suitable for hashing.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    if msgspec is not None:
+        encoder = _msgspec_sorted_encoder if sort_keys else _msgspec_encoder
+        return encoder.encode(obj).decode("utf-8")
+    return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False)
@@ -11,6 +11,49 @@ class Settings(BaseSettings):
     redis_url: str = "redis://localhost:6379/0"
     allowed_origins: list[str] = ["http://localhost:3000"]
 
+    # Upstream (vendor) HTTP client pool
+    http_max_connections: int = 20
+    http_max_keepalive_connections: int = 10
+    http_keepalive_expiry: float = 30.0
+    http2_enabled: bool = False
+
+    # Per-worker conditional-GET body cache and parse-result cache
+    # (app.parsers.base)
+    fetch_response_cache_entries: int = 64
+    fetch_response_cache_max_bytes: int = 16 * 1024 * 1024
+    fetch_parse_cache_entries: int = 64
+
+    # Probabilistic early refresh of cached menus (XFetch); 0 disables
+    cache_xfetch_beta: float = 1.0
+
+    # Per-vendor circuit breaker (app.services.circuit_breaker)
+    breaker_failure_threshold: int = 5
+    breaker_reset_timeout: float = 60.0
+    breaker_probe_timeout: float = 30.0
+
+    # Per-host upstream politeness limits (app.services.host_limiter)
+    host_max_concurrency: int = 4
+    host_requests_per_second: float = 2.0
+    host_burst: int = 4
+
+    # Background prefetch of the rolling week (app.services.prefetch),
+    # timed around meal windows (app.services.refresh_planner)
+    prefetch_enabled: bool = False
+    prefetch_meal_lead: float = 900.0  # refresh this long before a meal starts
+    prefetch_service_interval: float = 600.0  # and this often while it is served
+    # Halls with no hours on record; stays under the cache's shortest TTL (25 min)
+    prefetch_interval: float = 1500.0
+    prefetch_jitter: float = 0.1  # fraction of the scheduler's 60s tick
+    prefetch_days: int = 7
+    prefetch_concurrency: int = 2
+
+    # Seconds to wait on a live fetch before serving the stored menu (0 = wait)
+    menu_fetch_deadline: float = 3.0
+
+    # Parse offload: "process", "thread", or "inline"
+    parse_executor: str = "process"
+    parse_executor_workers: int | None = None
+
     # Admin panel settings
     admin_email: str = ""
     resend_api_key: str = ""
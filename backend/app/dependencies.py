@@ -1,9 +1,11 @@
 from collections.abc import AsyncGenerator
 
+import httpx
 from fastapi import Request
 from redis.asyncio import Redis
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app import db
 from app.db import get_session as _get_session
 
 
@@ -13,6 +15,20 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Return the session factory for work that outlives the request."""
+    return db.async_session_factory
+
+
 def get_redis(request: Request) -> Redis:
     """Return the Redis client stored on app.state by lifespan."""
     return request.app.state.redis
+
+
+def get_http_client(request: Request) -> httpx.AsyncClient | None:
+    """Return the pooled upstream HTTP client stored on app.state by lifespan.
+
+    Returns None when the lifespan has not run (e.g. ASGI test transport);
+    parsers then fall back to a one-off client.
+    """
+    return getattr(request.app.state, "http_client", None)
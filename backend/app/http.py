@@ -0,0 +1,40 @@
+"""Shared upstream HTTP client for vendor fetches.
+
+One pooled ``httpx.AsyncClient`` is created in the app lifespan and
+injected into every parser, so cache misses reuse keep-alive
+connections instead of paying DNS/TCP/TLS setup on each fetch.
+"""
+
+import importlib.util
+import logging
+
+import httpx
+
+from app.config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+def create_http_client(settings: Settings) -> httpx.AsyncClient:
+    """Create the pooled upstream HTTP client from settings.
+
+    HTTP/2 is only enabled when requested *and* the optional ``h2``
+    package is installed; otherwise the client falls back to HTTP/1.1
+    keep-alive. The caller (lifespan in main.py) is responsible for
+    storing this on app.state and closing it on shutdown.
+    """
+    http2 = settings.http2_enabled
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning("FIVEC_HTTP2_ENABLED set but 'h2' is not installed; using HTTP/1.1")
+        http2 = False
+
+    return httpx.AsyncClient(
+        http2=http2,
+        follow_redirects=True,
+        timeout=httpx.Timeout(30.0, connect=10.0),
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        ),
+    )
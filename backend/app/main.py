@@ -1,11 +1,19 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
+from app import db
 from app.db import init_db
+from app.http import create_http_client
+from app.parsers.base import configure_fetch_caches
+from app.parsers.executor import configure_parse_executor, shutdown_parse_executor
 from app.redis import create_redis
+from app.services.background import drain_background_tasks
+from app.services.host_limiter import configure_host_limits
+from app.services.prefetch import PrefetchScheduler
 from app.routers import admin, halls, menus, open_now
 
 # Ensure all models are imported so create_all sees them
@@ -14,11 +22,34 @@ import app.models.parser_run  # noqa: F401
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Manage application lifecycle: DB tables, Redis connection."""
+    """Manage application lifecycle: DB tables, Redis, HTTP client, parse executor, prefetch."""
     await init_db()
     settings = get_settings()
     app.state.redis = create_redis(settings.redis_url)
+    app.state.http_client = create_http_client(settings)
+    configure_parse_executor(settings.parse_executor, settings.parse_executor_workers)
+    configure_fetch_caches(
+        settings.fetch_response_cache_entries,
+        settings.fetch_response_cache_max_bytes,
+        settings.fetch_parse_cache_entries,
+    )
+    configure_host_limits(
+        settings.host_max_concurrency, settings.host_requests_per_second, settings.host_burst
+    )
+    app.state.prefetch = None
+    if settings.prefetch_enabled:
+        app.state.prefetch = PrefetchScheduler.from_settings(
+            app.state.redis, db.async_session_factory, app.state.http_client, settings
+        )
+        app.state.prefetch.start()
     yield
+    if app.state.prefetch is not None:
+        await app.state.prefetch.stop()
+    # Let background refreshes (hedged fetches, revalidations) finish persisting
+    await drain_background_tasks(timeout=settings.menu_fetch_deadline + 10)
+    # Waits for in-flight parses; keep the loop free meanwhile
+    await asyncio.to_thread(shutdown_parse_executor)
+    await app.state.http_client.aclose()
     await app.state.redis.aclose()
 
 
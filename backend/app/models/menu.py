@@ -1,44 +1,91 @@
 import datetime as _dt
+import sys
+from collections.abc import Iterable
 from typing import Any
 
-from pydantic import BaseModel
 from sqlalchemy import Column, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSON
 from sqlmodel import Field, SQLModel
 
 
 # ---------------------------------------------------------------------------
-# Pydantic models for parsed data interchange (NOT database tables)
+# Parsed menu records (internal interchange, NOT database tables)
+#
+# These sit on the parse hot path -- every vendor item, every station
+# copy made by the filter pipeline, every row rebuilt by the fallback
+# loader -- so they are plain __slots__ records rather than Pydantic
+# models: no validation on construction and no per-instance __dict__.
+# Pydantic is only used at the API boundary (app.schemas).
 # ---------------------------------------------------------------------------
 
 
-class ParsedMenuItem(BaseModel):
-    """A single menu item with optional dietary tags."""
+class _Record:
+    """Minimal slotted record: keyword init, equality, repr and pickling."""
 
-    name: str
-    tags: list[str] = []
+    __slots__ = ()
 
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
 
-class ParsedStation(BaseModel):
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    __hash__ = None  # mutable containers inside
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def __reduce__(self):
+        # Positional re-construction keeps process-pool pickles small
+        return type(self), self._values()
+
+
+class ParsedMenuItem(_Record):
+    """A single menu item with optional dietary tags.
+
+    ``tags`` is stored as a tuple of interned strings: the same handful of
+    canonical tags repeat across every item on every menu.
+    """
+
+    __slots__ = ("name", "tags")
+
+    def __init__(self, name: str, tags: Iterable[str] = ()) -> None:
+        self.name = name
+        self.tags: tuple[str, ...] = tuple(map(sys.intern, tags))
+
+
+class ParsedStation(_Record):
     """A station within a meal containing menu items."""
 
-    name: str
-    items: list[ParsedMenuItem]
+    __slots__ = ("name", "items")
 
+    def __init__(self, name: str, items: list[ParsedMenuItem]) -> None:
+        self.name = name
+        self.items = items
 
-class ParsedMeal(BaseModel):
+
+class ParsedMeal(_Record):
     """A meal period (e.g., lunch) with its stations."""
 
-    meal: str
-    stations: list[ParsedStation]
+    __slots__ = ("meal", "stations")
+
+    def __init__(self, meal: str, stations: list[ParsedStation]) -> None:
+        self.meal = meal
+        self.stations = stations
 
 
-class ParsedMenu(BaseModel):
+class ParsedMenu(_Record):
     """Complete parsed menu for a single hall and date."""
 
-    hall_id: str
-    date: _dt.date
-    meals: list[ParsedMeal]
+    __slots__ = ("hall_id", "date", "meals")
+
+    def __init__(self, hall_id: str, date: _dt.date, meals: list[ParsedMeal]) -> None:
+        self.hall_id = hall_id
+        self.date = date
+        self.meals = meals
 
 
 # ---------------------------------------------------------------------------
@@ -50,6 +97,8 @@ class Menu(SQLModel, table=True):
     """Persisted menu data for a hall/date/meal combination.
 
     stations_json stores the station->items hierarchy as JSONB.
+    content_hash is a SHA-256 of the canonical stations JSON, used to skip
+    rewriting unchanged meals and for downstream change detection.
     """
 
     __tablename__ = "menus"
@@ -62,5 +111,6 @@ class Menu(SQLModel, table=True):
     date: _dt.date = Field(index=True)
     meal: str = Field(max_length=20)
     stations_json: Any = Field(default=None, sa_column=Column(JSON, nullable=False))
+    content_hash: str | None = Field(default=None, max_length=64)
     fetched_at: _dt.datetime = Field(default_factory=_dt.datetime.utcnow)
     is_valid: bool = Field(default=True)
@@ -17,3 +17,13 @@ class ParserRun(SQLModel, table=True):
     status: str = Field(max_length=20)  # "success", "error", "fallback", "no_data"
     error_message: str | None = Field(default=None, max_length=500)
     menu_date: _dt.date | None = None
+
+    # Per-stage durations (see app.parsers.base.StageTimings); None when
+    # the stage did not run
+    fetch_ms: int | None = None
+    parse_ms: int | None = None
+    validate_ms: int | None = None
+    persist_ms: int | None = None
+    cache_write_ms: int | None = None
+    payload_size: int | None = None
+    item_count: int | None = None
@@ -2,7 +2,9 @@ from app.parsers.base import BaseParser
 from app.parsers.sodexo import SodexoParser
 from app.parsers.station_filters import (
     StationFilterConfig,
+    CompiledStationFilter,
     apply_station_filters,
+    compile_station_filter,
     SODEXO_FILTER,
     BONAPPETIT_FILTER,
     POMONA_FILTER,
@@ -15,7 +17,9 @@ __all__ = [
     "BaseParser",
     "SodexoParser",
     "StationFilterConfig",
+    "CompiledStationFilter",
     "apply_station_filters",
+    "compile_station_filter",
     "SODEXO_FILTER",
     "BONAPPETIT_FILTER",
     "POMONA_FILTER",
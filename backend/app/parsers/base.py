@@ -1,24 +1,226 @@
+import hashlib
 import logging
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import date
+from urllib.parse import urlsplit
 
 import httpx
 
 from app.models.menu import ParsedMenu
+from app.parsers.executor import run_parse
+from app.services.host_limiter import get_host_limiter
 
 logger = logging.getLogger(__name__)
 
+# ---------------------------------------------------------------------------
+# Conditional GET / raw-response cache (in-process, LRU-bounded)
+# ---------------------------------------------------------------------------
+
+# Defaults for the FIVEC_FETCH_* settings (see configure_fetch_caches)
+_response_cache_entries: int = 64
+_response_cache_max_bytes: int = 16 * 1024 * 1024  # stored bodies, all URLs
+_parse_cache_entries: int = 64
+
+
+@dataclass
+class _CachedResponse:
+    """Last successful body for a URL plus its cache validators."""
+
+    body: str
+    etag: str | None
+    last_modified: str | None
+    size: int  # body length in bytes
+
+
+# url -> last 200 body and validators, for If-None-Match / If-Modified-Since
+_response_cache: OrderedDict[str, _CachedResponse] = OrderedDict()
+_response_cache_bytes: int = 0
+
+# (hall_id, target_date) -> (body digest, parsed menus) so an unchanged
+# body (e.g. a 304) reuses the previous parse result
+_parse_cache: OrderedDict[tuple[str, date], tuple[bytes, list[ParsedMenu]]] = OrderedDict()
+
+
+def configure_fetch_caches(
+    response_entries: int, response_max_bytes: int, parse_entries: int
+) -> None:
+    """Set the response and parse cache limits (called once from the app lifespan).
+
+    Both caches are emptied.
+    """
+    global _response_cache_entries, _response_cache_max_bytes, _parse_cache_entries
+
+    if response_entries < 0 or response_max_bytes < 0 or parse_entries < 0:
+        raise ValueError("Fetch cache limits must be >= 0")
+    _response_cache_entries = response_entries
+    _response_cache_max_bytes = response_max_bytes
+    _parse_cache_entries = parse_entries
+    reset_fetch_caches()
+
+
+def reset_fetch_caches() -> None:
+    """Empty the response and parse caches."""
+    global _response_cache_bytes
+
+    _response_cache.clear()
+    _response_cache_bytes = 0
+    _parse_cache.clear()
+
+
+def _lru_put(cache: OrderedDict, key, value, max_size: int) -> None:
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > max_size:
+        cache.popitem(last=False)
+
+
+def _response_cache_put(url: str, entry: _CachedResponse) -> None:
+    global _response_cache_bytes
+
+    _response_cache_drop(url)
+    if entry.size > _response_cache_max_bytes:
+        return
+    _response_cache[url] = entry
+    _response_cache_bytes += entry.size
+    while (
+        len(_response_cache) > _response_cache_entries
+        or _response_cache_bytes > _response_cache_max_bytes
+    ):
+        _response_cache_drop(next(iter(_response_cache)))
+
+
+def _response_cache_drop(url: str) -> None:
+    global _response_cache_bytes
+
+    entry = _response_cache.pop(url, None)
+    if entry is not None:
+        _response_cache_bytes -= entry.size
+
+
+def _body_digest(body: str) -> bytes:
+    return hashlib.blake2b(body.encode(), digest_size=16).digest()
+
+
+# ---------------------------------------------------------------------------
+# Per-stage timings
+# ---------------------------------------------------------------------------
+
+# Pipeline stages timed for each parser run, in order
+STAGES: tuple[str, ...] = ("fetch", "parse", "validate", "persist", "cache_write")
+
+
+def elapsed_ms(start: float) -> int:
+    """Milliseconds since ``start`` (a ``time.monotonic()`` reading)."""
+    return int((time.monotonic() - start) * 1000)
+
+
+@dataclass
+class StageTimings:
+    """Stage durations and payload stats for one parser run.
+
+    ``fetch_and_parse`` fills fetch/parse/validate and the payload stats;
+    the fallback orchestrator adds persist and cache_write. A stage that
+    never ran stays None.
+    """
+
+    fetch_ms: int | None = None
+    parse_ms: int | None = None
+    validate_ms: int | None = None
+    persist_ms: int | None = None
+    cache_write_ms: int | None = None
+    payload_size: int | None = None  # length of the raw vendor payload
+    item_count: int | None = None  # items on the target date's menu
+    # The vendor fetch itself failed (HTTP error, timeout, connection error)
+    fetch_failed: bool = False
+    # The target date parsed with no meals: the vendor has no menu for it,
+    # as opposed to a fetch, parse or validation failure
+    no_menu: bool = False
+
 
 class BaseParser(ABC):
     """Abstract base class for all dining hall parsers.
 
     Enforces fetch/parse separation: ``fetch_raw`` handles I/O,
     ``parse`` is a pure function testable against fixture files.
+
+    ``client`` is the shared pooled HTTP client created in the app
+    lifespan. When omitted (scripts, tests), ``_get`` opens a one-off
+    client per request.
     """
 
-    def __init__(self, hall_id: str, hall_name: str) -> None:
+    user_agent: str = "Mozilla/5.0 (compatible; 5CMenu/1.0)"
+    request_timeout: httpx.Timeout = httpx.Timeout(30.0)
+
+    def __init__(
+        self,
+        hall_id: str,
+        hall_name: str,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
         self.hall_id = hall_id
         self.hall_name = hall_name
+        self.client = client
+        # Validated menus for other dates found in the last fetched payload
+        self.sibling_menus: list[ParsedMenu] = []
+        # Stage timings of the last fetch_and_parse call
+        self.timings = StageTimings()
+        # Seconds the current fetch spent queued for host limiter slots
+        self._queued_s = 0.0
+
+    async def _get(self, url: str) -> str:
+        """GET a vendor URL and return its body, raising on error responses.
+
+        Sends ``If-None-Match`` / ``If-Modified-Since`` when a previous
+        response for the URL carried validators; a 304 returns the
+        previously stored body. The request waits for a slot from the
+        URL's host limiter (``app.services.host_limiter``).
+        """
+        headers = {"User-Agent": self.user_agent}
+        cached = _response_cache.get(url)
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        queued_at = time.monotonic()
+        async with get_host_limiter(urlsplit(url).hostname).slot():
+            self._queued_s += time.monotonic() - queued_at
+            if self.client is not None:
+                response = await self.client.get(
+                    url, headers=headers, timeout=self.request_timeout
+                )
+            else:
+                async with httpx.AsyncClient(
+                    follow_redirects=True, timeout=self.request_timeout
+                ) as client:
+                    response = await client.get(url, headers=headers)
+
+        if response.status_code == 304 and cached is not None:
+            logger.debug("304 Not Modified for %s", url)
+            _response_cache.move_to_end(url)
+            return cached.body
+
+        response.raise_for_status()
+        body = response.text
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            _response_cache_put(
+                url,
+                _CachedResponse(
+                    body=body,
+                    etag=etag,
+                    last_modified=last_modified,
+                    size=len(response.content),
+                ),
+            )
+        else:
+            _response_cache_drop(url)
+        return body
 
     @abstractmethod
     async def fetch_raw(self, target_date: date) -> str:
@@ -34,6 +236,15 @@ class BaseParser(ABC):
         Pure parsing logic -- no I/O. Testable against saved fixture files.
         """
 
+    def parse_all(self, raw_content: str, target_date: date) -> list[ParsedMenu]:
+        """Parse every date contained in a raw payload.
+
+        Vendors whose payload spans several days (e.g. Sodexo's weekly
+        JSON) override this so one fetch can fill every day at once.
+        The default parses only ``target_date``.
+        """
+        return [self.parse(raw_content, target_date)]
+
     def validate(self, menu: ParsedMenu) -> bool:
         """Structural validation of a parsed menu.
 
@@ -55,6 +266,38 @@ class BaseParser(ABC):
                 return False
         return True
 
+    async def _parse_all_cached(self, raw: str, target_date: date) -> list[ParsedMenu]:
+        """Run ``parse_all`` off-loop, reusing the previous result if the body is unchanged."""
+        cache_key = (self.hall_id, target_date)
+        digest = _body_digest(raw)
+        cached = _parse_cache.get(cache_key)
+        if cached is not None and cached[0] == digest:
+            logger.debug("Reusing parsed menu for %s on %s", self.hall_id, target_date)
+            _parse_cache.move_to_end(cache_key)
+            return cached[1]
+
+        menus = await run_parse(self, raw, target_date)
+        _lru_put(_parse_cache, cache_key, (digest, menus), _parse_cache_entries)
+        return menus
+
+    @property
+    def vendor_host(self) -> str:
+        """Upstream host this parser fetches from (keys the circuit breaker).
+
+        Read again after a fetch to attribute its outcome, so parsers
+        that fetch from several hosts can report the one they used.
+        """
+        return self.hall_id
+
+    @property
+    def vendor_hosts(self) -> tuple[str, ...]:
+        """Every upstream host this parser may fetch from.
+
+        Unlike ``vendor_host`` this does not depend on in-process state,
+        so every worker reports the same breakers for a hall.
+        """
+        return (self.vendor_host,)
+
     @property
     def min_station_count(self) -> int:
         """Minimum stations required for a valid meal. Override per vendor."""
@@ -63,11 +306,19 @@ class BaseParser(ABC):
     async def fetch_and_parse(self, target_date: date) -> ParsedMenu | None:
         """Full pipeline: fetch -> parse -> validate.
 
-        Returns None if fetch fails or validation fails.
+        Returns None if fetch fails or validation fails. Valid menus for
+        any other dates in the same payload are left in ``sibling_menus``,
+        and per-stage durations in ``timings``.
         """
+        self.sibling_menus = []
+        timings = self.timings = StageTimings()
+        self._queued_s = 0.0
+
+        start = time.monotonic()
         try:
             raw = await self.fetch_raw(target_date)
         except httpx.HTTPStatusError as exc:
+            timings.fetch_failed = True
             logger.warning(
                 "HTTP %d fetching %s for %s",
                 exc.response.status_code,
@@ -76,9 +327,11 @@ class BaseParser(ABC):
             )
             return None
         except httpx.TimeoutException:
+            timings.fetch_failed = True
             logger.warning("Timeout fetching %s for %s", self.hall_id, target_date)
             return None
         except httpx.RequestError as exc:
+            timings.fetch_failed = True
             logger.warning(
                 "Request error fetching %s for %s: %s",
                 self.hall_id,
@@ -86,14 +339,34 @@ class BaseParser(ABC):
                 exc,
             )
             return None
+        finally:
+            # Queueing for the hosts' politeness limits is not fetch time
+            timings.fetch_ms = int((time.monotonic() - start - self._queued_s) * 1000)
+        timings.payload_size = len(raw)
 
+        start = time.monotonic()
         try:
-            menu = self.parse(raw, target_date)
+            menus = await self._parse_all_cached(raw, target_date)
         except Exception:
             logger.exception("Parse error for %s on %s", self.hall_id, target_date)
             return None
+        finally:
+            timings.parse_ms = elapsed_ms(start)
 
-        if not self.validate(menu):
-            return None
+        start = time.monotonic()
+        target_menu: ParsedMenu | None = None
+        for menu in menus:
+            if menu.date == target_date:
+                if not menu.meals:
+                    timings.no_menu = True
+                elif self.validate(menu):
+                    target_menu = menu
+            elif menu.meals and self.validate(menu):
+                self.sibling_menus.append(menu)
+        timings.validate_ms = elapsed_ms(start)
 
-        return menu
+        if target_menu is not None:
+            timings.item_count = sum(
+                len(station.items) for meal in target_menu.meals for station in meal.stations
+            )
+        return target_menu
@@ -1,13 +1,14 @@
 """Bon Appetit (BAMCO) parser for Collins, Malott, and McConnell dining halls.
 
 Extracts menu data from inline JavaScript objects (Bamco.menu_items and
-Bamco.dayparts) embedded in the cafe pages via regex.
+Bamco.dayparts) embedded in the cafe pages with a single-pass scanner.
 """
 
 import json
 import logging
 import re
 from datetime import date
+from urllib.parse import urlsplit
 
 import httpx
 
@@ -41,13 +42,22 @@ BAMCO_HALLS: dict[str, dict[str, str]] = {
 }
 
 # ---------------------------------------------------------------------------
-# Regex patterns for JavaScript object extraction
+# JavaScript object extraction
 # ---------------------------------------------------------------------------
 
-RE_MENU_ITEMS = re.compile(r"Bamco\.menu_items\s*=\s*(\{[^;]+\});")
-RE_DAYPARTS = re.compile(r"Bamco\.dayparts\[\'(\d+)\'\]\s*=\s*(\{[^;]+\});")
+# Matches the left-hand side of ``Bamco.menu_items = `` and
+# ``Bamco.dayparts['N'] = ``; the object itself is decoded by
+# ``_JSON_DECODER.raw_decode``, which is string-aware and stops at the
+# matching closing brace, so semicolons inside descriptions are harmless.
+RE_BAMCO_ASSIGNMENT = re.compile(
+    r"Bamco\.(?:(menu_items)|dayparts\[\'(\d+)\'\])\s*=\s*"
+)
 RE_HTML_TAGS = re.compile(r"<[^>]+>")
 
+# Stays on the stdlib decoder: raw_decode (decode a prefix and report
+# where it ended) has no orjson/msgspec equivalent.
+_JSON_DECODER = json.JSONDecoder()
+
 
 def _clean_station_label(raw_label: str) -> str:
     """Strip HTML tags, leading '@' symbol, and excess whitespace."""
@@ -68,46 +78,48 @@ class BonAppetitParser(BaseParser):
 
     Supports Collins (CMC), Malott (Scripps), and McConnell (Pitzer).
     Extracts Bamco.menu_items and Bamco.dayparts from inline JavaScript
-    via regex, filters by the ``special`` field, normalizes dietary tags
+    in a single scan, filters by the ``special`` field, normalizes dietary tags
     from ``cor_icon``, and applies station filtering rules.
     """
 
-    def __init__(self, hall_id: str, hall_name: str) -> None:
+    user_agent = "Mozilla/5.0"
+    request_timeout = httpx.Timeout(30.0, connect=10.0)
+
+    def __init__(
+        self,
+        hall_id: str,
+        hall_name: str,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
         if hall_id not in BAMCO_HALLS:
             raise ValueError(
                 f"Unknown BAMCO hall: {hall_id!r}. "
                 f"Must be one of {list(BAMCO_HALLS)}"
             )
-        super().__init__(hall_id, hall_name)
+        super().__init__(hall_id, hall_name, client)
         self._url_template = BAMCO_HALLS[hall_id]["url"]
 
+    @property
+    def vendor_host(self) -> str:
+        return urlsplit(self._url_template).hostname
+
     def build_url(self, target_date: date) -> str:
         """Format the cafe URL for the given date."""
         return self._url_template.format(date=target_date.isoformat())
 
     async def fetch_raw(self, target_date: date) -> str:
         """Fetch the raw HTML page from the BAMCO cafe site."""
-        url = self.build_url(target_date)
-        async with httpx.AsyncClient(
-            headers={"User-Agent": "Mozilla/5.0"},
-            follow_redirects=True,
-            timeout=httpx.Timeout(30.0, connect=10.0),
-        ) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            return response.text
+        return await self._get(self.build_url(target_date))
 
     def parse(self, raw_content: str, target_date: date) -> ParsedMenu:
         """Parse BAMCO page HTML into structured menu data.
 
         Steps:
-        1. Extract Bamco.menu_items JSON object via regex
-        2. Extract all Bamco.dayparts assignments via regex
-        3. Build meals from dayparts, filtering by special field
-        4. Apply station filtering pipeline
+        1. Extract Bamco.menu_items and all Bamco.dayparts in one scan
+        2. Build meals from dayparts, filtering by special field
+        3. Apply station filtering pipeline
         """
-        menu_items = self._extract_menu_items(raw_content)
-        dayparts = self._extract_dayparts(raw_content)
+        menu_items, dayparts = self._extract_bamco_objects(raw_content)
 
         meals: list[ParsedMeal] = []
         for _dp_id, dp_data in dayparts.items():
@@ -127,25 +139,46 @@ class BonAppetitParser(BaseParser):
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _extract_menu_items(html: str) -> dict:
-        """Extract Bamco.menu_items JSON object from page HTML."""
-        match = RE_MENU_ITEMS.search(html)
-        if not match:
-            raise ValueError("Could not find Bamco.menu_items in page")
-        return json.loads(match.group(1))
+    def _scan_bamco_objects(html: str) -> tuple[dict | None, dict[str, dict]]:
+        """Extract Bamco.menu_items and every Bamco.dayparts entry in one pass.
 
-    @staticmethod
-    def _extract_dayparts(html: str) -> dict:
-        """Extract all Bamco.dayparts assignments from page HTML."""
+        Walks the page left to right: each assignment found is decoded in
+        place and scanning resumes after the end of its object, so the
+        large blobs are traversed exactly once.
+
+        Returns ``(menu_items, dayparts)``; ``menu_items`` is None when
+        the page has no ``Bamco.menu_items`` assignment.
+        """
+        menu_items: dict | None = None
         dayparts: dict[str, dict] = {}
-        for match in RE_DAYPARTS.finditer(html):
-            dp_id = match.group(1)
-            dp_data = json.loads(match.group(2))
-            dayparts[dp_id] = dp_data
 
+        pos = 0
+        while (match := RE_BAMCO_ASSIGNMENT.search(html, pos)) is not None:
+            pos = match.end()
+            if html.startswith("{", pos):
+                try:
+                    obj, pos = _JSON_DECODER.raw_decode(html, pos)
+                except json.JSONDecodeError:
+                    logger.warning("Malformed Bamco object at offset %d", pos)
+                    continue
+
+                if match.group(1) is not None:
+                    if menu_items is None:
+                        menu_items = obj
+                else:
+                    dayparts[match.group(2)] = obj
+
+        return menu_items, dayparts
+
+    @classmethod
+    def _extract_bamco_objects(cls, html: str) -> tuple[dict, dict[str, dict]]:
+        """Extract Bamco.menu_items and Bamco.dayparts, raising if either is missing."""
+        menu_items, dayparts = cls._scan_bamco_objects(html)
+        if menu_items is None:
+            raise ValueError("Could not find Bamco.menu_items in page")
         if not dayparts:
             raise ValueError("Could not find Bamco.dayparts in page")
-        return dayparts
+        return menu_items, dayparts
 
     @staticmethod
     def _build_stations(
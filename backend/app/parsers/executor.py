@@ -0,0 +1,133 @@
+"""Off-loop executor for CPU-bound parse work.
+
+``parse`` runs selectolax DOM builds, regex scans and JSON decoding of
+large vendor payloads. Running that on the event loop stalls every other
+request on the worker, so ``run_parse`` hands it to a configurable
+executor instead:
+
+* ``"process"`` (default) -- a spawn-based process pool; the parser is
+  rebuilt in the worker from its class and hall, so the shared HTTP
+  client never crosses the process boundary.
+* ``"thread"`` -- a thread pool (keeps the loop responsive for the parts
+  of parsing that release the GIL).
+* ``"inline"`` -- parse on the event loop (used when unconfigured, e.g.
+  in tests and scripts).
+
+A process pool whose worker dies (OOM kill, crash in a C extension) is
+broken for good, so ``run_parse`` replaces it and retries the parse once.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date
+from functools import partial
+
+from app.models.menu import ParsedMenu
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_KINDS: tuple[str, ...] = ("process", "thread", "inline")
+
+_executor: Executor | None = None
+_max_workers: int | None = None
+
+
+def configure_parse_executor(kind: str, max_workers: int | None = None) -> None:
+    """Create the module-wide parse executor.
+
+    Called once from the app lifespan. Replaces (and shuts down) any
+    previously configured executor.
+
+    Raises:
+        ValueError: If ``kind`` is not one of ``EXECUTOR_KINDS``.
+    """
+    global _executor, _max_workers
+
+    if kind not in EXECUTOR_KINDS:
+        raise ValueError(f"Unknown parse executor {kind!r}. Must be one of {list(EXECUTOR_KINDS)}")
+
+    shutdown_parse_executor()
+    _max_workers = max_workers
+    if kind == "process":
+        _executor = _new_process_pool()
+    elif kind == "thread":
+        _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="parse")
+    logger.info("Parse executor: %s (max_workers=%s)", kind, max_workers)
+
+
+def _new_process_pool() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=_max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def shutdown_parse_executor() -> None:
+    """Shut down the parse executor, if any, and revert to inline parsing.
+
+    Blocks until running parses finish; call it via ``asyncio.to_thread``
+    from async code.
+    """
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+
+def _replace_broken_pool(broken: Executor) -> None:
+    """Swap in a fresh process pool, unless another caller already has."""
+    global _executor
+
+    if _executor is broken:
+        logger.warning("Parse process pool is broken; starting a new one")
+        broken.shutdown(wait=False, cancel_futures=True)
+        _executor = _new_process_pool()
+
+
+def _parse_in_worker(
+    parser_cls: type,
+    hall_id: str,
+    hall_name: str,
+    raw_content: str,
+    target_date: date,
+) -> list[ParsedMenu]:
+    """Process-pool entry point: rebuild the parser and run ``parse_all``."""
+    parser = parser_cls(hall_id, hall_name)
+    return parser.parse_all(raw_content, target_date)
+
+
+async def run_parse(parser, raw_content: str, target_date: date) -> list[ParsedMenu]:
+    """Run ``parser.parse_all`` on the configured executor.
+
+    Falls back to parsing inline when no executor is configured. If the
+    process pool is broken, it is replaced and the parse retried once on
+    the new pool.
+    """
+    if _executor is None:
+        return parser.parse_all(raw_content, target_date)
+
+    if not isinstance(_executor, ProcessPoolExecutor):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _executor, partial(parser.parse_all, raw_content, target_date)
+        )
+
+    fn = partial(
+        _parse_in_worker,
+        type(parser),
+        parser.hall_id,
+        parser.hall_name,
+        raw_content,
+        target_date,
+    )
+    loop = asyncio.get_running_loop()
+    pool = _executor
+    try:
+        return await loop.run_in_executor(pool, fn)
+    except BrokenProcessPool:
+        _replace_broken_pool(pool)
+    return await loop.run_in_executor(_executor, fn)
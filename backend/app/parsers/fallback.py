@@ -5,13 +5,18 @@ to the last-known-good menu data stored in PostgreSQL. Fresh data is persisted
 on every successful parse for future fallback use.
 """
 
+import asyncio
 import datetime as _dt
+import hashlib
 import logging
 import time
+from collections.abc import Awaitable, Callable
+from functools import partial
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app import codec
 from app.models.parser_run import ParserRun
 from app.models.menu import (
     Menu,
@@ -20,11 +25,37 @@ from app.models.menu import (
     ParsedMenuItem,
     ParsedStation,
 )
-from app.parsers.base import BaseParser
+from app.parsers.base import BaseParser, StageTimings, elapsed_ms
+from app.services.background import spawn_background
+from app.services.circuit_breaker import CircuitBreaker
 
 logger = logging.getLogger(__name__)
 
 
+def serialize_stations(stations: list[ParsedStation]) -> list[dict]:
+    """Serialize parsed stations into the ``stations_json`` shape."""
+    return [
+        {
+            "name": station.name,
+            "items": [
+                {"name": item.name, "tags": list(item.tags)}
+                for item in station.items
+            ],
+        }
+        for station in stations
+    ]
+
+
+def stations_content_hash(stations_data: list[dict]) -> str:
+    """Return a stable SHA-256 hex digest of serialized stations.
+
+    Keys are sorted and separators fixed so the same menu always hashes
+    the same regardless of dict construction order.
+    """
+    canonical = codec.dumps(stations_data, sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
 async def persist_menu(
     session: AsyncSession,
     hall_id: str,
@@ -34,19 +65,12 @@ async def persist_menu(
     """Persist a parsed menu to the database for fallback use.
 
     Upserts one row per meal period (hall_id + date + meal). Serializes
-    the station hierarchy as JSON in the ``stations_json`` column.
+    the station hierarchy as JSON in the ``stations_json`` column. Rows
+    whose ``content_hash`` already matches are left untouched.
     """
     for meal in menu.meals:
-        stations_data = [
-            {
-                "name": station.name,
-                "items": [
-                    {"name": item.name, "tags": item.tags}
-                    for item in station.items
-                ],
-            }
-            for station in meal.stations
-        ]
+        stations_data = serialize_stations(meal.stations)
+        content_hash = stations_content_hash(stations_data)
 
         # Check for existing row
         stmt = select(Menu).where(
@@ -58,7 +82,11 @@ async def persist_menu(
         existing = result.scalar_one_or_none()
 
         if existing is not None:
+            if existing.content_hash == content_hash and existing.is_valid:
+                # Unchanged meal -- skip the UPDATE entirely
+                continue
             existing.stations_json = stations_data
+            existing.content_hash = content_hash
             existing.fetched_at = _dt.datetime.now(_dt.timezone.utc)
             existing.is_valid = True
         else:
@@ -67,6 +95,7 @@ async def persist_menu(
                 date=target_date,
                 meal=meal.meal,
                 stations_json=stations_data,
+                content_hash=content_hash,
                 fetched_at=_dt.datetime.now(_dt.timezone.utc),
                 is_valid=True,
             )
@@ -140,23 +169,47 @@ async def _record_run(
     start: float,
     status: str,
     error_message: str | None = None,
+    timings: StageTimings | None = None,
+    breaker: CircuitBreaker | None = None,
+    vendor_host: str | None = None,
+    vendor_failed: bool = False,
 ) -> None:
-    """Best-effort recording of a parser run for health tracking."""
+    """Best-effort recording of a parser run for health tracking.
+
+    With a ``breaker``, also records the vendor outcome against
+    ``vendor_host``: ``vendor_failed`` counts towards opening it, anything
+    else (the vendor answered) closes it.
+    """
+    if breaker is not None and vendor_host is not None:
+        if vendor_failed:
+            await breaker.record_failure(vendor_host)
+        else:
+            await breaker.record_success(vendor_host)
+
     try:
-        duration_ms = int((time.monotonic() - start) * 1000)
         run = ParserRun(
             hall_id=hall_id,
-            duration_ms=duration_ms,
+            duration_ms=elapsed_ms(start),
             status=status,
             error_message=error_message,
             menu_date=target_date,
         )
+        if timings is not None:
+            run.fetch_ms = timings.fetch_ms
+            run.parse_ms = timings.parse_ms
+            run.validate_ms = timings.validate_ms
+            run.persist_ms = timings.persist_ms
+            run.cache_write_ms = timings.cache_write_ms
+            run.payload_size = timings.payload_size
+            run.item_count = timings.item_count
         session.add(run)
         await session.commit()
     except Exception:
         logger.warning(
             "Failed to record parser run for %s", hall_id, exc_info=True
         )
+        # Leave the session usable for the fallback query that follows
+        await session.rollback()
 
 
 async def get_menu_with_fallback(
@@ -164,24 +217,126 @@ async def get_menu_with_fallback(
     hall_id: str,
     target_date: _dt.date,
     session: AsyncSession,
+    on_success: Callable[[ParsedMenu, _dt.datetime], Awaitable[None]] | None = None,
+    breaker: CircuitBreaker | None = None,
+    deadline: float | None = None,
+    session_factory: Callable[[], AsyncSession] | None = None,
 ) -> tuple[ParsedMenu | None, bool, _dt.datetime | None]:
     """Fetch a menu with fallback to last-known-good data.
 
     Returns ``(menu, is_stale, fetched_at)`` where:
     - ``is_stale=False`` means fresh data from the live parser
     - ``is_stale=True`` means fallback data from the database (or None)
+
+    Menus for other dates found in the same vendor payload
+    (``parser.sibling_menus``) are persisted alongside the target date.
+
+    ``on_success(menu, fetched_at)`` is awaited after a fresh menu is
+    persisted (the caller's cache writes), so its duration is recorded
+    as the run's cache_write stage. Its errors are logged, not raised.
+
+    With a ``breaker``, the live fetch is skipped while the parser's
+    vendor host has its circuit open, and the DB fallback is served
+    immediately (recorded as a ``"fallback"`` run).
+
+    With a ``deadline`` (seconds) and a ``session_factory``, a live fetch
+    still running at the deadline is hedged: if the database has a
+    last-known-good menu it is returned (stale) right away, and the
+    fetch finishes in the background -- persisting, calling
+    ``on_success`` and recording the run on a session of its own.
     """
     start = time.monotonic()
+
+    vendor_host = parser.vendor_host
+    if breaker is not None and not await breaker.allow(vendor_host):
+        logger.info("Circuit open for %s; serving %s from database", vendor_host, hall_id)
+        await _record_run(
+            session, hall_id, target_date, start, "fallback",
+            f"Circuit open for {vendor_host}",
+        )
+        return await _load_fallback(session, hall_id, target_date)
+
+    fetch = asyncio.ensure_future(parser.fetch_and_parse(target_date))
+    complete = partial(
+        _complete_live_fetch, fetch, parser, hall_id, target_date, start,
+        on_success=on_success, breaker=breaker,
+    )
+
+    if deadline is not None and session_factory is not None:
+        try:
+            done, _ = await asyncio.wait({fetch}, timeout=deadline)
+        except asyncio.CancelledError:
+            fetch.cancel()
+            raise
+        if not done:
+            stored = await _load_fallback(session, hall_id, target_date)
+            if stored[0] is not None:
+                logger.info(
+                    "Live fetch for %s on %s exceeded %.1fs; serving stored menu",
+                    hall_id, target_date, deadline,
+                )
+                spawn_background(_complete_in_background(complete, session_factory))
+                return stored
+            # Nothing stored to hedge with: keep waiting for the live fetch
+
+    result = await complete(session)
+    if result is not None:
+        menu, fetched_at = result
+        return menu, False, fetched_at
+    return await _load_fallback(session, hall_id, target_date)
+
+
+async def _complete_live_fetch(
+    fetch: "asyncio.Future[ParsedMenu | None]",
+    parser: BaseParser,
+    hall_id: str,
+    target_date: _dt.date,
+    start: float,
+    session: AsyncSession,
+    *,
+    on_success: Callable[[ParsedMenu, _dt.datetime], Awaitable[None]] | None,
+    breaker: CircuitBreaker | None,
+) -> tuple[ParsedMenu, _dt.datetime] | None:
+    """Await a live fetch, then persist, run ``on_success`` and record the run.
+
+    Returns ``(menu, fetched_at)``, or None if the fetch produced no
+    usable menu (the caller falls back). The outcome is recorded against
+    ``parser.vendor_host`` as read after the fetch, i.e. the host it
+    last reached.
+    """
     status = "success"
     error_msg: str | None = None
 
+    # Until fetch_and_parse returns, any exception is the vendor's
+    vendor_failed = True
     try:
-        menu = await parser.fetch_and_parse(target_date)
+        menu = await fetch
+        timings = parser.timings
+        vendor_failed = timings.fetch_failed
         if menu is not None:
             now = _dt.datetime.now(_dt.timezone.utc)
+            stage_start = time.monotonic()
             await persist_menu(session, hall_id, target_date, menu)
-            await _record_run(session, hall_id, target_date, start, "success")
-            return menu, False, now
+            for sibling in parser.sibling_menus:
+                await persist_menu(session, hall_id, sibling.date, sibling)
+            timings.persist_ms = elapsed_ms(stage_start)
+            if on_success is not None:
+                stage_start = time.monotonic()
+                try:
+                    await on_success(menu, now)
+                except Exception:
+                    # The menu is fresh and persisted; a failed cache
+                    # write must not turn it into a fallback
+                    logger.warning(
+                        "on_success failed for %s on %s", hall_id, target_date,
+                        exc_info=True,
+                    )
+                timings.cache_write_ms = elapsed_ms(stage_start)
+            await _record_run(
+                session, hall_id, target_date, start, "success", timings=timings,
+                breaker=breaker, vendor_host=parser.vendor_host, vendor_failed=False,
+            )
+            return menu, now
         status = "no_data"
     except Exception as exc:
         logger.warning(
@@ -193,9 +348,36 @@ async def get_menu_with_fallback(
         status = "error"
         error_msg = str(exc)[:500]
 
-    await _record_run(session, hall_id, target_date, start, status, error_msg)
+    await _record_run(
+        session, hall_id, target_date, start, status, error_msg, timings=parser.timings,
+        breaker=breaker, vendor_host=parser.vendor_host, vendor_failed=vendor_failed,
+    )
+    return None
+
 
-    # Fallback: load last-known-good from database
+# ---------------------------------------------------------------------------
+# Background completion of hedged fetches
+# ---------------------------------------------------------------------------
+
+
+async def _complete_in_background(
+    complete: Callable[[AsyncSession], Awaitable[object]],
+    session_factory: Callable[[], AsyncSession],
+) -> None:
+    """Finish a hedged live fetch on a fresh session."""
+    try:
+        async with session_factory() as session:
+            await complete(session)
+    except Exception:
+        logger.warning("Background menu refresh failed", exc_info=True)
+
+
+async def _load_fallback(
+    session: AsyncSession,
+    hall_id: str,
+    target_date: _dt.date,
+) -> tuple[ParsedMenu | None, bool, _dt.datetime | None]:
+    """Load last-known-good data from the database, marked stale."""
     stored_menu, stored_fetched_at = await load_latest_menu(
         session, hall_id, target_date
     )
@@ -2,17 +2,21 @@
 
 Fetches menu data via a two-step process: first discovers the JSON URL from the
 Pomona menu page HTML, then fetches and parses the EatecExchange JSON feed.
+The feed spans several days, so ``parse_all`` decodes it once into a per-date
+index and builds every served date in one pass.
 Oldenborg items are split by comma AND slash; other halls by comma only.
 """
 
-import json
 import logging
 import re
-from datetime import date
+import time
+from datetime import date, datetime
+from urllib.parse import urlsplit
 
 import httpx
 from selectolax.lexbor import LexborHTMLParser
 
+from app import codec
 from app.models.menu import ParsedMeal, ParsedMenu, ParsedMenuItem, ParsedStation
 from app.parsers.base import BaseParser
 from app.parsers.station_filters import (
@@ -36,6 +40,13 @@ POMONA_HALLS: dict[str, dict[str, str]] = {
 _PAGE_URL_TEMPLATE = "https://www.pomona.edu/administration/dining/menus/{slug}"
 _FALLBACK_JSON_URL_TEMPLATE = "https://my.pomona.edu/eatec/{name}.json"
 
+# Discovered JSON URLs almost never change, so step 1 of the fetch is
+# skipped while a cached URL is fresh. A 404 on the JSON URL evicts it.
+_JSON_URL_TTL: float = 6 * 60 * 60  # seconds
+
+# slug -> (json_url, expires_at on the monotonic clock)
+_json_url_cache: dict[str, tuple[str, float]] = {}
+
 
 # ---------------------------------------------------------------------------
 # Parser
@@ -48,17 +59,46 @@ class PomonaParser(BaseParser):
     Supports Frank, Frary, and Oldenborg. Uses a two-step fetch: first
     fetches the Pomona menu page to discover the JSON URL via the
     ``data-dining-menu-json-url`` attribute, then fetches the JSON feed.
+    Discovered URLs are cached in-process for ``_JSON_URL_TTL`` seconds.
     """
 
-    def __init__(self, hall_id: str, hall_name: str) -> None:
+    def __init__(
+        self,
+        hall_id: str,
+        hall_name: str,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
         if hall_id not in POMONA_HALLS:
             raise ValueError(
                 f"Unknown Pomona hall: {hall_id!r}. "
                 f"Must be one of {list(POMONA_HALLS)}"
             )
-        super().__init__(hall_id, hall_name)
+        super().__init__(hall_id, hall_name, client)
         self._hall_config = POMONA_HALLS[hall_id]
 
+    @property
+    def vendor_host(self) -> str:
+        """Host of the discovered JSON feed, or of the menu page if none is cached.
+
+        That is the host the next fetch starts with and, after a fetch,
+        the last host it reached (a failed page fetch leaves no cached
+        feed URL).
+        """
+        cached = _json_url_cache.get(self._hall_config["slug"])
+        if cached is not None and cached[1] > time.monotonic():
+            return urlsplit(cached[0]).hostname
+        return urlsplit(_PAGE_URL_TEMPLATE).hostname
+
+    @property
+    def vendor_hosts(self) -> tuple[str, ...]:
+        """The menu page host, the known feed host and any discovered feed host."""
+        hosts = [
+            urlsplit(_PAGE_URL_TEMPLATE).hostname,
+            urlsplit(_FALLBACK_JSON_URL_TEMPLATE).hostname,
+            self.vendor_host,
+        ]
+        return tuple(dict.fromkeys(hosts))
+
     def discover_json_url(self, page_html: str) -> str:
         """Extract the JSON URL from the Pomona menu page HTML.
 
@@ -86,25 +126,44 @@ class PomonaParser(BaseParser):
         return fallback_url
 
     async def fetch_raw(self, target_date: date) -> str:
-        """Two-step fetch: page HTML -> JSON URL -> JSON data."""
+        """Two-step fetch: page HTML -> JSON URL -> JSON data.
+
+        Step 1 is skipped while a previously discovered JSON URL is
+        cached. If the cached URL returns 404, the URL is rediscovered
+        and the JSON fetch retried once.
+        """
         slug = self._hall_config["slug"]
-        page_url = _PAGE_URL_TEMPLATE.format(slug=slug)
 
-        async with httpx.AsyncClient(
-            headers={"User-Agent": "Mozilla/5.0 (compatible; 5CMenu/1.0)"},
-            follow_redirects=True,
-            timeout=30.0,
-        ) as client:
-            # Step 1: Fetch the menu page to discover JSON URL
-            page_response = await client.get(page_url)
-            page_response.raise_for_status()
+        cached = _json_url_cache.get(slug)
+        if cached is not None and cached[1] > time.monotonic():
+            try:
+                return await self._get(cached[0])
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code != 404:
+                    raise
+                logger.info(
+                    "Cached JSON URL for %s returned 404; rediscovering", self.hall_id
+                )
+                _json_url_cache.pop(slug, None)
 
-            json_url = self.discover_json_url(page_response.text)
+        # Step 1: Fetch the menu page to discover JSON URL
+        json_url = await self._discover_and_cache_json_url(slug)
 
-            # Step 2: Fetch the actual JSON data
-            json_response = await client.get(json_url)
-            json_response.raise_for_status()
-            return json_response.text
+        # Step 2: Fetch the actual JSON data
+        return await self._get(json_url)
+
+    async def _discover_and_cache_json_url(self, slug: str) -> str:
+        """Fetch the menu page, discover the JSON URL, and cache it."""
+        page_html = await self._get(_PAGE_URL_TEMPLATE.format(slug=slug))
+        json_url = self.discover_json_url(page_html)
+
+        previous = _json_url_cache.get(slug)
+        if previous is not None and previous[0] != json_url:
+            logger.info(
+                "JSON URL for %s changed: %s -> %s", self.hall_id, previous[0], json_url
+            )
+        _json_url_cache[slug] = (json_url, time.monotonic() + _JSON_URL_TTL)
+        return json_url
 
     def parse(self, raw_content: str, target_date: date) -> ParsedMenu:
         """Parse EatecExchange JSON into structured menu data.
@@ -113,22 +172,54 @@ class PomonaParser(BaseParser):
         Oldenborg comma+slash splitting, dietary tag extraction, and
         station filtering.
         """
-        data = json.loads(raw_content)
+        entries_by_date = self._index_by_serve_date(raw_content)
+        entries = entries_by_date.get(target_date.strftime("%Y%m%d"), [])
+        return self._build_menu(entries, target_date)
+
+    def parse_all(self, raw_content: str, target_date: date) -> list[ParsedMenu]:
+        """Decode the feed once and build a menu for every served date.
+
+        The EatecExchange feed covers several days, so a single fetch
+        fills the whole range. ``target_date`` is always included.
+        """
+        entries_by_date = self._index_by_serve_date(raw_content)
+        entries_by_date.setdefault(target_date.strftime("%Y%m%d"), [])
+
+        menus: list[ParsedMenu] = []
+        for serve_date, entries in entries_by_date.items():
+            try:
+                menu_date = datetime.strptime(serve_date, "%Y%m%d").date()
+            except ValueError:
+                logger.warning("Skipping Pomona entries with bad @servedate: %r", serve_date)
+                continue
+            menus.append(self._build_menu(entries, menu_date))
+        return menus
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _index_by_serve_date(raw_content: str) -> dict[str, list[dict]]:
+        """Decode the feed and group ``EatecExchange.menu`` entries by ``@servedate``."""
+        data = codec.loads(raw_content)
         menu_entries = data.get("EatecExchange", {}).get("menu", [])
 
         # Normalize to list (in case a single entry is returned as dict)
         if isinstance(menu_entries, dict):
             menu_entries = [menu_entries]
 
-        target_str = target_date.strftime("%Y%m%d")
+        entries_by_date: dict[str, list[dict]] = {}
+        for entry in menu_entries:
+            entries_by_date.setdefault(entry.get("@servedate", ""), []).append(entry)
+        return entries_by_date
+
+    def _build_menu(self, entries: list[dict], target_date: date) -> ParsedMenu:
+        """Build a ParsedMenu from the feed entries served on one date."""
         meals_by_period: dict[str, list[ParsedStation]] = {}
         meal_order: list[str] = []
 
-        for entry in menu_entries:
-            serve_date = entry.get("@servedate", "")
-            if serve_date != target_str:
-                continue
-
+        for entry in entries:
             meal_period = entry.get("@mealperiodname", "")
             bulletin = entry.get("@menubulletin", "")
 
@@ -214,10 +305,6 @@ class PomonaParser(BaseParser):
 
         return ParsedMenu(hall_id=self.hall_id, date=target_date, meals=meals)
 
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
-
     def _split_item_name(self, name: str) -> list[str]:
         """Split item names by comma (all halls) or comma+slash (Oldenborg).
 
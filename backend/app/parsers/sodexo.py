@@ -1,17 +1,20 @@
 """Sodexo dining hall parser (Hoch-Shanahan).
 
 Extracts menu data from JSON embedded in HTML (`#nutData` div).
-Sodexo returns a week of data; we filter to the requested date.
+Sodexo returns a week of data; ``parse`` filters to the requested date
+while ``parse_all`` fans the whole week out so one fetch fills every day.
 """
 
-import json
+import html as _html
 import logging
 import re
 from datetime import date
+from urllib.parse import urlsplit
 
 import httpx
 from selectolax.parser import HTMLParser
 
+from app import codec
 from app.models.menu import ParsedMeal, ParsedMenu, ParsedMenuItem, ParsedStation
 from app.parsers.base import BaseParser
 from app.parsers.station_filters import (
@@ -29,12 +32,36 @@ _URL_TEMPLATE = (
     "?menuId=15258&locationId=13147001&startdate={date}"
 )
 
+# Entities html.escape emits; "&amp;" must be replaced last
+_BASIC_ENTITIES: tuple[tuple[str, str], ...] = (
+    ("&quot;", '"'),
+    ("&#39;", "'"),
+    ("&#x27;", "'"),
+    ("&lt;", "<"),
+    ("&gt;", ">"),
+    ("&amp;", "&"),
+)
+
+# Validates the opening tag found around a "nutData" occurrence
+_RE_NUTDATA_OPEN_TAG = re.compile(
+    r"""<div\b[^>]*\bid\s*=\s*["']nutData["'][^>]*>\Z""", re.IGNORECASE
+)
+
 
 class SodexoParser(BaseParser):
     """Parser for Sodexo-powered dining halls (Hoch-Shanahan)."""
 
-    def __init__(self, hall_id: str = "hoch", hall_name: str = "Hoch-Shanahan") -> None:
-        super().__init__(hall_id, hall_name)
+    def __init__(
+        self,
+        hall_id: str = "hoch",
+        hall_name: str = "Hoch-Shanahan",
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        super().__init__(hall_id, hall_name, client)
+
+    @property
+    def vendor_host(self) -> str:
+        return urlsplit(_URL_TEMPLATE).hostname
 
     def build_url(self, target_date: date) -> str:
         """Build Sodexo menu URL for the given date."""
@@ -42,15 +69,7 @@ class SodexoParser(BaseParser):
 
     async def fetch_raw(self, target_date: date) -> str:
         """Fetch raw HTML from Sodexo menu page."""
-        url = self.build_url(target_date)
-        async with httpx.AsyncClient(
-            headers={"User-Agent": "Mozilla/5.0 (compatible; 5CMenu/1.0)"},
-            follow_redirects=True,
-            timeout=30.0,
-        ) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            return response.text
+        return await self._get(self.build_url(target_date))
 
     def parse(self, raw_content: str, target_date: date) -> ParsedMenu:
         """Parse Sodexo HTML containing embedded JSON menu data.
@@ -59,25 +78,39 @@ class SodexoParser(BaseParser):
         the requested date, and builds the ParsedMenu hierarchy with
         station filtering applied.
         """
-        json_text = self._extract_json(raw_content)
-        days = json.loads(json_text)
+        days = codec.loads(self._extract_json(raw_content))
 
         target_str = target_date.isoformat()  # "YYYY-MM-DD"
         meals: list[ParsedMeal] = []
-
         for day in days:
             # Sodexo dates look like "2026-02-07T00:00:00"
-            day_date_str = day.get("date", "")[:10]
-            if day_date_str != target_str:
-                continue
-
-            for day_part in day.get("dayParts", []):
-                meal = self._parse_day_part(day_part)
-                if meal is not None:
-                    meals.append(meal)
+            if day.get("date", "")[:10] == target_str:
+                meals.extend(self._parse_day(day))
 
         return ParsedMenu(hall_id=self.hall_id, date=target_date, meals=meals)
 
+    def parse_all(self, raw_content: str, target_date: date) -> list[ParsedMenu]:
+        """Parse every day of the weekly ``#nutData`` payload in one pass.
+
+        Always includes ``target_date`` (possibly with no meals) so the
+        caller can tell "no menu that day" apart from a parse failure.
+        """
+        days = codec.loads(self._extract_json(raw_content))
+
+        meals_by_date: dict[date, list[ParsedMeal]] = {target_date: []}
+        for day in days:
+            try:
+                day_date = date.fromisoformat(day.get("date", "")[:10])
+            except ValueError:
+                logger.warning("Skipping Sodexo day with bad date: %r", day.get("date"))
+                continue
+            meals_by_date.setdefault(day_date, []).extend(self._parse_day(day))
+
+        return [
+            ParsedMenu(hall_id=self.hall_id, date=day_date, meals=meals)
+            for day_date, meals in meals_by_date.items()
+        ]
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -86,9 +119,15 @@ class SodexoParser(BaseParser):
     def _extract_json(html: str) -> str:
         """Extract the JSON text from the #nutData div.
 
-        Primary: selectolax CSS selector. Fallback: regex extraction.
+        Fast path: string scan for the div, unescaping only its text.
+        Fallbacks: selectolax CSS selector, then regex extraction.
         """
-        # Primary: selectolax
+        # Fast path: targeted scan, no DOM build
+        text = SodexoParser._scan_nutdata(html)
+        if text:
+            return text
+
+        # Fallback: selectolax
         try:
             tree = HTMLParser(html)
             node = tree.css_first("#nutData")
@@ -115,6 +154,64 @@ class SodexoParser(BaseParser):
             "#nutData div not found or empty"
         )
 
+    @staticmethod
+    def _scan_nutdata(html: str) -> str | None:
+        """Locate ``<div id="nutData">`` by string scanning and unescape its text.
+
+        The div holds HTML-escaped JSON, so it cannot contain a raw ``<``
+        and its text ends at the first ``</div>``. Returns None when the
+        div is not found in that shape, letting the caller fall back to
+        a full DOM parse.
+        """
+        pos = html.find("nutData")
+        while pos != -1:
+            tag_start = html.rfind("<", 0, pos)
+            tag_end = html.find(">", pos)
+            if (
+                tag_start != -1
+                and tag_end != -1
+                and _RE_NUTDATA_OPEN_TAG.match(html, tag_start, tag_end + 1)
+            ):
+                close = html.find("</div>", tag_end + 1)
+                if close == -1:
+                    return None
+                raw_text = html[tag_end + 1 : close]
+                if "<" in raw_text:
+                    return None
+                return SodexoParser._unescape(raw_text).strip() or None
+            pos = html.find("nutData", pos + 1)
+        return None
+
+    @staticmethod
+    def _unescape(text: str) -> str:
+        """Unescape HTML entities, using C-level replaces for the common case.
+
+        ``html.unescape`` runs a Python callback per entity, which is slow
+        on JSON full of ``&quot;``. When every ``&`` belongs to one of the
+        basic escapes, chained ``str.replace`` gives the same result.
+        """
+        amp_count = text.count("&")
+        if amp_count == 0:
+            return text
+
+        counts = [(entity, text.count(entity)) for entity, _char in _BASIC_ENTITIES]
+        if sum(count for _entity, count in counts) != amp_count:
+            return _html.unescape(text)
+
+        for (entity, count), (_entity, char) in zip(counts, _BASIC_ENTITIES):
+            if count:
+                text = text.replace(entity, char)
+        return text
+
+    def _parse_day(self, day: dict) -> list[ParsedMeal]:
+        """Parse all dayParts of a single Sodexo day into ParsedMeals."""
+        meals: list[ParsedMeal] = []
+        for day_part in day.get("dayParts", []):
+            meal = self._parse_day_part(day_part)
+            if meal is not None:
+                meals.append(meal)
+        return meals
+
     def _parse_day_part(self, day_part: dict) -> ParsedMeal | None:
         """Parse a single dayPart (meal period) into a ParsedMeal."""
         meal_name = day_part.get("dayPartName", "").lower()
@@ -138,11 +235,7 @@ class SodexoParser(BaseParser):
 
             key = normalized.lower()
             if key in station_map:
-                existing = station_map[key]
-                station_map[key] = ParsedStation(
-                    name=existing.name,
-                    items=existing.items + items,
-                )
+                station_map[key].items.extend(items)
             else:
                 station_map[key] = ParsedStation(name=normalized, items=items)
                 station_order.append(key)
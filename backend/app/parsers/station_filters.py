@@ -32,6 +32,10 @@ class StationFilterConfig:
 # ---------------------------------------------------------------------------
 
 
+# Sort rank for stations not in the ordered list
+_UNLISTED_RANK = 999
+
+
 def _build_alias_map(combined: dict[str, list[str]]) -> dict[str, str]:
     """Build a reverse map: lowercase alias -> canonical display name."""
     alias_map: dict[str, str] = {}
@@ -41,6 +45,100 @@ def _build_alias_map(combined: dict[str, list[str]]) -> dict[str, str]:
     return alias_map
 
 
+@dataclass(frozen=True)
+class CompiledStationFilter:
+    """A StationFilterConfig precompiled into lookup tables.
+
+    All tables are keyed by lowercase station name:
+
+    - ``aliases`` -- alias -> (canonical key, canonical display name)
+    - ``dropped`` -- stations removed by ``hidden`` or ``truncated=-1``
+    - ``limits`` -- positive truncation limits
+    - ``ranks`` -- sort position in ``ordered`` (last occurrence wins)
+    """
+
+    aliases: dict[str, tuple[str, str]]
+    dropped: frozenset[str]
+    limits: dict[str, int]
+    ranks: dict[str, int]
+
+    @classmethod
+    def from_config(cls, config: StationFilterConfig) -> "CompiledStationFilter":
+        """Precompute the lookup tables for ``config``."""
+        return cls(
+            aliases={
+                alias: (canonical.lower(), canonical)
+                for alias, canonical in _build_alias_map(config.combined).items()
+            },
+            # ``hidden`` entries are matched as written (the configs are
+            # already lowercase); only truncation keys are lowercased.
+            dropped=frozenset(config.hidden)
+            | {k.lower() for k, v in config.truncated.items() if v == -1},
+            limits={k: v for k, v in config.truncated.items() if v > 0},
+            ranks={name.lower(): idx for idx, name in enumerate(config.ordered)},
+        )
+
+    def apply(self, stations: list[ParsedStation]) -> list[ParsedStation]:
+        """Merge, hide, truncate, sort and drop empty stations in one pass."""
+        aliases = self.aliases
+        dropped = self.dropped
+        names: dict[str, str] = {}
+        items: dict[str, list[ParsedMenuItem]] = {}
+
+        for station in stations:
+            key = station.name.lower()
+            alias = aliases.get(key)
+            if alias is None:
+                name = station.name
+            else:
+                key, name = alias
+            if key in dropped:
+                continue
+            bucket = items.get(key)
+            if bucket is None:
+                names[key] = name
+                items[key] = list(station.items)
+            else:
+                bucket.extend(station.items)
+
+        limits = self.limits
+        ranks = self.ranks
+        ranked: list[tuple[int, ParsedStation]] = []
+        for key, station_items in items.items():
+            limit = limits.get(key)
+            if limit is not None:
+                del station_items[limit:]
+            if station_items:
+                ranked.append(
+                    (
+                        ranks.get(key, _UNLISTED_RANK),
+                        ParsedStation(name=names[key], items=station_items),
+                    )
+                )
+
+        # sort is stable, so unlisted and equal-rank stations keep their order
+        ranked.sort(key=lambda entry: entry[0])
+        return [station for _, station in ranked]
+
+
+# id(config) -> (config, compiled); holding the config keeps its id unique
+_compiled_filters: dict[int, tuple[StationFilterConfig, CompiledStationFilter]] = {}
+
+
+def compile_station_filter(config: StationFilterConfig) -> CompiledStationFilter:
+    """Return the compiled form of ``config``, compiling it on first use.
+
+    Configs are treated as immutable once compiled; build a new
+    StationFilterConfig rather than mutating one in place.
+    """
+    cached = _compiled_filters.get(id(config))
+    if cached is not None and cached[0] is config:
+        return cached[1]
+    compiled = CompiledStationFilter.from_config(config)
+    _compiled_filters[id(config)] = (config, compiled)
+    return compiled
+
+
 def apply_station_filters(
     stations: list[ParsedStation],
     config: StationFilterConfig,
@@ -53,70 +151,10 @@ def apply_station_filters(
     3. Truncate -- limit item count for truncated stations
     4. Sort -- order by priority list
     5. Remove empty -- drop stations with zero items
-    """
-
-    # 1. MERGE: combine aliased stations
-    alias_map = _build_alias_map(config.combined)
-    merged: dict[str, ParsedStation] = {}
-    merge_order: list[str] = []
-
-    for station in stations:
-        lower_name = station.name.lower()
-        canonical = alias_map.get(lower_name, station.name)
-        canonical_key = canonical.lower()
-
-        if canonical_key in merged:
-            # Append items to existing canonical station
-            existing = merged[canonical_key]
-            merged[canonical_key] = ParsedStation(
-                name=existing.name,
-                items=existing.items + station.items,
-            )
-        else:
-            merged[canonical_key] = ParsedStation(
-                name=canonical,
-                items=list(station.items),
-            )
-            merge_order.append(canonical_key)
-
-    merged_stations = [merged[k] for k in merge_order]
-
-    # 2. HIDE: remove hidden stations and those with truncated=-1
-    hidden_set = set(config.hidden)
-    truncate_hidden = {k.lower() for k, v in config.truncated.items() if v == -1}
-    visible = [
-        s
-        for s in merged_stations
-        if s.name.lower() not in hidden_set and s.name.lower() not in truncate_hidden
-    ]
-
-    # 3. TRUNCATE: limit item counts for stations with positive truncation
-    truncated: list[ParsedStation] = []
-    for station in visible:
-        lower_name = station.name.lower()
-        limit = config.truncated.get(lower_name)
-        if limit is not None and limit > 0:
-            truncated.append(
-                ParsedStation(name=station.name, items=station.items[:limit])
-            )
-        else:
-            truncated.append(station)
 
-    # 4. SORT: by position in ordered list; unlisted stations sort to end
-    order_map = {name.lower(): idx for idx, name in enumerate(config.ordered)}
-
-    def sort_key(station: ParsedStation) -> tuple[int, int]:
-        idx = order_map.get(station.name.lower(), 999)
-        # Preserve relative order of stations not in the list
-        original_idx = next(
-            (i for i, s in enumerate(truncated) if s is station), 999
-        )
-        return (idx, original_idx)
-
-    sorted_stations = sorted(truncated, key=sort_key)
-
-    # 5. REMOVE EMPTY: drop stations with 0 items
-    return [s for s in sorted_stations if s.items]
+    Runs on the precompiled form of ``config`` (see CompiledStationFilter).
+    """
+    return compile_station_filter(config).apply(stations)
 
 
 # ---------------------------------------------------------------------------
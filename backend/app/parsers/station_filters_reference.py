@@ -0,0 +1,55 @@
+"""Reference station filter pipeline, as it was before compilation.
+
+``legacy_apply`` rebuilds the alias and order maps on every call and
+sorts with an O(n^2) key. It is kept only so the compiled engine in
+``app.parsers.station_filters`` can be checked against it (tests) and
+timed against it (``benchmarks.station_filters``).
+"""
+
+from app.models.menu import ParsedStation
+from app.parsers.station_filters import StationFilterConfig, _build_alias_map
+
+
+def legacy_apply(stations: list[ParsedStation], config: StationFilterConfig) -> list[ParsedStation]:
+    """The pipeline as it was before compilation."""
+    alias_map = _build_alias_map(config.combined)
+    merged: dict[str, ParsedStation] = {}
+    merge_order: list[str] = []
+    for station in stations:
+        lower_name = station.name.lower()
+        canonical = alias_map.get(lower_name, station.name)
+        canonical_key = canonical.lower()
+        if canonical_key in merged:
+            existing = merged[canonical_key]
+            merged[canonical_key] = ParsedStation(
+                name=existing.name, items=existing.items + station.items
+            )
+        else:
+            merged[canonical_key] = ParsedStation(name=canonical, items=list(station.items))
+            merge_order.append(canonical_key)
+    merged_stations = [merged[k] for k in merge_order]
+
+    hidden_set = set(config.hidden)
+    truncate_hidden = {k.lower() for k, v in config.truncated.items() if v == -1}
+    visible = [
+        s
+        for s in merged_stations
+        if s.name.lower() not in hidden_set and s.name.lower() not in truncate_hidden
+    ]
+
+    truncated: list[ParsedStation] = []
+    for station in visible:
+        limit = config.truncated.get(station.name.lower())
+        if limit is not None and limit > 0:
+            truncated.append(ParsedStation(name=station.name, items=station.items[:limit]))
+        else:
+            truncated.append(station)
+
+    order_map = {name.lower(): idx for idx, name in enumerate(config.ordered)}
+
+    def sort_key(station: ParsedStation) -> tuple[int, int]:
+        idx = order_map.get(station.name.lower(), 999)
+        original_idx = next((i for i, s in enumerate(truncated) if s is station), 999)
+        return (idx, original_idx)
+
+    return [s for s in sorted(truncated, key=sort_key) if s.items]
@@ -3,15 +3,17 @@ import logging
 
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import JSONResponse
+from redis.asyncio import Redis
 from sqlalchemy import case, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select as sa_select
 from sqlmodel import select
 
 from app.config import get_settings
-from app.dependencies import get_session
+from app.dependencies import get_redis, get_session
 from app.models.dining_hours import DiningHours, DiningHoursOverride
 from app.models.parser_run import ParserRun
+from app.parsers.base import STAGES
 from app.schemas.admin import (
     HoursCreate,
     HoursResponse,
@@ -21,7 +23,11 @@ from app.schemas.admin import (
     OverrideCreate,
     OverrideResponse,
     OverrideUpdate,
+    BreakerStatus,
+    CacheStatsResponse,
     ParserHealthResponse,
+    StageLatency,
+    UpstreamHostStatus,
 )
 from app.services.auth_service import (
     create_magic_link_token,
@@ -30,6 +36,10 @@ from app.services.auth_service import (
     send_magic_link_email,
     verify_magic_link_token,
 )
+from app.services.cache import l1_stats
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.host_limiter import host_limiter_stats
+from app.services.menu_service import get_parser
 
 logger = logging.getLogger(__name__)
 
@@ -272,10 +282,70 @@ async def delete_override(
 # ---------------------------------------------------------------------------
 
 
+def _percentile(sorted_values: list[int], pct: float) -> int:
+    """Nearest-rank percentile of an ascending, non-empty list."""
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+async def _stage_latency(
+    session: AsyncSession, cutoff: _dt.datetime
+) -> dict[str, dict[str, StageLatency]]:
+    """Per-hall p50/p95 of each recorded stage duration since ``cutoff``."""
+    columns = [getattr(ParserRun, f"{stage}_ms") for stage in STAGES]
+    result = await session.execute(
+        sa_select(ParserRun.hall_id, ParserRun.duration_ms, *columns).where(
+            ParserRun.started_at >= cutoff
+        )
+    )
+
+    samples: dict[str, dict[str, list[int]]] = {}
+    for hall_id, *durations in result.all():
+        by_stage = samples.setdefault(hall_id, {})
+        for stage, value in zip(("total", *STAGES), durations):
+            if value is not None:
+                by_stage.setdefault(stage, []).append(value)
+
+    latency: dict[str, dict[str, StageLatency]] = {}
+    for hall_id, by_stage in samples.items():
+        latency[hall_id] = {}
+        for stage, values in by_stage.items():
+            values.sort()
+            latency[hall_id][stage] = StageLatency(
+                p50_ms=_percentile(values, 50), p95_ms=_percentile(values, 95)
+            )
+    return latency
+
+
+async def _breaker_statuses(redis_client: Redis, hall_id: str) -> list[BreakerStatus]:
+    """Circuit breaker state for every vendor host ``hall_id`` may fetch from."""
+    try:
+        hosts = get_parser(hall_id).vendor_hosts
+        breaker = CircuitBreaker.from_settings(redis_client, get_settings())
+        states = [await breaker.state(host) for host in hosts]
+    except Exception:
+        logger.warning("Failed to read circuit breaker for %s", hall_id, exc_info=True)
+        return []
+    return [
+        BreakerStatus(
+            host=state.host,
+            state=state.state,
+            failures=state.failures,
+            opened_at=_dt.datetime.fromtimestamp(
+                state.opened_at, _dt.timezone.utc
+            ).isoformat()
+            if state.opened_at is not None
+            else None,
+        )
+        for state in states
+    ]
+
+
 @router.get("/health", response_model=list[ParserHealthResponse])
 async def parser_health(
     admin_email: str = Depends(require_admin),
     session: AsyncSession = Depends(get_session),
+    redis_client: Redis = Depends(get_redis),
 ):
     """Return per-hall parser health summary for the last 24 hours."""
     try:
@@ -299,6 +369,7 @@ async def parser_health(
         )
         result = await session.execute(stmt)
         rows = result.all()
+        latency = await _stage_latency(session, cutoff)
     except Exception:
         logger.exception("Failed to query parser health")
         return []
@@ -312,6 +383,42 @@ async def parser_health(
             error_rate=round(int(row.error_count) / row.total_runs * 100, 1)
             if row.total_runs > 0
             else 0.0,
+            stage_latency=latency.get(row.hall_id, {}),
+            breakers=await _breaker_statuses(redis_client, row.hall_id),
         )
         for row in rows
     ]
+
+
+@router.get("/upstream", response_model=list[UpstreamHostStatus])
+async def upstream_hosts(admin_email: str = Depends(require_admin)):
+    """Return per-host fetch concurrency and queue depth for this worker."""
+    return [
+        UpstreamHostStatus(
+            host=stats.host,
+            in_flight=stats.in_flight,
+            queued=stats.queued,
+            max_queued=stats.max_queued,
+            total_requests=stats.total_requests,
+            avg_wait_ms=round(stats.total_wait_ms / stats.total_requests, 1)
+            if stats.total_requests > 0
+            else 0.0,
+        )
+        for stats in host_limiter_stats()
+    ]
+
+
+@router.get("/cache", response_model=CacheStatsResponse)
+async def cache_stats(admin_email: str = Depends(require_admin)):
+    """Return this worker's in-process menu cache counters."""
+    stats = l1_stats()
+    lookups = stats.hits + stats.misses
+    return CacheStatsResponse(
+        hits=stats.hits,
+        misses=stats.misses,
+        hit_rate=round(stats.hits / lookups * 100, 1) if lookups > 0 else 0.0,
+        evictions=stats.evictions,
+        expirations=stats.expirations,
+        entries=stats.entries,
+        bytes=stats.bytes,
+    )
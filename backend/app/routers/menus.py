@@ -6,11 +6,12 @@ and returns structured MenuResponse data.
 
 import datetime as _dt
 
+import httpx
 from fastapi import APIRouter, Depends, HTTPException
 from redis.asyncio import Redis
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.dependencies import get_redis, get_session
+from app.dependencies import get_http_client, get_redis, get_session, get_session_factory
 from app.schemas.menus import MenuResponse
 from app.services.menu_service import HALL_CONFIG, get_menu
 
@@ -24,6 +25,8 @@ async def read_menu(
     meal: str,
     session: AsyncSession = Depends(get_session),
     redis_client: Redis = Depends(get_redis),
+    http_client: httpx.AsyncClient | None = Depends(get_http_client),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
 ):
     """Fetch menu data for a specific dining hall, date, and meal.
 
@@ -55,7 +58,9 @@ async def read_menu(
             detail="Invalid date format, use YYYY-MM-DD",
         )
 
-    result = await get_menu(hall_id, date, meal, session, redis_client)
+    result = await get_menu(
+        hall_id, date, meal, session, redis_client, http_client, session_factory
+    )
 
     if result is None:
         raise HTTPException(
@@ -74,6 +74,22 @@ class OverrideUpdate(BaseModel):
     reason: str | None = None
 
 
+class StageLatency(BaseModel):
+    """p50/p95 duration of one parser pipeline stage."""
+
+    p50_ms: int
+    p95_ms: int
+
+
+class BreakerStatus(BaseModel):
+    """Circuit breaker state for one of a hall's vendor hosts."""
+
+    host: str
+    state: str  # "closed", "open", "half_open"
+    failures: int
+    opened_at: str | None
+
+
 class ParserHealthResponse(BaseModel):
     """Response schema for parser health status."""
 
@@ -82,3 +98,31 @@ class ParserHealthResponse(BaseModel):
     total_runs_24h: int
     error_count_24h: int
     error_rate: float
+    # stage name ("fetch", ..., "total") -> latency over the last 24 hours;
+    # stages with no recorded timings are omitted
+    stage_latency: dict[str, StageLatency] = {}
+    # one entry per vendor host the hall's parser may fetch from
+    breakers: list[BreakerStatus] = []
+
+
+class UpstreamHostStatus(BaseModel):
+    """Politeness limiter state for one vendor host (this worker only)."""
+
+    host: str
+    in_flight: int
+    queued: int
+    max_queued: int
+    total_requests: int
+    avg_wait_ms: float
+
+
+class CacheStatsResponse(BaseModel):
+    """In-process L1 menu cache counters (this worker only)."""
+
+    hits: int
+    misses: int
+    hit_rate: float  # percent
+    evictions: int
+    expirations: int
+    entries: int
+    bytes: int
@@ -24,3 +24,4 @@ class MenuResponse(BaseModel):
     stations: list[StationResponse]
     is_stale: bool = False
     fetched_at: str | None = None
+    content_hash: str | None = None
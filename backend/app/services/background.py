@@ -0,0 +1,28 @@
+"""Fire-and-forget background work that should finish before shutdown.
+
+Hedged live fetches (``app.parsers.fallback``) and stale-while-revalidate
+refreshes (``app.services.menu_service``) outlive the request that
+started them. They are tracked here so the app lifespan can wait for
+them on shutdown instead of cutting off a half-finished persist.
+"""
+
+import asyncio
+from collections.abc import Coroutine
+
+# Strong references to running tasks (the event loop only keeps weak
+# ones); entries remove themselves when done
+_background_tasks: set[asyncio.Task] = set()
+
+
+def spawn_background(coro: Coroutine) -> asyncio.Task:
+    """Run ``coro`` as a tracked background task."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+async def drain_background_tasks(timeout: float | None = None) -> None:
+    """Wait for in-flight background tasks (called on shutdown)."""
+    if _background_tasks:
+        await asyncio.wait(set(_background_tasks), timeout=timeout)
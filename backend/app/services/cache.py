@@ -3,38 +3,248 @@
 Provides get/set operations with jittered TTL to prevent synchronized
 cache expiration (thundering herd). Base TTL is 30 minutes with +/- 5
 minutes of random jitter, yielding an effective range of 25-35 minutes.
+
+That jittered TTL is a *soft* expiry: entries are stored as an envelope
+``{"data": ..., "soft_expires_at": <epoch seconds>}`` and kept in Redis
+for a further ``STALE_TTL``. A caller finding an entry past its soft
+expiry can still serve it while one refresh runs in the background
+(stale-while-revalidate, see ``menu_service.get_menu``).
+
+Entries may also record ``compute_time``, the seconds it took to produce
+the value. ``CacheEntry.should_refresh`` then applies XFetch-style
+probabilistic early expiration: each read near the soft expiry has a
+chance of triggering a refresh, higher for costlier values. Hot keys are
+read often enough that one read refreshes them before they expire. Cold
+keys are seldom read, so they are seldom refreshed.
+
+Lookups that found no menu are cached too, for ``NEGATIVE_TTL``, as an
+envelope with ``"data": null`` (``CacheEntry.is_negative``), so repeated
+requests for a meal a hall does not serve skip the scrape.
+
+In front of Redis sits a small in-process L1: decoded entries kept for
+``L1_TTL`` seconds in an LRU capped at ``L1_MAX_ENTRIES`` entries and
+``L1_MAX_BYTES`` of encoded payload. Writes through this module replace
+the local copy immediately; writes from other workers become visible
+once the local copy expires, so ``L1_TTL`` is kept short. Entries are
+shared between callers and must not be mutated.
 """
 
-import json
+import math
 import random
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 
 from redis.asyncio import Redis
 
+from app import codec
+
 BASE_TTL: int = 1800  # 30 minutes in seconds
 JITTER_RANGE: int = 300  # +/- 5 minutes in seconds
+STALE_TTL: int = 1800  # how long an entry outlives its soft expiry
+NEGATIVE_TTL: int = 300  # 5 minutes for "no menu" entries
+FALLBACK_TTL: int = 60  # soft TTL for stored data served after a failed fetch
 
+L1_TTL: float = 10.0  # seconds a decoded entry is served without Redis
+L1_MAX_ENTRIES: int = 512
+L1_MAX_BYTES: int = 16 * 1024 * 1024  # encoded size of all L1 entries
 
-def menu_cache_key(hall_id: str, date_str: str, meal: str) -> str:
-    """Build a Redis cache key for a specific menu query."""
-    return f"menu:{hall_id}:{date_str}:{meal}"
 
+@dataclass
+class CacheEntry:
+    """A cached value and the time it stops being fresh."""
+
+    data: dict | None  # None for a negative ("no menu") entry
+    soft_expires_at: float  # epoch seconds
+    compute_time: float = 0.0  # seconds taken to produce ``data``
+
+    @property
+    def is_negative(self) -> bool:
+        """True if this entry records that there is no menu."""
+        return self.data is None
+
+    @property
+    def is_stale(self) -> bool:
+        """True once the soft expiry has passed (the entry is still usable)."""
+        return time.time() >= self.soft_expires_at
+
+    def should_refresh(self, beta: float = 1.0) -> bool:
+        """Whether this read should refresh the entry (XFetch).
+
+        Always True once stale. Before that, True with a probability
+        that rises as the soft expiry nears, scaled by ``compute_time``
+        and ``beta``. A ``beta`` of 0 disables early refresh.
+        """
+        now = time.time()
+        if now >= self.soft_expires_at:
+            return True
+        if beta <= 0 or self.compute_time <= 0:
+            return False
+        # 1 - random() is in (0, 1], so the log is defined
+        early = -self.compute_time * beta * math.log(1.0 - random.random())
+        return now + early >= self.soft_expires_at
+
+
+# ---------------------------------------------------------------------------
+# In-process L1
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _L1Item:
+    entry: CacheEntry
+    size: int  # encoded payload length
+    expires_at: float  # time.monotonic()
+
+
+@dataclass
+class L1Stats:
+    """Counters for the in-process L1 since startup (or the last reset)."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0  # dropped to stay within the size caps
+    expirations: int = 0  # dropped because L1_TTL passed
+    entries: int = 0
+    bytes: int = 0
+
+
+_l1: OrderedDict[str, _L1Item] = OrderedDict()
+_l1_stats = L1Stats()
+
+
+def _l1_get(key: str) -> CacheEntry | None:
+    item = _l1.get(key)
+    if item is None:
+        _l1_stats.misses += 1
+        return None
+    if time.monotonic() >= item.expires_at:
+        _l1_drop(key)
+        _l1_stats.expirations += 1
+        _l1_stats.misses += 1
+        return None
+    _l1.move_to_end(key)
+    _l1_stats.hits += 1
+    return item.entry
+
+
+def _l1_put(key: str, entry: CacheEntry, size: int) -> None:
+    _l1_drop(key)
+    if size > L1_MAX_BYTES:
+        return
+    _l1[key] = _L1Item(entry, size, time.monotonic() + L1_TTL)
+    _l1_stats.entries += 1
+    _l1_stats.bytes += size
+    while _l1_stats.entries > L1_MAX_ENTRIES or _l1_stats.bytes > L1_MAX_BYTES:
+        _l1_drop(next(iter(_l1)))
+        _l1_stats.evictions += 1
 
-async def cache_get(redis_client: Redis, key: str) -> dict | None:
-    """Retrieve a cached menu dict from Redis.
 
-    Returns the deserialized dict if the key exists, otherwise None.
+def _l1_drop(key: str) -> None:
+    item = _l1.pop(key, None)
+    if item is not None:
+        _l1_stats.entries -= 1
+        _l1_stats.bytes -= item.size
+
+
+def l1_stats() -> L1Stats:
+    """A snapshot of the L1 counters."""
+    return L1Stats(**vars(_l1_stats))
+
+
+def reset_l1_cache() -> None:
+    """Empty the L1 and zero its counters."""
+    global _l1_stats
+
+    _l1.clear()
+    _l1_stats = L1Stats()
+
+
+# ---------------------------------------------------------------------------
+# Redis
+# ---------------------------------------------------------------------------
+
+
+def _decode_entry(raw: str) -> CacheEntry:
+    payload = codec.loads(raw)
+    if isinstance(payload, dict) and "soft_expires_at" in payload:
+        return CacheEntry(
+            data=payload["data"],
+            soft_expires_at=payload["soft_expires_at"],
+            compute_time=payload.get("compute_time", 0.0),
+        )
+    return CacheEntry(data=payload, soft_expires_at=float("inf"))
+
+
+def day_cache_key(hall_id: str, date_str: str) -> str:
+    """Build the Redis cache key for a hall's whole-day menu document."""
+    return f"menu:{hall_id}:{date_str}"
+
+
+async def cache_get_entry(redis_client: Redis, key: str) -> CacheEntry | None:
+    """Retrieve a cached entry, fresh or stale, from the L1 or Redis.
+
+    Returns None if the key does not exist. Values written before the
+    envelope format are treated as fresh until Redis expires them.
     """
+    entry = _l1_get(key)
+    if entry is not None:
+        return entry
     raw = await redis_client.get(key)
     if raw is None:
         return None
-    return json.loads(raw)
+    entry = _decode_entry(raw)
+    _l1_put(key, entry, len(raw))
+    return entry
+
+
+async def cache_get(redis_client: Redis, key: str) -> dict | None:
+    """Retrieve a cached menu dict from Redis.
+
+    Returns the deserialized dict if the key exists (even past its soft
+    expiry), otherwise None. A negative entry also reads as None.
+    """
+    entry = await cache_get_entry(redis_client, key)
+    return entry.data if entry is not None else None
 
 
-async def cache_set(redis_client: Redis, key: str, data: dict) -> None:
-    """Store a menu dict in Redis with a jittered TTL.
+async def cache_set(
+    redis_client: Redis,
+    key: str,
+    data: dict,
+    compute_time: float | None = None,
+    soft_ttl: int | None = None,
+) -> None:
+    """Store a menu dict in Redis with a jittered soft expiry.
 
-    TTL is randomized within [BASE_TTL - JITTER_RANGE, BASE_TTL + JITTER_RANGE]
-    (i.e., 25-35 minutes) to prevent synchronized expiration across keys.
+    The soft expiry is randomized within [BASE_TTL - JITTER_RANGE,
+    BASE_TTL + JITTER_RANGE] (i.e., 25-35 minutes) to prevent synchronized
+    expiration across keys, unless ``soft_ttl`` (seconds) is given; Redis
+    keeps the entry ``STALE_TTL`` longer. ``compute_time`` (seconds)
+    enables early refresh for the entry.
     """
-    ttl = BASE_TTL + random.randint(-JITTER_RANGE, JITTER_RANGE)
-    await redis_client.setex(key, ttl, json.dumps(data))
+    if soft_ttl is not None:
+        ttl = soft_ttl
+    else:
+        ttl = BASE_TTL + random.randint(-JITTER_RANGE, JITTER_RANGE)
+    envelope = {"data": data, "soft_expires_at": time.time() + ttl}
+    if compute_time:
+        envelope["compute_time"] = round(compute_time, 3)
+    await _store(redis_client, key, envelope, ttl + STALE_TTL)
+
+
+async def cache_set_negative(redis_client: Redis, key: str) -> None:
+    """Record for ``NEGATIVE_TTL`` seconds that ``key`` has no menu.
+
+    Negative entries are never served stale: they simply expire.
+    """
+    envelope = {"data": None, "soft_expires_at": time.time() + NEGATIVE_TTL}
+    await _store(redis_client, key, envelope, NEGATIVE_TTL)
+
+
+async def _store(redis_client: Redis, key: str, envelope: dict, ttl: int) -> None:
+    """Write an envelope to Redis, then replace the local L1 copy."""
+    raw = codec.dumps(envelope)
+    _l1_drop(key)
+    await redis_client.setex(key, ttl, raw)
+    _l1_put(key, _decode_entry(raw), len(raw))
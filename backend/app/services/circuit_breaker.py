@@ -0,0 +1,137 @@
+"""Per-vendor circuit breaker shared across workers through Redis.
+
+When a vendor host is down, every cache miss would otherwise spend up to
+the full HTTP timeout on a doomed fetch before falling back to the
+database. The breaker tracks consecutive failures per host:
+
+* closed -- fetches go through; failures are counted
+* open -- after ``failure_threshold`` consecutive failures, fetches are
+  skipped and callers go straight to the DB fallback
+* half-open -- once ``reset_timeout`` has passed since the breaker
+  opened, a single probe fetch is let through (one per
+  ``probe_timeout``, across all workers). Success closes the breaker;
+  failure re-opens it for another ``reset_timeout``.
+
+State lives in the Redis hash ``breaker:{host}`` (``failures``,
+``opened_at``) plus a ``breaker:{host}:probe`` lock, so all workers
+share one view. The hash expires ``STATE_TTL_FACTOR`` reset timeouts
+after its last write, so hosts that stop being fetched do not leave
+state behind. Redis errors fail open: the fetch is allowed.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+
+from redis.asyncio import Redis
+
+from app.config import Settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# breaker state outlives its last update by this many reset timeouts
+STATE_TTL_FACTOR = 4
+
+
+def breaker_key(host: str) -> str:
+    """Build the Redis key holding a host's breaker state."""
+    return f"breaker:{host}"
+
+
+@dataclass
+class BreakerState:
+    """Snapshot of one host's breaker."""
+
+    host: str
+    state: str
+    failures: int
+    opened_at: float | None  # epoch seconds
+
+
+class CircuitBreaker:
+    """Redis-backed circuit breaker keyed by vendor host."""
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        failure_threshold: int = 5,
+        reset_timeout: float = 60.0,
+        probe_timeout: float = 30.0,
+    ) -> None:
+        self.redis = redis_client
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.probe_timeout = probe_timeout
+
+    @classmethod
+    def from_settings(cls, redis_client: Redis, settings: Settings) -> "CircuitBreaker":
+        """Build a breaker using the ``FIVEC_BREAKER_*`` settings."""
+        return cls(
+            redis_client,
+            failure_threshold=settings.breaker_failure_threshold,
+            reset_timeout=settings.breaker_reset_timeout,
+            probe_timeout=settings.breaker_probe_timeout,
+        )
+
+    async def state(self, host: str) -> BreakerState:
+        """Return the current state of ``host``'s breaker."""
+        data = await self.redis.hgetall(breaker_key(host))
+        failures = int(data.get("failures", 0))
+        opened_at = float(data["opened_at"]) if "opened_at" in data else None
+
+        if failures < self.failure_threshold or opened_at is None:
+            state = CLOSED
+        elif time.time() - opened_at < self.reset_timeout:
+            state = OPEN
+        else:
+            state = HALF_OPEN
+        return BreakerState(host=host, state=state, failures=failures, opened_at=opened_at)
+
+    async def allow(self, host: str) -> bool:
+        """Return True if a live fetch from ``host`` should be attempted.
+
+        In the half-open state only the caller that wins the probe lock
+        is allowed; everyone else keeps using the fallback.
+        """
+        try:
+            current = await self.state(host)
+            if current.state == CLOSED:
+                return True
+            if current.state == OPEN:
+                return False
+            claimed = await self.redis.set(
+                f"{breaker_key(host)}:probe", "1", nx=True, px=int(self.probe_timeout * 1000)
+            )
+            return bool(claimed)
+        except Exception:
+            logger.warning("Circuit breaker check failed for %s", host, exc_info=True)
+            return True
+
+    async def record_success(self, host: str) -> None:
+        """Close the breaker for ``host``."""
+        try:
+            await self.redis.delete(breaker_key(host), f"{breaker_key(host)}:probe")
+        except Exception:
+            logger.warning("Circuit breaker update failed for %s", host, exc_info=True)
+
+    async def record_failure(self, host: str) -> None:
+        """Count a failure; (re-)open the breaker once at the threshold."""
+        key = breaker_key(host)
+        try:
+            failures = await self.redis.hincrby(key, "failures", 1)
+            if failures >= self.failure_threshold:
+                if failures == self.failure_threshold:
+                    logger.warning(
+                        "Circuit breaker opened for %s after %d failures", host, failures
+                    )
+                await self.redis.hset(key, "opened_at", time.time())
+                await self.redis.delete(f"{key}:probe")
+            await self.redis.expire(
+                key, max(1, int(self.reset_timeout * STATE_TTL_FACTOR))
+            )
+        except Exception:
+            logger.warning("Circuit breaker update failed for %s", host, exc_info=True)
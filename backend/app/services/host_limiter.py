@@ -0,0 +1,162 @@
+"""Per-host politeness limits for upstream vendor fetches.
+
+Request coalescing collapses identical cache misses, but many *distinct*
+keys can still miss at once (midnight rollover, a crawler paging through
+dates) and fan out into dozens of concurrent requests against the same
+vendor host. Each host gets a ``HostLimiter`` combining:
+
+* a semaphore capping concurrent fetches to ``max_concurrency``
+* a token bucket capping fetch starts to ``requests_per_second``, with
+  up to ``burst`` back-to-back starts after an idle period
+
+Waiters are served in arrival order. Limits are per worker process: with
+N workers a host sees at most N times these numbers. Queue depth and
+wait times are kept per host for the admin ``/upstream`` endpoint.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+_max_concurrency: int = 4
+_requests_per_second: float = 2.0
+_burst: int = 4
+
+
+@dataclass
+class HostLimiterStats:
+    """Snapshot of one host's limiter."""
+
+    host: str
+    in_flight: int
+    queued: int
+    max_queued: int  # high-water mark of ``queued`` since startup
+    total_requests: int
+    total_wait_ms: int  # time spent queued, summed over all requests
+
+
+class HostLimiter:
+    """Concurrency cap plus token-bucket rate limit for one upstream host."""
+
+    def __init__(
+        self,
+        host: str,
+        max_concurrency: int = 4,
+        requests_per_second: float = 2.0,
+        burst: int = 4,
+    ) -> None:
+        self.host = host
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # Serializes token claims so waiters start in arrival order
+        self._bucket_lock = asyncio.Lock()
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+
+        self.in_flight = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.total_requests = 0
+        self.total_wait_ms = 0
+
+    async def _take_token(self) -> None:
+        async with self._bucket_lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst,
+                    self._tokens + (now - self._refilled_at) * self.requests_per_second,
+                )
+                self._refilled_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.requests_per_second)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Wait for a concurrency slot and a rate token, then hold the slot."""
+        start = time.monotonic()
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        try:
+            await self._semaphore.acquire()
+            try:
+                # Take the token after the slot, so tokens are not spent
+                # by requests that would then sit behind the semaphore
+                await self._take_token()
+            except BaseException:
+                self._semaphore.release()
+                raise
+        finally:
+            self.queued -= 1
+
+        wait_ms = int((time.monotonic() - start) * 1000)
+        if wait_ms >= 1000:
+            logger.info("Waited %d ms for an upstream slot on %s", wait_ms, self.host)
+        self.total_wait_ms += wait_ms
+        self.total_requests += 1
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    def stats(self) -> HostLimiterStats:
+        return HostLimiterStats(
+            host=self.host,
+            in_flight=self.in_flight,
+            queued=self.queued,
+            max_queued=self.max_queued,
+            total_requests=self.total_requests,
+            total_wait_ms=self.total_wait_ms,
+        )
+
+
+_limiters: dict[str, HostLimiter] = {}
+
+
+def configure_host_limits(
+    max_concurrency: int, requests_per_second: float, burst: int
+) -> None:
+    """Set the limits used for every host (called once from the app lifespan).
+
+    Limiters already created keep their old limits, so this resets them.
+    """
+    global _max_concurrency, _requests_per_second, _burst
+
+    if max_concurrency < 1 or requests_per_second <= 0 or burst < 1:
+        raise ValueError(
+            "Host limits need max_concurrency >= 1, requests_per_second > 0 and burst >= 1"
+        )
+    _max_concurrency = max_concurrency
+    _requests_per_second = requests_per_second
+    _burst = burst
+    reset_host_limiters()
+
+
+def get_host_limiter(host: str) -> HostLimiter:
+    """Return ``host``'s limiter, creating it on first use."""
+    limiter = _limiters.get(host)
+    if limiter is None:
+        limiter = _limiters[host] = HostLimiter(
+            host, _max_concurrency, _requests_per_second, _burst
+        )
+    return limiter
+
+
+def host_limiter_stats() -> list[HostLimiterStats]:
+    """Stats for every host fetched from so far, sorted by host."""
+    return [_limiters[host].stats() for host in sorted(_limiters)]
+
+
+def reset_host_limiters() -> None:
+    """Forget all limiters and their stats."""
+    _limiters.clear()
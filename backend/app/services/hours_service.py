@@ -8,6 +8,66 @@ from app.models.dining_hall import DiningHall
 from app.models.dining_hours import DiningHours, DiningHoursOverride
 
 
+async def get_effective_hours(
+    session: AsyncSession, day: _dt.date
+) -> list[tuple[str, str, _dt.time, _dt.time]]:
+    """Return ``(hall_id, meal, start_time, end_time)`` for every meal served on *day*.
+
+    Applies that date's ``DiningHoursOverride`` records to the regular
+    weekly ``DiningHours`` (see ``get_open_halls`` for the rules).
+    Regular-schedule meals come first, then special openings.
+    """
+    # -- 1. Fetch the day's overrides ---------------------------------------
+    override_result = await session.execute(
+        select(DiningHoursOverride).where(DiningHoursOverride.date == day)
+    )
+    overrides = override_result.scalars().all()
+    override_map: dict[tuple[str, str | None], DiningHoursOverride] = {
+        (o.hall_id, o.meal): o for o in overrides
+    }
+
+    # -- 2. Fetch regular hours for the day of week -------------------------
+    # isoweekday(): Monday=1 .. Sunday=7  ->  Sunday=0 .. Saturday=6
+    hours_result = await session.execute(
+        select(DiningHours).where(
+            DiningHours.day_of_week == day.isoweekday() % 7,
+            DiningHours.is_active == True,  # noqa: E712
+        )
+    )
+    regular_hours = hours_result.scalars().all()
+
+    served: list[tuple[str, str, _dt.time, _dt.time]] = []
+    seen_keys: set[tuple[str, str | None]] = set()
+
+    for row in regular_hours:
+        key = (row.hall_id, row.meal)
+        seen_keys.add(key)
+
+        override = override_map.get(key)
+        if override is not None:
+            if override.start_time is None:
+                # Explicitly closed for this meal
+                continue
+            start = override.start_time
+            end = override.end_time
+        else:
+            start = row.start_time
+            end = row.end_time
+
+        if start is not None and end is not None:
+            served.append((row.hall_id, row.meal, start, end))
+
+    # -- 3. Override-only entries (special openings) ------------------------
+    for (hall_id, meal), override in override_map.items():
+        if (hall_id, meal) in seen_keys:
+            continue  # Already handled above
+        if override.start_time is None or override.end_time is None:
+            continue  # Closure-only override without regular hours (no-op)
+        served.append((hall_id, meal or "special", override.start_time, override.end_time))
+
+    return served
+
+
 async def get_open_halls(
     session: AsyncSession,
     tz_name: str,
@@ -43,69 +103,20 @@ async def get_open_halls(
         now = now.replace(tzinfo=tz)
 
     current_time = now.time()
-    # isoweekday(): Monday=1 .. Sunday=7  ->  Sunday=0 .. Saturday=6
-    current_dow = now.isoweekday() % 7
-
-    # -- 1. Fetch today's overrides -----------------------------------------
-    override_result = await session.execute(
-        select(DiningHoursOverride).where(
-            DiningHoursOverride.date == now.date()
-        )
-    )
-    overrides = override_result.scalars().all()
-    override_map: dict[tuple[str, str | None], DiningHoursOverride] = {
-        (o.hall_id, o.meal): o for o in overrides
-    }
-
-    # -- 2. Fetch regular hours for today's day-of-week ---------------------
-    hours_result = await session.execute(
-        select(DiningHours).where(
-            DiningHours.day_of_week == current_dow,
-            DiningHours.is_active == True,  # noqa: E712
-        )
-    )
-    regular_hours = hours_result.scalars().all()
 
     # Collect (hall_id, meal, effective_start) for halls currently open
     open_entries: dict[str, tuple[str, _dt.time]] = {}  # hall_id -> (meal, start)
 
-    seen_keys: set[tuple[str, str | None]] = set()
-
-    for row in regular_hours:
-        key = (row.hall_id, row.meal)
-        seen_keys.add(key)
-
-        override = override_map.get(key)
-        if override is not None:
-            if override.start_time is None:
-                # Explicitly closed for this meal
-                continue
-            start = override.start_time
-            end = override.end_time
-        else:
-            start = row.start_time
-            end = row.end_time
-
-        if start is not None and end is not None and start <= current_time <= end:
-            existing = open_entries.get(row.hall_id)
-            if existing is None or start > existing[1]:
-                open_entries[row.hall_id] = (row.meal, start)
-
-    # -- 3. Check override-only entries (special openings) ------------------
-    for (hall_id, meal), override in override_map.items():
-        if (hall_id, meal) in seen_keys:
-            continue  # Already handled above
-        if override.start_time is None or override.end_time is None:
-            continue  # Closure-only override without regular hours (no-op)
-        if override.start_time <= current_time <= override.end_time:
+    for hall_id, meal, start, end in await get_effective_hours(session, now.date()):
+        if start <= current_time <= end:
             existing = open_entries.get(hall_id)
-            if existing is None or override.start_time > existing[1]:
-                open_entries[hall_id] = (meal or "special", override.start_time)
+            if existing is None or start > existing[1]:
+                open_entries[hall_id] = (meal, start)
 
     if not open_entries:
         return []
 
-    # -- 4. Fetch hall metadata for open halls ------------------------------
+    # -- Fetch hall metadata for open halls ---------------------------------
     hall_ids = list(open_entries.keys())
     hall_result = await session.execute(
         select(DiningHall).where(DiningHall.id.in_(hall_ids))  # type: ignore[attr-defined]
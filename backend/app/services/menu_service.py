@@ -1,25 +1,45 @@
 """Menu service: orchestrates cache, coalescing, parsing, and fallback.
 
 Request flow:
-1. Check Redis cache for the requested hall/date/meal
-2. On cache miss, coalesce concurrent requests to prevent stampede
+1. Check the cache for the requested hall/date's day document; an entry
+   past its soft expiry is served while one background refresh replaces it
+2. On cache miss, coalesce concurrent requests for the hall/date (any meal)
+   to prevent stampede
 3. Inside the coalesced fetch: run the appropriate parser via fallback orchestrator
-4. Extract the requested meal from the parsed menu
-5. Cache the result and return it
+4. Cache the day document (plus any other days decoded from the same
+   vendor payload)
+5. Return the requested meal from the day document
 """
 
 import datetime as _dt
 import logging
+import time
+from functools import partial
 
+import httpx
 from redis.asyncio import Redis
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.config import get_settings
+from app.models.menu import ParsedMeal, ParsedMenu
 from app.parsers.base import BaseParser
 from app.parsers.bonappetit import BonAppetitParser
-from app.parsers.fallback import get_menu_with_fallback
+from app.parsers.fallback import (
+    get_menu_with_fallback,
+    serialize_stations,
+    stations_content_hash,
+)
 from app.parsers.pomona import PomonaParser
 from app.parsers.sodexo import SodexoParser
-from app.services.cache import cache_get, cache_set, menu_cache_key
+from app.services.background import spawn_background
+from app.services.cache import (
+    FALLBACK_TTL,
+    cache_get_entry,
+    cache_set,
+    cache_set_negative,
+    day_cache_key,
+)
+from app.services.circuit_breaker import CircuitBreaker
 from app.services.coalesce import coalesced_fetch
 
 logger = logging.getLogger(__name__)
@@ -49,9 +69,11 @@ HALL_CONFIG: dict[str, dict] = {
 }
 
 
-def get_parser(hall_id: str) -> BaseParser:
+def get_parser(hall_id: str, client: httpx.AsyncClient | None = None) -> BaseParser:
     """Instantiate the correct parser for a given hall.
 
+    ``client`` is the shared pooled upstream HTTP client, if available.
+
     Raises:
         ValueError: If hall_id is not recognized.
     """
@@ -61,7 +83,186 @@ def get_parser(hall_id: str) -> BaseParser:
     config = HALL_CONFIG[hall_id]
     vendor_type = config["vendor_type"]
     parser_cls = PARSER_REGISTRY[vendor_type]
-    return parser_cls(hall_id=hall_id, hall_name=config["name"])
+    return parser_cls(hall_id=hall_id, hall_name=config["name"], client=client)
+
+
+def _meal_response(
+    hall_id: str,
+    date_str: str,
+    meal: str,
+    parsed_meal: ParsedMeal,
+    is_stale: bool,
+    fetched_at: _dt.datetime | None,
+) -> dict:
+    """Build a response dict matching the MenuResponse schema."""
+    stations = serialize_stations(parsed_meal.stations)
+    return {
+        "hall_id": hall_id,
+        "date": date_str,
+        "meal": meal,
+        "stations": stations,
+        "is_stale": is_stale,
+        "fetched_at": fetched_at.isoformat() if fetched_at else None,
+        "content_hash": stations_content_hash(stations),
+    }
+
+
+def _day_document(
+    menu: ParsedMenu, is_stale: bool, fetched_at: _dt.datetime | None
+) -> dict:
+    """Build the cached day document: every meal's response, by lowercase meal."""
+    date_str = menu.date.isoformat()
+    return {
+        "meals": {
+            parsed_meal.meal.lower(): _meal_response(
+                menu.hall_id, date_str, parsed_meal.meal, parsed_meal, is_stale, fetched_at
+            )
+            for parsed_meal in menu.meals
+        }
+    }
+
+
+def _meal_from_day(day: dict, meal: str) -> dict | None:
+    """Pick one meal's response out of a day document, echoing ``meal``."""
+    result = day["meals"].get(meal.lower())
+    if result is None:
+        return None
+    # Day documents may be shared through the L1; never mutate them
+    return {**result, "meal": meal}
+
+
+async def _cache_menus(
+    redis_client: Redis,
+    menus: list[ParsedMenu],
+    fetched_at: _dt.datetime | None,
+    compute_time: float | None = None,
+) -> None:
+    """Cache each of ``menus`` as a fresh day document.
+
+    ``compute_time`` is the fetch that produced them; refetching any one
+    of them costs about the same, so it is recorded on every entry.
+    """
+    for menu in menus:
+        key = day_cache_key(menu.hall_id, menu.date.isoformat())
+        await cache_set(redis_client, key, _day_document(menu, False, fetched_at), compute_time)
+
+
+async def _cache_fetched(
+    redis_client: Redis,
+    parser: BaseParser,
+    start: float,
+    menu: ParsedMenu,
+    fetched_at: _dt.datetime,
+) -> None:
+    """``on_success`` callback: cache a live fetch started at ``start``.
+
+    Fan-out: other days parsed from the same vendor payload are cached
+    now so paging through the week hits Redis.
+    """
+    await _cache_menus(
+        redis_client, [menu, *parser.sibling_menus], fetched_at, time.monotonic() - start
+    )
+
+
+async def _fetch_day(
+    hall_id: str,
+    date_str: str,
+    session: AsyncSession,
+    redis_client: Redis,
+    http_client: httpx.AsyncClient | None = None,
+    session_factory: async_sessionmaker[AsyncSession] | None = None,
+) -> dict | None:
+    """Run the parser (with DB fallback) for one hall/day and cache the day document.
+
+    A day the vendor answered with no menu (and nothing stored) is cached
+    as a negative entry; fetch or parse failures, timeouts and open
+    circuits are not, so the next request tries again.
+    """
+    target_date = _dt.date.fromisoformat(date_str)
+    parser = get_parser(hall_id, http_client)
+    settings = get_settings()
+    start = time.monotonic()
+    menu, is_stale, fetched_at = await get_menu_with_fallback(
+        parser, hall_id, target_date, session,
+        on_success=partial(_cache_fetched, redis_client, parser, start),
+        breaker=CircuitBreaker.from_settings(redis_client, settings),
+        deadline=settings.menu_fetch_deadline or None,
+        session_factory=session_factory,
+    )
+
+    cache_key = day_cache_key(hall_id, date_str)
+    if menu is None:
+        if parser.timings.no_menu:
+            await cache_set_negative(redis_client, cache_key)
+        return None
+    day = _day_document(menu, is_stale, fetched_at)
+    if is_stale:
+        # Fresh results were cached by _cache_fetched. Stored data goes
+        # stale soon, so the next request retries the vendor.
+        await cache_set(
+            redis_client, cache_key, day, time.monotonic() - start, soft_ttl=FALLBACK_TTL
+        )
+    return day
+
+
+# ---------------------------------------------------------------------------
+# Stale-while-revalidate
+# ---------------------------------------------------------------------------
+
+# Cache keys with a revalidation running in this worker
+_revalidating: set[str] = set()
+
+# Cross-worker claim on a key's revalidation; matches the coalesce timeout,
+# so a refresh that raised is retried at most this often (one that fell
+# back to stored data is retried once that entry's FALLBACK_TTL is up)
+_REVALIDATE_LOCK_MS = 30_000
+
+
+async def _revalidate(
+    hall_id: str,
+    date_str: str,
+    redis_client: Redis,
+    http_client: httpx.AsyncClient | None,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Refresh one day document on a session of its own."""
+    cache_key = day_cache_key(hall_id, date_str)
+    try:
+        async with session_factory() as session:
+            await coalesced_fetch(
+                cache_key,
+                partial(_fetch_day, hall_id, date_str, session, redis_client, http_client),
+            )
+    except Exception:
+        logger.warning("Revalidation failed for %s", cache_key, exc_info=True)
+    finally:
+        _revalidating.discard(cache_key)
+
+
+async def _start_revalidation(
+    hall_id: str,
+    date_str: str,
+    redis_client: Redis,
+    http_client: httpx.AsyncClient | None,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """Start a background refresh of a stale entry, unless one is already running."""
+    cache_key = day_cache_key(hall_id, date_str)
+    if cache_key in _revalidating:
+        return
+    try:
+        claimed = await redis_client.set(
+            f"revalidate:{cache_key}", "1", nx=True, px=_REVALIDATE_LOCK_MS
+        )
+    except Exception:
+        logger.warning("Revalidation lock unavailable for %s", cache_key, exc_info=True)
+        claimed = True
+    if not claimed or cache_key in _revalidating:
+        return
+    _revalidating.add(cache_key)
+    spawn_background(
+        _revalidate(hall_id, date_str, redis_client, http_client, session_factory)
+    )
 
 
 async def get_menu(
@@ -70,64 +271,77 @@ async def get_menu(
     meal: str,
     session: AsyncSession,
     redis_client: Redis,
+    http_client: httpx.AsyncClient | None = None,
+    session_factory: async_sessionmaker[AsyncSession] | None = None,
 ) -> dict | None:
     """Fetch menu data with caching and stampede prevention.
 
     Returns a dict matching the MenuResponse schema, or None if no
     menu data is available (neither live nor from fallback).
-    """
-    cache_key = menu_cache_key(hall_id, date_str, meal)
 
-    # 1. Check cache
-    cached = await cache_get(redis_client, cache_key)
-    if cached is not None:
-        return cached
+    Caching and coalescing work on whole days: one scrape per hall/date
+    fills a day document holding every meal, and each meal is read from
+    it. With a ``session_factory``:
 
-    # 2. Cache miss -- use coalesced fetch
-    async def _fetch() -> dict | None:
-        target_date = _dt.date.fromisoformat(date_str)
-        parser = get_parser(hall_id)
+    * a cache entry past its soft expiry is returned as-is while one
+      background refresh (across all workers) replaces it; hot entries
+      are also refreshed shortly before it (``FIVEC_CACHE_XFETCH_BETA``)
+    * a live fetch slower than ``FIVEC_MENU_FETCH_DEADLINE`` is answered
+      from the stored menu and finishes in the background
 
-        menu, is_stale, fetched_at = await get_menu_with_fallback(
-            parser, hall_id, target_date, session
-        )
+    Without one, a stale entry is treated as a miss.
+    """
+    cache_key = day_cache_key(hall_id, date_str)
 
-        if menu is None:
+    # 1. Check cache
+    entry = await cache_get_entry(redis_client, cache_key)
+    if entry is not None:
+        if entry.is_negative:
+            # Known to have no menu until the entry expires
             return None
+        if not entry.should_refresh(get_settings().cache_xfetch_beta):
+            return _meal_from_day(entry.data, meal)
+        if session_factory is not None:
+            # 2. Stale (or picked for early refresh) -- serve it and
+            # revalidate in the background
+            await _start_revalidation(
+                hall_id, date_str, redis_client, http_client, session_factory
+            )
+            return _meal_from_day(entry.data, meal)
+        if not entry.is_stale:
+            return _meal_from_day(entry.data, meal)
 
-        # Find the matching meal period
-        matching_meal = None
-        for m in menu.meals:
-            if m.meal.lower() == meal.lower():
-                matching_meal = m
-                break
+    # 3. Cache miss -- one coalesced fetch per hall/day, whatever the meal
+    day = await coalesced_fetch(
+        cache_key,
+        partial(
+            _fetch_day, hall_id, date_str, session, redis_client, http_client,
+            session_factory,
+        ),
+    )
+    return _meal_from_day(day, meal) if day is not None else None
 
-        if matching_meal is None:
-            return None
-
-        # Build response dict matching MenuResponse schema
-        stations = [
-            {
-                "name": station.name,
-                "items": [
-                    {"name": item.name, "tags": item.tags}
-                    for item in station.items
-                ],
-            }
-            for station in matching_meal.stations
-        ]
-
-        result: dict = {
-            "hall_id": hall_id,
-            "date": date_str,
-            "meal": meal,
-            "stations": stations,
-            "is_stale": is_stale,
-            "fetched_at": fetched_at.isoformat() if fetched_at else None,
-        }
 
-        # Cache the result
-        await cache_set(redis_client, cache_key, result)
-        return result
+async def refresh_menu(
+    hall_id: str,
+    target_date: _dt.date,
+    session: AsyncSession,
+    redis_client: Redis,
+    http_client: httpx.AsyncClient | None = None,
+) -> list[_dt.date]:
+    """Fetch a hall's menu live, persisting and caching every meal.
 
-    return await coalesced_fetch(cache_key, _fetch)
+    Used by the prefetch scheduler. Other days decoded from the same
+    vendor payload are persisted and cached too. Returns the dates that
+    were refreshed (empty if the live fetch failed or was skipped).
+    """
+    parser = get_parser(hall_id, http_client)
+    start = time.monotonic()
+    menu, is_stale, _ = await get_menu_with_fallback(
+        parser, hall_id, target_date, session,
+        on_success=partial(_cache_fetched, redis_client, parser, start),
+        breaker=CircuitBreaker.from_settings(redis_client, get_settings()),
+    )
+    if menu is None or is_stale:
+        return []
+    return [target_date, *(sibling.date for sibling in parser.sibling_menus)]
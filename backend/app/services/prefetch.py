@@ -0,0 +1,222 @@
+"""Optional background prefetch of the rolling week's menus.
+
+Without it, the first view of each hall/day after the cache expires pays
+for a live vendor scrape. When ``FIVEC_PREFETCH_ENABLED`` is set, the app
+lifespan starts a ``PrefetchScheduler`` that keeps today plus the next
+``prefetch_days - 1`` days warm for every hall in ``HALL_CONFIG``, so
+user-facing cache misses become rare.
+
+* Every ``tick`` seconds (+/- ``jitter``, a fraction of the tick) the
+  scheduler asks a ``RefreshPlanner`` which halls are due, based on
+  their meal windows: shortly before each meal, regularly during
+  service, not at all overnight or while closed. Halls with no hours on
+  record are refreshed every ``prefetch_interval`` seconds.
+* Pre-meal and fallback refreshes cover the rolling week; in-service
+  refreshes cover today only.
+* Each refresh goes through ``refresh_menu``: the normal parsers,
+  circuit breaker, host limits, ``persist_menu`` and cache writes.
+* Days a vendor payload already covered (Sodexo returns a week at a
+  time) are not fetched again in the same refresh.
+* At most ``concurrency`` halls are refreshed at once.
+* Workers share each hall's last refresh time in Redis, and a
+  per-hall lock keeps two workers from refreshing the same hall.
+"""
+
+import asyncio
+import datetime as _dt
+import logging
+import random
+from zoneinfo import ZoneInfo
+
+import httpx
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import Settings
+from app.services.menu_service import HALL_CONFIG, refresh_menu
+from app.services.refresh_planner import RefreshPlanner, load_meal_windows
+
+logger = logging.getLogger(__name__)
+
+# Longest a worker may hold a hall's refresh lock
+_LOCK_TIMEOUT_MS = 300_000
+
+
+def _last_refresh_key(hall_id: str) -> str:
+    return f"prefetch:last:{hall_id}"
+
+
+def _lock_key(hall_id: str) -> str:
+    return f"prefetch:lock:{hall_id}"
+
+
+class PrefetchScheduler:
+    """Periodically refreshes every hall's menus for the rolling week."""
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        session_factory: async_sessionmaker[AsyncSession],
+        http_client: httpx.AsyncClient | None = None,
+        *,
+        planner: RefreshPlanner | None = None,
+        tick: float = 60.0,
+        jitter: float = 0.1,
+        days: int = 7,
+        concurrency: int = 2,
+        timezone: str = "America/Los_Angeles",
+    ) -> None:
+        self.redis = redis_client
+        self.session_factory = session_factory
+        self.http_client = http_client
+        self.planner = planner or RefreshPlanner()
+        self.tick = tick
+        self.jitter = jitter
+        self.days = days
+        self.concurrency = concurrency
+        self.tz = ZoneInfo(timezone)
+        self._task: asyncio.Task | None = None
+
+    @classmethod
+    def from_settings(
+        cls,
+        redis_client: Redis,
+        session_factory: async_sessionmaker[AsyncSession],
+        http_client: httpx.AsyncClient | None,
+        settings: Settings,
+    ) -> "PrefetchScheduler":
+        """Build a scheduler using the ``FIVEC_PREFETCH_*`` settings."""
+        return cls(
+            redis_client,
+            session_factory,
+            http_client,
+            planner=RefreshPlanner(
+                lead=_dt.timedelta(seconds=settings.prefetch_meal_lead),
+                service_interval=_dt.timedelta(seconds=settings.prefetch_service_interval),
+                fallback_interval=_dt.timedelta(seconds=settings.prefetch_interval),
+            ),
+            jitter=settings.prefetch_jitter,
+            days=settings.prefetch_days,
+            concurrency=settings.prefetch_concurrency,
+            timezone=settings.timezone,
+        )
+
+    def start(self) -> None:
+        """Start the background loop (no-op if already running)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="menu-prefetch")
+
+    async def stop(self) -> None:
+        """Cancel the loop and wait for it, abandoning any cycle in progress."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def now(self) -> _dt.datetime:
+        return _dt.datetime.now(self.tz)
+
+    def dates(self, today: _dt.date) -> list[_dt.date]:
+        """``today`` plus the following days of the rolling week."""
+        return [today + _dt.timedelta(days=i) for i in range(self.days)]
+
+    async def run_due(self, now: _dt.datetime | None = None) -> int:
+        """Refresh the halls the planner says are due; return the days refreshed."""
+        now = now or self.now()
+        today = now.date()
+        async with self.session_factory() as session:
+            windows = await load_meal_windows(
+                session, [today, today + _dt.timedelta(days=1)], self.tz
+            )
+
+        work: list[tuple[str, list[_dt.date]]] = []
+        for hall_id in HALL_CONFIG:
+            plan = self.planner.next_refresh(
+                windows.get(hall_id), await self._last_refresh(hall_id), now
+            )
+            if plan is not None and plan.at <= now:
+                work.append((hall_id, self.dates(today) if plan.full_week else [today]))
+        if not work:
+            return 0
+        return await self._refresh_halls(work, claim_at=now)
+
+    async def _refresh_halls(
+        self, work: list[tuple[str, list[_dt.date]]], claim_at: _dt.datetime
+    ) -> int:
+        """Refresh each ``(hall_id, dates)``, locking each hall and stamping it ``claim_at``."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _refresh_hall(hall_id: str, dates: list[_dt.date]) -> int:
+            async with semaphore:
+                if not await self._claim(hall_id):
+                    return 0
+                covered: set[_dt.date] = set()
+                try:
+                    for target_date in dates:
+                        if target_date in covered:
+                            continue
+                        try:
+                            async with self.session_factory() as session:
+                                refreshed = await refresh_menu(
+                                    hall_id, target_date, session, self.redis, self.http_client
+                                )
+                        except Exception:
+                            logger.warning(
+                                "Prefetch failed for %s on %s", hall_id, target_date,
+                                exc_info=True,
+                            )
+                            continue
+                        covered.update(refreshed)
+                finally:
+                    # Stamped even on failure: the breaker and the next
+                    # planned refresh handle retries, not every tick
+                    await self._release(hall_id, claim_at)
+                return len(covered.intersection(dates))
+
+        counts = await asyncio.gather(*(_refresh_hall(hall, dates) for hall, dates in work))
+        return sum(counts)
+
+    async def _last_refresh(self, hall_id: str) -> _dt.datetime | None:
+        try:
+            value = await self.redis.get(_last_refresh_key(hall_id))
+        except Exception:
+            logger.warning("Prefetch state unavailable for %s", hall_id, exc_info=True)
+            return None
+        if value is None:
+            return None
+        return _dt.datetime.fromtimestamp(float(value), self.tz)
+
+    async def _claim(self, hall_id: str) -> bool:
+        """Take ``hall_id``'s refresh lock; True if no other worker holds it."""
+        try:
+            return bool(
+                await self.redis.set(_lock_key(hall_id), "1", nx=True, px=_LOCK_TIMEOUT_MS)
+            )
+        except Exception:
+            logger.warning("Prefetch lock unavailable for %s", hall_id, exc_info=True)
+            return True
+
+    async def _release(self, hall_id: str, refreshed_at: _dt.datetime) -> None:
+        try:
+            await self.redis.set(_last_refresh_key(hall_id), refreshed_at.timestamp())
+            await self.redis.delete(_lock_key(hall_id))
+        except Exception:
+            logger.warning("Prefetch state update failed for %s", hall_id, exc_info=True)
+
+    def _next_delay(self) -> float:
+        return self.tick * (1 + random.uniform(-self.jitter, self.jitter))
+
+    async def _run(self) -> None:
+        await asyncio.sleep(random.uniform(0, self.tick * self.jitter))
+        while True:
+            try:
+                refreshed = await self.run_due()
+                if refreshed:
+                    logger.info("Prefetched %d hall-days", refreshed)
+            except Exception:
+                logger.exception("Prefetch tick failed")
+            await asyncio.sleep(self._next_delay())
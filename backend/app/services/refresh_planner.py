@@ -0,0 +1,134 @@
+"""Meal-window-aware refresh timing for the prefetch scheduler.
+
+A fixed refresh interval wastes vendor fetches overnight and can leave
+a stale menu in place right when a meal opens. ``RefreshPlanner`` bases
+each hall's next refresh on its effective dining hours (``DiningHours``
+plus ``DiningHoursOverride``, via ``get_effective_hours``):
+
+* ``lead`` before each meal starts -- a pre-meal refresh, which also
+  refreshes the rest of the rolling week
+* every ``service_interval`` while a meal is being served -- today only
+* nothing after the last meal closes, until the lead time before the
+  next day's first meal
+
+Halls with no hours on record keep the old behaviour: a full refresh
+every ``fallback_interval``. Halls that have hours but serve nothing in
+the loaded days (weekends, closure overrides) are not refreshed at all.
+"""
+
+import datetime as _dt
+from dataclasses import dataclass
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.dining_hours import DiningHours
+from app.services.hours_service import get_effective_hours
+
+# Why a refresh is due; decides how many days it covers
+PRE_MEAL = "pre_meal"
+IN_SERVICE = "in_service"
+FALLBACK = "fallback"
+
+
+@dataclass(frozen=True)
+class MealWindow:
+    """One meal period of one hall, as timezone-aware datetimes."""
+
+    hall_id: str
+    meal: str
+    start: _dt.datetime
+    end: _dt.datetime
+
+
+@dataclass(frozen=True)
+class PlannedRefresh:
+    """When a hall should next be refreshed, and why."""
+
+    at: _dt.datetime
+    reason: str  # PRE_MEAL, IN_SERVICE or FALLBACK
+
+    @property
+    def full_week(self) -> bool:
+        """Whether this refresh should cover the whole rolling week."""
+        return self.reason != IN_SERVICE
+
+
+async def load_meal_windows(
+    session: AsyncSession, days: list[_dt.date], tz: ZoneInfo
+) -> dict[str, list[MealWindow]]:
+    """Effective meal windows for ``days``, by hall, in chronological order.
+
+    Every hall with active ``DiningHours`` is present, with an empty list
+    if it serves nothing on ``days``; halls with no hours on record are
+    absent unless an override opens them.
+    """
+    result = await session.execute(
+        select(DiningHours.hall_id).where(DiningHours.is_active == True).distinct()  # noqa: E712
+    )
+    windows: dict[str, list[MealWindow]] = {hall_id: [] for hall_id in result.scalars()}
+    for day in days:
+        for hall_id, meal, start, end in await get_effective_hours(session, day):
+            windows.setdefault(hall_id, []).append(
+                MealWindow(
+                    hall_id=hall_id,
+                    meal=meal,
+                    start=_dt.datetime.combine(day, start, tzinfo=tz),
+                    end=_dt.datetime.combine(day, end, tzinfo=tz),
+                )
+            )
+    for hall_windows in windows.values():
+        hall_windows.sort(key=lambda w: w.start)
+    return windows
+
+
+class RefreshPlanner:
+    """Decides each hall's next refresh from its meal windows."""
+
+    def __init__(
+        self,
+        lead: _dt.timedelta = _dt.timedelta(minutes=15),
+        service_interval: _dt.timedelta = _dt.timedelta(minutes=10),
+        fallback_interval: _dt.timedelta = _dt.timedelta(minutes=25),
+    ) -> None:
+        self.lead = lead
+        self.service_interval = service_interval
+        self.fallback_interval = fallback_interval
+
+    def next_refresh(
+        self,
+        windows: list[MealWindow] | None,
+        last_refresh: _dt.datetime | None,
+        now: _dt.datetime,
+    ) -> PlannedRefresh | None:
+        """The next refresh after ``last_refresh``, or None if none is needed.
+
+        ``windows`` must be chronological and should reach into the next
+        day, so the overnight gap ends with the next breakfast's
+        pre-meal refresh. None means the hall has no hours on record; an
+        empty list means it is closed throughout. A hall never refreshed
+        is due at ``now``.
+        """
+        if windows is None:
+            if last_refresh is None:
+                return PlannedRefresh(now, FALLBACK)
+            return PlannedRefresh(last_refresh + self.fallback_interval, FALLBACK)
+        if not windows:
+            return None
+
+        if last_refresh is None:
+            return PlannedRefresh(now, PRE_MEAL)
+
+        for window in windows:
+            if window.end <= last_refresh:
+                continue
+            pre_meal = window.start - self.lead
+            if last_refresh < pre_meal:
+                return PlannedRefresh(pre_meal, PRE_MEAL)
+            # Refreshed at or after the pre-meal point: keep it current
+            # while the meal is served
+            in_service = max(last_refresh + self.service_interval, window.start)
+            if in_service < window.end:
+                return PlannedRefresh(in_service, IN_SERVICE)
+        return None
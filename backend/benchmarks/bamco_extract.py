@@ -0,0 +1,65 @@
+"""Bamco blob extraction: legacy regexes vs the single-pass scanner.
+
+Times extracting ``Bamco.menu_items`` and every ``Bamco.dayparts[...]``
+object from each recorded Bon Appetit fixture, using the original
+``\\{[^;]+\\}`` regexes (two full scans plus ``json.loads``) and
+``BonAppetitParser._scan_bamco_objects``, and checks both agree.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bamco_extract [--repeat 20]
+"""
+
+import argparse
+import json
+import re
+import statistics
+import time
+from pathlib import Path
+
+from app.parsers.bonappetit import BonAppetitParser
+
+FIXTURES_DIR = Path(__file__).parent.parent / "tests" / "fixtures" / "bonappetit"
+
+# The patterns BonAppetitParser used before the scanner
+LEGACY_RE_MENU_ITEMS = re.compile(r"Bamco\.menu_items\s*=\s*(\{[^;]+\});")
+LEGACY_RE_DAYPARTS = re.compile(r"Bamco\.dayparts\[\'(\d+)\'\]\s*=\s*(\{[^;]+\});")
+
+
+def legacy_extract(html: str) -> tuple[dict, dict[str, dict]]:
+    match = LEGACY_RE_MENU_ITEMS.search(html)
+    if not match:
+        raise ValueError("Could not find Bamco.menu_items in page")
+    menu_items = json.loads(match.group(1))
+    dayparts = {m.group(1): json.loads(m.group(2)) for m in LEGACY_RE_DAYPARTS.finditer(html)}
+    return menu_items, dayparts
+
+
+def _time_ms(fn, html: str, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(html)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=20)
+    args = arg_parser.parse_args()
+
+    print(f"{'fixture':<28}{'KB':>8}{'regex ms':>10}{'scan ms':>10}{'speedup':>9}  same")
+    for path in sorted(FIXTURES_DIR.glob("*.html")):
+        html = path.read_text()
+        same = legacy_extract(html) == BonAppetitParser._scan_bamco_objects(html)
+        legacy_ms = _time_ms(legacy_extract, html, args.repeat)
+        scan_ms = _time_ms(BonAppetitParser._scan_bamco_objects, html, args.repeat)
+        print(
+            f"{path.name:<28}{len(html) / 1024:>8.0f}{legacy_ms:>10.2f}"
+            f"{scan_ms:>10.2f}{legacy_ms / scan_ms:>8.2f}x  {same}"
+        )
+
+
+if __name__ == "__main__":
+    main()
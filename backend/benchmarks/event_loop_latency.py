@@ -0,0 +1,81 @@
+"""Event-loop latency while parsing, with and without the parse executor.
+
+Runs a 1 ms heartbeat on the event loop while a batch of Bon Appetit
+fixture pages is parsed through ``app.parsers.executor.run_parse``, and
+reports how late the heartbeat fires (loop lag) for each executor kind.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.event_loop_latency [--parses 20] [--workers 2]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import date
+from pathlib import Path
+
+from app.parsers import executor
+from app.parsers.bonappetit import BonAppetitParser
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "bonappetit" / "collins_2026-02-07.html"
+TARGET_DATE = date(2026, 2, 7)
+TICK_S = 0.001
+
+
+async def _heartbeat(lags: list[float], stop: asyncio.Event) -> None:
+    """Sleep TICK_S repeatedly and record how late each wake-up is."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK_S)
+        lags.append(time.perf_counter() - start - TICK_S)
+
+
+async def _run(kind: str, parses: int, workers: int | None) -> dict[str, float]:
+    executor.configure_parse_executor(kind, workers)
+    parser = BonAppetitParser("collins", "Collins")
+    raw = FIXTURE.read_text()
+    try:
+        # Warm the pool so worker start-up is not counted
+        await executor.run_parse(parser, raw, TARGET_DATE)
+
+        lags: list[float] = []
+        stop = asyncio.Event()
+        beat = asyncio.create_task(_heartbeat(lags, stop))
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(executor.run_parse(parser, raw, TARGET_DATE) for _ in range(parses))
+        )
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await beat
+    finally:
+        executor.shutdown_parse_executor()
+
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    return {
+        "wall_ms": elapsed * 1000,
+        "lag_p50_ms": statistics.median(lags_ms),
+        "lag_p99_ms": lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))],
+        "lag_max_ms": lags_ms[-1],
+    }
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--parses", type=int, default=20)
+    arg_parser.add_argument("--workers", type=int, default=None)
+    args = arg_parser.parse_args()
+
+    print(f"{'executor':<10}{'wall ms':>10}{'lag p50':>10}{'lag p99':>10}{'lag max':>10}")
+    for kind in executor.EXECUTOR_KINDS:
+        r = asyncio.run(_run(kind, args.parses, args.workers))
+        print(
+            f"{kind:<10}{r['wall_ms']:>10.1f}{r['lag_p50_ms']:>10.2f}"
+            f"{r['lag_p99_ms']:>10.2f}{r['lag_max_ms']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+"""Parser benchmark suite with a saved baseline and regression check.
+
+For each vendor this times, over that vendor's corpus:
+
+* ``parse`` -- the full ``parse`` of every page
+* ``extract`` -- the raw-payload extraction step
+  (``_extract_bamco_objects``, ``_extract_json``, ``_index_by_serve_date``)
+* ``apply_station_filters`` -- replaying every filter call ``parse`` makes
+* ``normalize_dietary_tags`` -- replaying every tag-normalization call
+
+One op is one pass over the vendor's corpus. Each case reports ops/sec
+and p50/p99 latency from timed rounds, and the median tracemalloc peak
+over ``--memory-repeats`` separate, untimed runs (single runs vary by
+more than the memory threshold).
+
+The corpus is the recorded fixtures under ``tests/fixtures``, plus a
+synthetic Sodexo week because no Sodexo page is recorded. With
+``--synthetic N`` it is instead one generated payload per vendor
+(see ``benchmarks.synthetic``) with N times a typical day's items,
+covering ``--synthetic-days`` days.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.parsers                            # print results
+    python -m benchmarks.parsers --save baseline.json       # record a baseline
+    python -m benchmarks.parsers --compare baseline.json    # exit 1 on regression
+    python -m benchmarks.parsers --synthetic 10 --synthetic-days 14
+
+Baselines are only comparable on the machine that recorded them.
+"""
+
+import argparse
+import datetime as _dt
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from app.parsers import bonappetit, pomona, sodexo
+from app.parsers.base import BaseParser
+from app.parsers.station_filters import apply_station_filters, normalize_dietary_tags
+from benchmarks.sodexo_extract import build_page
+from benchmarks.synthetic import SyntheticSpec, bamco_page, eatec_json, sodexo_page
+
+FIXTURES_DIR = Path(__file__).parent.parent / "tests" / "fixtures"
+TARGET_DATE = _dt.date(2026, 2, 7)
+
+# Default regression thresholds, as a fraction over the baseline
+TIME_THRESHOLD = 0.25
+MEMORY_THRESHOLD = 0.20
+# Untimed runs whose median tracemalloc peak is reported
+MEMORY_REPEATS = 5
+
+# Shortest timed sample; faster cases run several ops per sample
+MIN_SAMPLE_SECONDS = 0.002
+
+# Roughly one real day per hall; --synthetic N scales items per station
+SYNTHETIC_DAY = SyntheticSpec(stations=10, items_per_station=15)
+
+
+@dataclass
+class Workload:
+    """One raw vendor payload and the parser that handles it."""
+
+    vendor: str
+    parser: BaseParser
+    raw: str
+    target_date: _dt.date
+
+
+@dataclass
+class Case:
+    """A named, repeatable unit of work."""
+
+    vendor: str
+    name: str
+    fn: Callable[[], object]
+
+    @property
+    def key(self) -> str:
+        return f"{self.vendor}.{self.name}"
+
+
+def fixture_workloads() -> list[Workload]:
+    """Workloads for the recorded fixtures plus a synthetic Sodexo week."""
+    workloads = []
+    for path in sorted((FIXTURES_DIR / "bonappetit").glob("*.html")):
+        hall_id = path.name.split("_")[0]
+        workloads.append(
+            Workload("bonappetit", bonappetit.BonAppetitParser(hall_id, hall_id),
+                     path.read_text(), TARGET_DATE)
+        )
+    for path in sorted((FIXTURES_DIR / "pomona").glob("*.json")):
+        hall_id = path.name.split("_")[0]
+        workloads.append(
+            Workload("pomona", pomona.PomonaParser(hall_id, hall_id),
+                     path.read_text(), TARGET_DATE)
+        )
+    workloads.append(
+        Workload("sodexo", sodexo.SodexoParser("hoch", "Hoch"), build_page(), TARGET_DATE)
+    )
+    return workloads
+
+
+def synthetic_workloads(spec: SyntheticSpec) -> list[Workload]:
+    """One generated payload per vendor, shaped by ``spec``."""
+    return [
+        Workload("bonappetit", bonappetit.BonAppetitParser("collins", "Collins"),
+                 bamco_page(spec), spec.start_date),
+        Workload("pomona", pomona.PomonaParser("frank", "Frank"),
+                 eatec_json(spec), spec.start_date),
+        Workload("sodexo", sodexo.SodexoParser("hoch", "Hoch"),
+                 sodexo_page(spec), spec.start_date),
+    ]
+
+
+def _extract_fn(workload: Workload) -> Callable[[str], object]:
+    parser = workload.parser
+    if isinstance(parser, bonappetit.BonAppetitParser):
+        return parser._extract_bamco_objects
+    if isinstance(parser, sodexo.SodexoParser):
+        return parser._extract_json
+    if isinstance(parser, pomona.PomonaParser):
+        return parser._index_by_serve_date
+    raise TypeError(f"No extract step for {type(parser).__name__}")
+
+
+@contextmanager
+def _record_calls(module, name: str) -> Iterator[list[tuple]]:
+    """Record the positional args of every call to ``module.<name>``.
+
+    Records nothing if the module does not use ``name``.
+    """
+    calls: list[tuple] = []
+    original = getattr(module, name, None)
+    if original is None:
+        yield calls
+        return
+
+    def recorder(*args):
+        calls.append(args)
+        return original(*args)
+
+    setattr(module, name, recorder)
+    try:
+        yield calls
+    finally:
+        setattr(module, name, original)
+
+
+def build_cases(workloads: list[Workload]) -> list[Case]:
+    """Build the four benchmark cases for each vendor in ``workloads``."""
+    by_vendor: dict[str, list[Workload]] = {}
+    for workload in workloads:
+        by_vendor.setdefault(workload.vendor, []).append(workload)
+
+    cases = []
+    for vendor, group in by_vendor.items():
+        module = sys.modules[type(group[0].parser).__module__]
+        with (
+            _record_calls(module, "apply_station_filters") as filter_calls,
+            _record_calls(module, "normalize_dietary_tags") as tag_calls,
+        ):
+            for w in group:
+                w.parser.parse(w.raw, w.target_date)
+
+        cases.append(Case(vendor, "parse", lambda g=group: [
+            w.parser.parse(w.raw, w.target_date) for w in g
+        ]))
+        cases.append(Case(vendor, "extract", lambda g=group: [
+            _extract_fn(w)(w.raw) for w in g
+        ]))
+        cases.append(Case(vendor, "apply_station_filters", lambda c=filter_calls: [
+            apply_station_filters(*args) for args in c
+        ]))
+        if tag_calls:
+            cases.append(Case(vendor, "normalize_dietary_tags", lambda c=tag_calls: [
+                normalize_dietary_tags(*args) for args in c
+            ]))
+    return cases
+
+
+def _percentile(sorted_samples: list[float], pct: float) -> float:
+    return sorted_samples[min(len(sorted_samples) - 1, int(len(sorted_samples) * pct))]
+
+
+def _calibrate(fn: Callable[[], object]) -> int:
+    """Ops per timed sample so each sample lasts at least ``MIN_SAMPLE_SECONDS``."""
+    t0 = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t0
+    if elapsed >= MIN_SAMPLE_SECONDS:
+        return 1
+    return int(MIN_SAMPLE_SECONDS / max(elapsed, 1e-7)) + 1
+
+
+def measure(
+    case: Case, min_rounds: int, min_time: float, memory_repeats: int = MEMORY_REPEATS
+) -> dict[str, float]:
+    """Time ``case`` for at least ``min_rounds`` and ``min_time`` seconds.
+
+    Fast cases are batched so timer resolution and scheduling jitter do
+    not dominate; every sample is converted back to seconds per op. The
+    peak is the median over ``memory_repeats`` traced runs.
+    """
+    inner = _calibrate(case.fn)  # also warms up
+
+    samples: list[float] = []
+    start = time.perf_counter()
+    while len(samples) < min_rounds or time.perf_counter() - start < min_time:
+        t0 = time.perf_counter()
+        for _ in range(inner):
+            case.fn()
+        samples.append((time.perf_counter() - t0) / inner)
+
+    peaks: list[int] = []
+    for _ in range(memory_repeats):
+        tracemalloc.start()
+        case.fn()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peaks.append(peak)
+    peak = statistics.median(peaks)
+
+    samples.sort()
+    return {
+        "ops_per_sec": len(samples) / sum(samples),
+        "p50_ms": statistics.median(samples) * 1000,
+        "p99_ms": _percentile(samples, 0.99) * 1000,
+        "peak_kib": peak / 1024,
+        "rounds": len(samples),
+    }
+
+
+def compare(
+    results: dict[str, dict],
+    baseline: dict[str, dict],
+    time_threshold: float,
+    memory_threshold: float,
+) -> list[str]:
+    """Return a message for every case that regressed past a threshold."""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        for metric, threshold in (("p50_ms", time_threshold), ("peak_kib", memory_threshold)):
+            if base[metric] > 0 and result[metric] > base[metric] * (1 + threshold):
+                change = result[metric] / base[metric] - 1
+                regressions.append(
+                    f"{key}: {metric} {base[metric]:.2f} -> {result[metric]:.2f} "
+                    f"({change:+.0%}, threshold {threshold:.0%})"
+                )
+    return regressions
+
+
+def run(cases: list[Case], corpus: str, args: argparse.Namespace) -> int:
+    """Measure ``cases``, print a table, then save and/or compare."""
+    baseline = None
+    if args.compare:
+        saved = json.loads(Path(args.compare).read_text())
+        if saved.get("corpus", "fixtures") != corpus:
+            print(f"Baseline corpus {saved.get('corpus')!r} does not match {corpus!r}")
+            return 2
+        baseline = saved["results"]
+
+    print(f"corpus: {corpus}\n")
+
+    print(f"{'case':<38}{'ops/sec':>10}{'p50 ms':>10}{'p99 ms':>10}{'peak KiB':>10}{'vs base':>9}")
+    results: dict[str, dict] = {}
+    for case in cases:
+        r = results[case.key] = measure(
+            case, args.min_rounds, args.min_time, args.memory_repeats
+        )
+        delta = ""
+        if baseline and case.key in baseline:
+            delta = f"{r['p50_ms'] / baseline[case.key]['p50_ms'] - 1:+.0%}"
+        print(
+            f"{case.key:<38}{r['ops_per_sec']:>10.1f}{r['p50_ms']:>10.3f}"
+            f"{r['p99_ms']:>10.3f}{r['peak_kib']:>10.0f}{delta:>9}"
+        )
+
+    if args.save:
+        Path(args.save).write_text(json.dumps({
+            "created": _dt.datetime.now(_dt.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "machine": platform.platform(),
+            "corpus": corpus,
+            "results": results,
+        }, indent=2) + "\n")
+        print(f"\nBaseline saved to {args.save}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.time_threshold, args.memory_threshold)
+        if regressions:
+            print("\nRegressions:")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print("\nNo regressions against baseline.")
+    return 0
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--min-rounds", type=int, default=20)
+    arg_parser.add_argument("--min-time", type=float, default=0.5,
+                            help="minimum seconds to spend timing each case")
+    arg_parser.add_argument("--save", metavar="PATH", help="write results as a baseline")
+    arg_parser.add_argument("--compare", metavar="PATH", help="compare against a baseline")
+    arg_parser.add_argument("--synthetic", type=int, metavar="SCALE",
+                            help="use synthetic payloads, SCALE times a typical day")
+    arg_parser.add_argument("--synthetic-days", type=int, default=1,
+                            help="days per synthetic Sodexo/Pomona payload")
+    arg_parser.add_argument("--time-threshold", type=float, default=TIME_THRESHOLD)
+    arg_parser.add_argument("--memory-threshold", type=float, default=MEMORY_THRESHOLD)
+    arg_parser.add_argument("--memory-repeats", type=int, default=MEMORY_REPEATS,
+                            help="traced runs per case; the median peak is reported")
+    return arg_parser
+
+
+def main() -> None:
+    args = build_arg_parser().parse_args()
+    # Unknown-tag warnings would otherwise dominate both output and timings
+    logging.disable(logging.WARNING)
+    if args.synthetic:
+        spec = replace(SYNTHETIC_DAY, days=args.synthetic_days).scaled(args.synthetic)
+        workloads = synthetic_workloads(spec)
+        corpus = f"synthetic x{args.synthetic}, {args.synthetic_days} day(s)"
+    else:
+        workloads = fixture_workloads()
+        corpus = "fixtures"
+    sys.exit(run(build_cases(workloads), corpus, args))
+
+
+if __name__ == "__main__":
+    main()
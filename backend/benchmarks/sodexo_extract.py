@@ -0,0 +1,139 @@
+"""Sodexo #nutData extraction: targeted string scan vs full DOM build.
+
+No Sodexo page is recorded under ``tests/fixtures``, so this builds a
+synthetic page: a week of ``#nutData`` JSON (HTML-escaped, as Sodexo
+serves it) surrounded by page markup. Each path is timed in-process,
+and its memory is measured in a fresh subprocess -- both the
+Python-level peak (tracemalloc) and the resident-set growth while the
+path's working data is still alive, which also covers the DOM's C
+allocations (Linux only; reported as 0 elsewhere).
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.sodexo_extract [--repeat 20] [--items 40]
+"""
+
+import argparse
+import html
+import json
+import multiprocessing
+import os
+import statistics
+import time
+import tracemalloc
+
+from selectolax.parser import HTMLParser
+
+from app.parsers.sodexo import SodexoParser
+
+
+def build_page(items_per_station: int = 40, filler_rows: int = 3000) -> str:
+    """Build a synthetic Sodexo page with a week of menu JSON."""
+    days = [
+        {
+            "date": f"2026-02-{day:02d}T00:00:00",
+            "dayParts": [
+                {
+                    "dayPartName": meal,
+                    "courses": [
+                        {
+                            "courseName": f"STATION {station}",
+                            "menuItems": [
+                                {
+                                    "formalName": f"Item {day}-{meal}-{station}-{i}",
+                                    "description": "Served with rice & beans <house>",
+                                    "isVegan": i % 3 == 0,
+                                    "isVegetarian": i % 2 == 0,
+                                    "isMindful": False,
+                                    "calories": "350",
+                                }
+                                for i in range(items_per_station)
+                            ],
+                        }
+                        for station in range(8)
+                    ],
+                }
+                for meal in ("BREAKFAST", "LUNCH", "DINNER")
+            ],
+        }
+        for day in range(1, 8)
+    ]
+    filler = "".join(
+        f'<tr class="row"><td>Row {i}</td><td><a href="/x/{i}">link</a></td></tr>'
+        for i in range(filler_rows)
+    )
+    return (
+        "<html><head><title>Menu</title></head><body>"
+        f"<table>{filler}</table>"
+        f'<div id="nutData" class="hide">{html.escape(json.dumps(days))}</div>'
+        f"<table>{filler}</table></body></html>"
+    )
+
+
+def _scan_extract(page: str) -> tuple[object, str]:
+    return None, SodexoParser._scan_nutdata(page)
+
+
+def _dom_extract(page: str) -> tuple[object, str]:
+    tree = HTMLParser(page)
+    return tree, tree.css_first("#nutData").text().strip()
+
+
+# Each path returns (working data to keep alive, extracted text)
+PATHS = {
+    "scan": _scan_extract,
+    "dom": _dom_extract,
+}
+
+
+def _current_rss_kb() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        return 0
+
+
+def _measure_memory(path: str, items: int, queue) -> None:
+    """Subprocess body: report tracemalloc peak and RSS growth in KB."""
+    fn = PATHS[path]
+    page = build_page(items)
+    rss_before = _current_rss_kb()
+    tracemalloc.start()
+    working, _text = fn(page)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_growth = _current_rss_kb() - rss_before
+    del working
+    queue.put((peak / 1024, rss_growth))
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=20)
+    arg_parser.add_argument("--items", type=int, default=40)
+    args = arg_parser.parse_args()
+
+    page = build_page(args.items)
+    assert json.loads(PATHS["scan"](page)[1]) == json.loads(PATHS["dom"](page)[1])
+    print(f"page size: {len(page) / 1024:.0f} KB")
+
+    ctx = multiprocessing.get_context("spawn")
+    print(f"{'path':<6}{'p50 ms':>10}{'py peak KB':>12}{'rss +KB':>10}")
+    for name, fn in PATHS.items():
+        samples = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            fn(page)
+            samples.append((time.perf_counter() - start) * 1000)
+
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_measure_memory, args=(name, args.items, queue))
+        proc.start()
+        py_peak_kb, rss_kb = queue.get()
+        proc.join()
+        print(f"{name:<6}{statistics.median(samples):>10.2f}{py_peak_kb:>12.0f}{rss_kb:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Station filter pipeline: legacy per-call pipeline vs compiled engine.
+
+Runs a fixed, seeded set of station lists through the original
+``apply_station_filters`` implementation (alias/order maps rebuilt per
+call, O(n^2) sort key) and through ``CompiledStationFilter.apply`` for
+each vendor config, and checks both agree.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.station_filters [--stations 40] [--repeat 2000]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from app.models.menu import ParsedMenuItem, ParsedStation
+from app.parsers.station_filters import (
+    BONAPPETIT_FILTER,
+    POMONA_FILTER,
+    SODEXO_FILTER,
+    StationFilterConfig,
+    compile_station_filter,
+)
+from app.parsers.station_filters_reference import legacy_apply
+
+FILTERS = {
+    "SODEXO_FILTER": SODEXO_FILTER,
+    "BONAPPETIT_FILTER": BONAPPETIT_FILTER,
+    "POMONA_FILTER": POMONA_FILTER,
+}
+
+
+def build_stations(config: StationFilterConfig, count: int, seed: int) -> list[ParsedStation]:
+    """A seeded station list drawing names from everything ``config`` knows."""
+    names = set(config.hidden) | set(config.ordered) | set(config.truncated)
+    for canonical, aliases in config.combined.items():
+        names.add(canonical)
+        names.update(aliases)
+    names.update(f"Pop-Up {i}" for i in range(10))
+    names = sorted(names)
+
+    rng = random.Random(seed)
+    return [
+        ParsedStation(
+            name=rng.choice(names).title(),
+            items=[ParsedMenuItem(name=f"Item {i}-{j}", tags=[]) for j in range(rng.randint(1, 12))],
+        )
+        for i in range(count)
+    ]
+
+
+def _time_us(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--stations", type=int, default=40)
+    arg_parser.add_argument("--repeat", type=int, default=2000)
+    args = arg_parser.parse_args()
+
+    print(f"{'config':<20}{'legacy us':>11}{'compiled us':>13}{'speedup':>9}  same")
+    for label, config in FILTERS.items():
+        stations = build_stations(config, args.stations, seed=len(label))
+        compiled = compile_station_filter(config)
+        same = legacy_apply(stations, config) == compiled.apply(stations)
+        legacy_us = _time_us(lambda: legacy_apply(stations, config), args.repeat)
+        compiled_us = _time_us(lambda: compiled.apply(stations), args.repeat)
+        print(
+            f"{label:<20}{legacy_us:>11.1f}{compiled_us:>13.1f}"
+            f"{legacy_us / compiled_us:>8.2f}x  {same}"
+        )
+
+
+if __name__ == "__main__":
+    main()
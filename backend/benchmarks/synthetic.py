@@ -0,0 +1,269 @@
+"""Synthetic vendor payloads for scale testing.
+
+Builds payloads in each vendor's wire format, sized by a SyntheticSpec:
+
+* ``sodexo_page`` -- an HTML page with an HTML-escaped ``#nutData`` JSON
+  array (one entry per day)
+* ``bamco_page`` -- an HTML page with inline ``Bamco.menu_items`` /
+  ``Bamco.dayparts[...]`` assignments (Bon Appetit pages are one day,
+  so ``days`` is ignored)
+* ``eatec_json`` -- an EatecExchange feed (Pomona)
+
+Station names come from each vendor's ``ordered`` filter list, skipping
+hidden, truncated and aliased names, then ``Station N`` once those run
+out. That way every parsed meal has exactly ``stations`` stations of
+``items_per_station`` items. Output is deterministic for a given spec.
+
+Usage (from ``backend/``), writing one payload per vendor for load tests
+or a mock vendor server::
+
+    python -m benchmarks.synthetic --out /tmp/payloads --days 14 --stations 20 \\
+        --items-per-station 60 --tag-density 0.5 --payload-kib 2048
+"""
+
+import argparse
+import datetime as _dt
+import html
+import json
+import random
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from app.parsers.station_filters import (
+    BONAPPETIT_FILTER,
+    POMONA_FILTER,
+    SODEXO_FILTER,
+    StationFilterConfig,
+)
+
+
+@dataclass(frozen=True)
+class SyntheticSpec:
+    """Size and shape of a synthetic vendor payload."""
+
+    days: int = 1
+    meals: tuple[str, ...] = ("Breakfast", "Lunch", "Dinner")
+    stations: int = 8
+    items_per_station: int = 20
+    # Probability that an item carries each vendor dietary flag
+    tag_density: float = 0.3
+    # Pad the payload with inert markup/fields up to this size (0 = no padding)
+    payload_kib: int = 0
+    start_date: _dt.date = _dt.date(2026, 2, 7)
+    seed: int = 0
+
+    def scaled(self, factor: int) -> "SyntheticSpec":
+        """The same spec with ``factor`` times as many items per station."""
+        return replace(self, items_per_station=self.items_per_station * factor)
+
+    @property
+    def dates(self) -> list[_dt.date]:
+        return [self.start_date + _dt.timedelta(days=i) for i in range(self.days)]
+
+
+def _station_names(config: StationFilterConfig, count: int) -> list[str]:
+    """``count`` distinct station names that pass ``config`` untouched."""
+    blocked = {name.lower() for name in config.hidden}
+    blocked.update(name.lower() for name in config.truncated)
+    for canonical, aliases in config.combined.items():
+        blocked.add(canonical.lower())
+        blocked.update(alias.lower() for alias in aliases)
+
+    names: list[str] = []
+    for name in config.ordered:
+        # Bon Appetit strips a leading "@", which would collide names
+        if name.startswith("@") or name.lower() in blocked:
+            continue
+        if name.lower() not in {n.lower() for n in names}:
+            names.append(name)
+    names = names[:count]
+    names.extend(f"Station {i}" for i in range(len(names) + 1, count + 1))
+    return names
+
+
+def _item_name(rng: random.Random, day: int, meal: str, station: int, item: int) -> str:
+    # No commas or slashes: Pomona splits item names on them
+    adjective = rng.choice(("Roasted", "Grilled", "Braised", "Spiced", "Fresh", "Baked"))
+    noun = rng.choice(("Chicken", "Tofu", "Salmon", "Lentils", "Squash", "Rice", "Noodles"))
+    return f"{adjective} {noun} {day}-{meal[:2]}-{station}-{item}"
+
+
+def _pad_html(body: str, payload_kib: int) -> str:
+    """Wrap ``body`` in a page, adding filler rows up to ``payload_kib``."""
+    head = "<html><head><title>Menu</title></head><body>"
+    tail = "</body></html>"
+    missing = payload_kib * 1024 - len(head) - len(body) - len(tail)
+    row = '<tr class="row"><td>Nutrition info</td><td><a href="/n/0">details</a></td></tr>'
+    filler = f"<table>{row * (missing // len(row) + 1)}</table>" if missing > 0 else ""
+    return f"{head}{filler}{body}{tail}"
+
+
+def sodexo_page(spec: SyntheticSpec) -> str:
+    """A Sodexo menu page whose ``#nutData`` covers ``spec.days`` days."""
+    rng = random.Random(spec.seed)
+    names = _station_names(SODEXO_FILTER, spec.stations)
+    days = [
+        {
+            "date": f"{day.isoformat()}T00:00:00",
+            "dayParts": [
+                {
+                    "dayPartName": meal.upper(),
+                    "courses": [
+                        {
+                            "courseName": name.upper(),
+                            "menuItems": [
+                                {
+                                    "formalName": _item_name(rng, d, meal, s, i),
+                                    "description": "Served with rice & beans",
+                                    "isVegan": rng.random() < spec.tag_density,
+                                    "isVegetarian": rng.random() < spec.tag_density,
+                                    "isMindful": rng.random() < spec.tag_density,
+                                    "calories": str(rng.randint(80, 900)),
+                                }
+                                for i in range(spec.items_per_station)
+                            ],
+                        }
+                        for s, name in enumerate(names)
+                    ],
+                }
+                for meal in spec.meals
+            ],
+        }
+        for d, day in enumerate(spec.dates)
+    ]
+    blob = f'<div id="nutData" class="hide">{html.escape(json.dumps(days))}</div>'
+    return _pad_html(blob, spec.payload_kib)
+
+
+_BAMCO_ICONS = (
+    ("1", "Vegetarian"),
+    ("4", "Vegan"),
+    ("9", "Made without Gluten-Containing Ingredients"),
+    ("18", "Farm to Fork"),
+)
+
+
+def bamco_page(spec: SyntheticSpec) -> str:
+    """A Bon Appetit cafe page with inline ``Bamco`` menu objects (one day)."""
+    rng = random.Random(spec.seed)
+    names = _station_names(BONAPPETIT_FILTER, spec.stations)
+    menu_items: dict[str, dict] = {}
+    dayparts: dict[str, dict] = {}
+    next_id = 1_000_000
+
+    for m, meal in enumerate(spec.meals, start=1):
+        stations = []
+        for s, name in enumerate(names):
+            item_ids = []
+            for i in range(spec.items_per_station):
+                item_id = str(next_id)
+                next_id += 1
+                menu_items[item_id] = {
+                    "id": item_id,
+                    "label": _item_name(rng, 0, meal, s, i).lower(),
+                    "description": "seasonal vegetables; house sauce",
+                    "cor_icon": {
+                        icon_id: label
+                        for icon_id, label in _BAMCO_ICONS
+                        if rng.random() < spec.tag_density
+                    },
+                    "special": 1,
+                    "station": f"<strong>@{name}</strong>",
+                }
+                item_ids.append(item_id)
+            stations.append({"id": str(s), "label": name, "items": item_ids})
+        dayparts[str(m)] = {"id": str(m), "label": meal, "stations": stations}
+
+    script = ["<script>(function() {", "Bamco = {};"]
+    script.append(f"Bamco.menu_items = {json.dumps(menu_items)};")
+    for daypart_id, daypart in dayparts.items():
+        script.append(f"Bamco.dayparts['{daypart_id}'] = {json.dumps(daypart)};")
+    script.append("})();</script>")
+    return _pad_html("\n".join(script), spec.payload_kib)
+
+
+_EATEC_CHOICES = ("Vegetarian", "Vegan", "Gluten Free")
+
+
+def eatec_json(spec: SyntheticSpec) -> str:
+    """An EatecExchange feed (Pomona) covering ``spec.days`` days."""
+    rng = random.Random(spec.seed)
+    names = _station_names(POMONA_FILTER, spec.stations)
+    entries = [
+        {
+            "@servedate": day.strftime("%Y%m%d"),
+            "@mealperiodname": meal,
+            "@menubulletin": "",
+            "recipes": {
+                "recipe": [
+                    {
+                        "@category": name,
+                        "@shortName": _item_name(rng, d, meal, s, i),
+                        "@displayonwebsite": "Y",
+                        "dietaryChoices": {
+                            "dietaryChoice": [
+                                {
+                                    "@id": choice,
+                                    "#text": "Yes" if rng.random() < spec.tag_density else "No",
+                                }
+                                for choice in _EATEC_CHOICES
+                            ]
+                        },
+                    }
+                    for s, name in enumerate(names)
+                    for i in range(spec.items_per_station)
+                ]
+            },
+        }
+        for d, day in enumerate(spec.dates)
+        for meal in spec.meals
+    ]
+    feed = {"EatecExchange": {"menu": entries}}
+    raw = json.dumps(feed)
+
+    # Pad with an ignored per-recipe attribute, as real feeds carry many
+    missing = spec.payload_kib * 1024 - len(raw)
+    recipes = [r for entry in entries for r in entry["recipes"]["recipe"]]
+    overhead = len(', "@nutritionnotes": ""')
+    if missing > 0 and recipes:
+        note = "x" * max(0, missing // len(recipes) - overhead + 1)
+        for recipe in recipes:
+            recipe["@nutritionnotes"] = note
+        raw = json.dumps(feed)
+    return raw
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--out", type=Path, required=True, help="output directory")
+    arg_parser.add_argument("--days", type=int, default=SyntheticSpec.days)
+    arg_parser.add_argument("--stations", type=int, default=SyntheticSpec.stations)
+    arg_parser.add_argument(
+        "--items-per-station", type=int, default=SyntheticSpec.items_per_station
+    )
+    arg_parser.add_argument("--tag-density", type=float, default=SyntheticSpec.tag_density)
+    arg_parser.add_argument("--payload-kib", type=int, default=SyntheticSpec.payload_kib)
+    arg_parser.add_argument("--seed", type=int, default=SyntheticSpec.seed)
+    args = arg_parser.parse_args()
+
+    spec = SyntheticSpec(
+        days=args.days,
+        stations=args.stations,
+        items_per_station=args.items_per_station,
+        tag_density=args.tag_density,
+        payload_kib=args.payload_kib,
+        seed=args.seed,
+    )
+    args.out.mkdir(parents=True, exist_ok=True)
+    for filename, build in (
+        ("sodexo_synthetic.html", sodexo_page),
+        ("bonappetit_synthetic.html", bamco_page),
+        ("pomona_synthetic.json", eatec_json),
+    ):
+        payload = build(spec)
+        (args.out / filename).write_text(payload)
+        print(f"{filename:<28}{len(payload) / 1024:>10.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
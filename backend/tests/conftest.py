@@ -1,5 +1,6 @@
 import datetime as _dt
 from datetime import date
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fakeredis import FakeAsyncRedis
@@ -7,7 +8,7 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 
-from app.dependencies import get_redis, get_session
+from app.dependencies import get_redis, get_session, get_session_factory
 from app.main import app
 from app.models.dining_hall import DiningHall
 from app.models.dining_hours import DiningHours, DiningHoursOverride
@@ -18,6 +19,25 @@ from app.models.menu import (
     ParsedMenuItem,
     ParsedStation,
 )
+from app.parsers.base import BaseParser, StageTimings
+from app.services.cache import reset_l1_cache
+from app.services.host_limiter import reset_host_limiters
+
+
+@pytest.fixture(autouse=True)
+def _reset_host_limiters():
+    """Start every test with fresh per-host limiters (they hold loop-bound locks)."""
+    reset_host_limiters()
+    yield
+    reset_host_limiters()
+
+
+@pytest.fixture(autouse=True)
+def _reset_l1_cache():
+    """Keep the in-process L1 from carrying entries between tests' Redis instances."""
+    reset_l1_cache()
+    yield
+    reset_l1_cache()
 
 
 # ---------------------------------------------------------------------------
@@ -100,6 +120,28 @@ def make_parsed_menu():
     return _make
 
 
+@pytest.fixture
+def make_mock_parser():
+    """Factory fixture for parser mocks with the attributes the fallback path reads."""
+
+    def _make(
+        result: ParsedMenu | None = None,
+        *,
+        side_effect=None,
+        vendor_host: str = "vendor.example.com",
+        sibling_menus: list[ParsedMenu] | None = None,
+        timings: StageTimings | None = None,
+    ) -> MagicMock:
+        parser = MagicMock(spec=BaseParser)
+        parser.vendor_host = vendor_host
+        parser.sibling_menus = sibling_menus or []
+        parser.timings = timings or StageTimings()
+        parser.fetch_and_parse = AsyncMock(return_value=result, side_effect=side_effect)
+        return parser
+
+    return _make
+
+
 # ---------------------------------------------------------------------------
 # Phase 2 integration-test fixtures
 # ---------------------------------------------------------------------------
@@ -207,13 +249,16 @@ async def seed_menu(test_session, seed_halls):
 
 
 @pytest.fixture
-async def client(test_session, fake_redis):
+async def client(test_engine, test_session, fake_redis):
     """Async HTTP client with dependency overrides for session and redis."""
 
     async def _override_session():
         yield test_session
 
     app.dependency_overrides[get_session] = _override_session
+    app.dependency_overrides[get_session_factory] = lambda: async_sessionmaker(
+        test_engine, class_=AsyncSession, expire_on_commit=False
+    )
     app.dependency_overrides[get_redis] = lambda: fake_redis
 
     transport = ASGITransport(app=app)
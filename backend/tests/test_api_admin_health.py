@@ -0,0 +1,100 @@
+"""Integration tests for the admin health and cache stats endpoints."""
+
+import datetime as _dt
+
+import pytest
+
+from app.main import app
+from app.models.parser_run import ParserRun
+from app.services.auth_service import require_admin
+from app.services.cache import cache_get_entry, cache_set
+
+
+@pytest.fixture
+def admin(client):
+    app.dependency_overrides[require_admin] = lambda: "admin@example.com"
+    yield client
+    app.dependency_overrides.pop(require_admin, None)
+
+
+async def test_health_reports_stage_percentiles(admin, test_session, seed_halls) -> None:
+    now = _dt.datetime.now(_dt.timezone.utc)
+    for fetch_ms in range(1, 21):
+        test_session.add(
+            ParserRun(
+                hall_id="collins",
+                started_at=now,
+                duration_ms=fetch_ms + 10,
+                status="success",
+                fetch_ms=fetch_ms,
+                parse_ms=5,
+            )
+        )
+    # Runs recorded before stage timings existed have no stage columns
+    test_session.add(ParserRun(hall_id="frank", started_at=now, duration_ms=50, status="error"))
+    await test_session.commit()
+
+    response = await admin.get("/api/v2/admin/health")
+
+    assert response.status_code == 200
+    by_hall = {entry["hall_id"]: entry for entry in response.json()}
+    collins = by_hall["collins"]["stage_latency"]
+    assert collins["fetch"] == {"p50_ms": 10, "p95_ms": 19}
+    assert collins["parse"] == {"p50_ms": 5, "p95_ms": 5}
+    assert collins["total"] == {"p50_ms": 20, "p95_ms": 29}
+    assert "persist" not in collins
+    assert by_hall["frank"]["stage_latency"] == {"total": {"p50_ms": 50, "p95_ms": 50}}
+
+
+async def test_health_reports_open_breaker(admin, test_session, seed_halls, fake_redis) -> None:
+    test_session.add(
+        ParserRun(
+            hall_id="collins",
+            started_at=_dt.datetime.now(_dt.timezone.utc),
+            status="fallback",
+        )
+    )
+    await test_session.commit()
+    await fake_redis.hset(
+        "breaker:collins-cmc.cafebonappetit.com",
+        mapping={"failures": 5, "opened_at": _dt.datetime.now().timestamp()},
+    )
+
+    response = await admin.get("/api/v2/admin/health")
+
+    (breaker,) = response.json()[0]["breakers"]
+    assert breaker["host"] == "collins-cmc.cafebonappetit.com"
+    assert breaker["state"] == "open"
+    assert breaker["failures"] == 5
+    assert breaker["opened_at"] is not None
+
+
+async def test_health_reports_every_pomona_host(admin, test_session, seed_halls) -> None:
+    test_session.add(
+        ParserRun(
+            hall_id="frary",
+            started_at=_dt.datetime.now(_dt.timezone.utc),
+            status="success",
+        )
+    )
+    await test_session.commit()
+
+    response = await admin.get("/api/v2/admin/health")
+
+    breakers = response.json()[0]["breakers"]
+    assert [b["host"] for b in breakers] == ["www.pomona.edu", "my.pomona.edu"]
+    assert all(b["state"] == "closed" for b in breakers)
+
+
+async def test_cache_stats_endpoint(admin, fake_redis) -> None:
+    await cache_set(fake_redis, "menu:hoch:2026-02-07:lunch", {"meal": "lunch"})
+    await cache_get_entry(fake_redis, "menu:hoch:2026-02-07:lunch")
+    await cache_get_entry(fake_redis, "menu:hoch:2026-02-07:dinner")
+
+    response = await admin.get("/api/v2/admin/cache")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["hits"], body["misses"], body["hit_rate"]) == (1, 1, 50.0)
+    assert body["entries"] == 1
+    assert body["bytes"] > 0
@@ -1,21 +1,27 @@
 """Integration tests for the /api/v2/menus endpoint."""
 
+import asyncio
 import datetime as _dt
+import json
+import time
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from app.parsers.base import StageTimings
+from app.services.background import drain_background_tasks
+from app.services.cache import FALLBACK_TTL
+
 
 @pytest.mark.asyncio
-async def test_get_menu_from_db(client, seed_menu):
+async def test_get_menu_from_db(client, seed_menu, make_mock_parser):
     """GET /api/v2/menus with valid params returns menu from DB fallback."""
     today = _dt.date.today().isoformat()
 
     with patch(
         "app.services.menu_service.get_parser"
     ) as mock_get_parser:
-        mock_parser = AsyncMock()
-        mock_parser.fetch_and_parse = AsyncMock(return_value=None)
+        mock_parser = make_mock_parser()
         mock_get_parser.return_value = mock_parser
 
         resp = await client.get(
@@ -56,13 +62,12 @@ async def test_get_menu_invalid_date(client):
 
 
 @pytest.mark.asyncio
-async def test_get_menu_not_found(client, seed_halls):
+async def test_get_menu_not_found(client, seed_halls, make_mock_parser):
     """GET /api/v2/menus for a date with no data returns 404."""
     with patch(
         "app.services.menu_service.get_parser"
     ) as mock_get_parser:
-        mock_parser = AsyncMock()
-        mock_parser.fetch_and_parse = AsyncMock(return_value=None)
+        mock_parser = make_mock_parser()
         mock_get_parser.return_value = mock_parser
 
         resp = await client.get(
@@ -75,15 +80,16 @@ async def test_get_menu_not_found(client, seed_halls):
 
 
 @pytest.mark.asyncio
-async def test_menu_cached_on_second_request(client, seed_menu, fake_redis):
+async def test_menu_cached_on_second_request(
+    client, seed_menu, fake_redis, make_mock_parser
+):
     """First request populates cache; second request finds cache hit."""
     today = _dt.date.today().isoformat()
 
     with patch(
         "app.services.menu_service.get_parser"
     ) as mock_get_parser:
-        mock_parser = AsyncMock()
-        mock_parser.fetch_and_parse = AsyncMock(return_value=None)
+        mock_parser = make_mock_parser()
         mock_get_parser.return_value = mock_parser
 
         # First request: cache miss -> falls through to DB
@@ -93,8 +99,8 @@ async def test_menu_cached_on_second_request(client, seed_menu, fake_redis):
         )
         assert resp1.status_code == 200
 
-        # Check that the cache key now exists
-        cache_key = f"menu:hoch:{today}:lunch"
+        # Check that the day's cache key now exists
+        cache_key = f"menu:hoch:{today}"
         cached_value = await fake_redis.get(cache_key)
         assert cached_value is not None
 
@@ -109,15 +115,14 @@ async def test_menu_cached_on_second_request(client, seed_menu, fake_redis):
 
 
 @pytest.mark.asyncio
-async def test_menu_response_shape(client, seed_menu):
+async def test_menu_response_shape(client, seed_menu, make_mock_parser):
     """Response matches MenuResponse schema structure."""
     today = _dt.date.today().isoformat()
 
     with patch(
         "app.services.menu_service.get_parser"
     ) as mock_get_parser:
-        mock_parser = AsyncMock()
-        mock_parser.fetch_and_parse = AsyncMock(return_value=None)
+        mock_parser = make_mock_parser()
         mock_get_parser.return_value = mock_parser
 
         resp = await client.get(
@@ -146,3 +151,177 @@ async def test_menu_response_shape(client, seed_menu):
             assert "tags" in item
             assert isinstance(item["name"], str)
             assert isinstance(item["tags"], list)
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_served_while_one_refresh_runs(
+    client, seed_halls, fake_redis, make_parsed_menu, make_mock_parser
+):
+    """Past its soft expiry, the cached menu is returned and refreshed once."""
+    today = _dt.date.today()
+    cache_key = f"menu:hoch:{today.isoformat()}"
+    stale = {
+        "hall_id": "hoch",
+        "date": today.isoformat(),
+        "meal": "lunch",
+        "stations": [{"name": "Old Station", "items": []}],
+        "is_stale": False,
+        "fetched_at": None,
+        "content_hash": "old",
+    }
+    await fake_redis.set(
+        cache_key,
+        json.dumps({"data": {"meals": {"lunch": stale}}, "soft_expires_at": time.time() - 1}),
+    )
+
+    with patch("app.services.menu_service.get_parser") as mock_get_parser:
+        mock_parser = make_mock_parser()
+        mock_parser.fetch_and_parse = AsyncMock(
+            return_value=make_parsed_menu(target_date=today)
+        )
+        mock_get_parser.return_value = mock_parser
+
+        responses = await asyncio.gather(*(
+            client.get(
+                "/api/v2/menus/",
+                params={"hall_id": "hoch", "date": today.isoformat(), "meal": "lunch"},
+            )
+            for _ in range(3)
+        ))
+        assert [r.json() for r in responses] == [stale] * 3
+
+        await drain_background_tasks(timeout=5)
+
+    mock_parser.fetch_and_parse.assert_awaited_once()
+    refreshed = json.loads(await fake_redis.get(cache_key))
+    assert refreshed["soft_expires_at"] > time.time()
+    lunch = refreshed["data"]["meals"]["lunch"]
+    assert lunch["is_stale"] is False
+    assert lunch["stations"][0]["name"] == "Exhibition"
+
+
+@pytest.mark.asyncio
+async def test_missing_meal_served_from_day_document(
+    client, seed_menu, fake_redis, make_mock_parser
+):
+    """A meal the hall doesn't serve 404s from the cached day on repeat requests."""
+    today = _dt.date.today().isoformat()
+    params = {"hall_id": "hoch", "date": today, "meal": "breakfast"}
+
+    with patch("app.services.menu_service.get_parser") as mock_get_parser:
+        mock_parser = make_mock_parser()
+        mock_get_parser.return_value = mock_parser
+
+        first = await client.get("/api/v2/menus/", params=params)
+        second = await client.get("/api/v2/menus/", params=params)
+
+    assert first.status_code == second.status_code == 404
+    mock_parser.fetch_and_parse.assert_awaited_once()
+    cached = json.loads(await fake_redis.get(f"menu:hoch:{today}"))
+    assert list(cached["data"]["meals"]) == ["lunch"]
+    # Served from the database after a failed fetch: retried soon
+    assert cached["soft_expires_at"] <= time.time() + FALLBACK_TTL
+
+
+@pytest.mark.asyncio
+async def test_day_without_menu_is_negatively_cached(
+    client, seed_halls, fake_redis, make_mock_parser
+):
+    """A day the vendor has no menu for 404s from Redis on repeat requests."""
+    today = _dt.date.today().isoformat()
+
+    with patch("app.services.menu_service.get_parser") as mock_get_parser:
+        mock_parser = make_mock_parser(
+            timings=StageTimings(fetch_ms=100, parse_ms=10, validate_ms=0, no_menu=True)
+        )
+        mock_get_parser.return_value = mock_parser
+
+        for meal in ("breakfast", "lunch"):
+            resp = await client.get(
+                "/api/v2/menus/", params={"hall_id": "hoch", "date": today, "meal": meal}
+            )
+            assert resp.status_code == 404
+
+    mock_parser.fetch_and_parse.assert_awaited_once()
+    cached = json.loads(await fake_redis.get(f"menu:hoch:{today}"))
+    assert cached["data"] is None
+    assert 0 < await fake_redis.ttl(f"menu:hoch:{today}") <= 300
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_is_not_negatively_cached(
+    client, seed_halls, fake_redis, make_mock_parser
+):
+    """A vendor failure 404s without blanking the hall: the next request refetches."""
+    today = _dt.date.today().isoformat()
+    params = {"hall_id": "hoch", "date": today, "meal": "lunch"}
+
+    with patch("app.services.menu_service.get_parser") as mock_get_parser:
+        mock_parser = make_mock_parser(timings=StageTimings(fetch_ms=3000, fetch_failed=True))
+        mock_get_parser.return_value = mock_parser
+
+        first = await client.get("/api/v2/menus/", params=params)
+        second = await client.get("/api/v2/menus/", params=params)
+
+    assert first.status_code == second.status_code == 404
+    assert mock_parser.fetch_and_parse.await_count == 2
+    assert await fake_redis.get(f"menu:hoch:{today}") is None
+
+
+@pytest.mark.asyncio
+async def test_invalid_menu_is_not_negatively_cached(
+    client, seed_halls, fake_redis, make_mock_parser
+):
+    """A menu that fails validation is a parser failure, not a day without a menu."""
+    today = _dt.date.today().isoformat()
+    params = {"hall_id": "hoch", "date": today, "meal": "lunch"}
+
+    with patch("app.services.menu_service.get_parser") as mock_get_parser:
+        mock_parser = make_mock_parser(
+            timings=StageTimings(fetch_ms=100, parse_ms=10, validate_ms=0)
+        )
+        mock_get_parser.return_value = mock_parser
+
+        first = await client.get("/api/v2/menus/", params=params)
+        second = await client.get("/api/v2/menus/", params=params)
+
+    assert first.status_code == second.status_code == 404
+    assert mock_parser.fetch_and_parse.await_count == 2
+    assert await fake_redis.get(f"menu:hoch:{today}") is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_meals_share_one_fetch(
+    client, seed_halls, make_parsed_menu, make_mock_parser
+):
+    """Breakfast, lunch and dinner misses for one hall/day trigger a single scrape."""
+    today = _dt.date.today()
+    fetched = asyncio.Event()
+
+    async def _slow_fetch(target_date):
+        await fetched.wait()
+        return make_parsed_menu(
+            target_date=target_date,
+            meals=[
+                {"meal": meal, "stations": [{"name": "Grill", "items": []}]}
+                for meal in ("breakfast", "lunch", "dinner")
+            ],
+        )
+
+    with patch("app.services.menu_service.get_parser") as mock_get_parser:
+        mock_parser = make_mock_parser(side_effect=_slow_fetch)
+        mock_get_parser.return_value = mock_parser
+
+        requests = asyncio.gather(*(
+            client.get(
+                "/api/v2/menus/",
+                params={"hall_id": "hoch", "date": today.isoformat(), "meal": meal},
+            )
+            for meal in ("breakfast", "lunch", "dinner")
+        ))
+        await asyncio.sleep(0.05)
+        fetched.set()
+        responses = await requests
+
+    mock_parser.fetch_and_parse.assert_awaited_once()
+    assert [r.json()["meal"] for r in responses] == ["breakfast", "lunch", "dinner"]
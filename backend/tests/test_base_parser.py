@@ -0,0 +1,195 @@
+"""Unit tests for the shared BaseParser fetch pipeline.
+
+Uses httpx.MockTransport -- no network calls.
+"""
+
+import json
+from datetime import date
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.parsers import base
+from app.parsers.pomona import PomonaParser
+
+TARGET_DATE = date(2026, 2, 7)
+JSON_URL = "https://my.pomona.edu/eatec/Frank.json"
+
+
+def _feed() -> str:
+    return json.dumps(
+        {
+            "EatecExchange": {
+                "menu": [
+                    {
+                        "@servedate": "20260207",
+                        "@mealperiodname": "Lunch",
+                        "@menubulletin": "",
+                        "recipes": {
+                            "recipe": [
+                                {
+                                    "@category": "Entree",
+                                    "@shortName": "Test Item",
+                                    "@displayonwebsite": "Y",
+                                }
+                            ]
+                        },
+                    }
+                ]
+            }
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    """Response and parse caches are module-wide; isolate each test."""
+    base.reset_fetch_caches()
+    yield
+    base.reset_fetch_caches()
+
+
+def _parser_for(handler) -> tuple[PomonaParser, httpx.AsyncClient]:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    parser = PomonaParser("frank", "Frank", client=client)
+    parser.fetch_raw = lambda target_date: parser._get(JSON_URL)  # type: ignore[method-assign]
+    return parser, client
+
+
+async def test_conditional_get_sends_validators_and_reuses_body() -> None:
+    """A 304 returns the stored body after sending If-None-Match/If-Modified-Since."""
+    seen_headers: list[httpx.Headers] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers)
+        if len(seen_headers) == 1:
+            return httpx.Response(
+                200,
+                text=_feed(),
+                headers={"ETag": '"v1"', "Last-Modified": "Sat, 07 Feb 2026 08:00:00 GMT"},
+            )
+        return httpx.Response(304)
+
+    parser, client = _parser_for(handler)
+    async with client:
+        first = await parser._get(JSON_URL)
+        second = await parser._get(JSON_URL)
+
+    assert second is first
+    assert "If-None-Match" not in seen_headers[0]
+    assert seen_headers[1]["If-None-Match"] == '"v1"'
+    assert seen_headers[1]["If-Modified-Since"] == "Sat, 07 Feb 2026 08:00:00 GMT"
+
+
+async def test_not_modified_skips_parse() -> None:
+    """fetch_and_parse reuses the previous ParsedMenu when the vendor returns 304."""
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return httpx.Response(200, text=_feed(), headers={"ETag": '"v1"'})
+        return httpx.Response(304)
+
+    parser, client = _parser_for(handler)
+    async with client:
+        first = await parser.fetch_and_parse(TARGET_DATE)
+        with patch.object(PomonaParser, "parse_all") as mock_parse_all:
+            second = await parser.fetch_and_parse(TARGET_DATE)
+
+    mock_parse_all.assert_not_called()
+    assert first is not None
+    assert second is first
+
+
+async def test_response_without_validators_not_cached() -> None:
+    """Responses without ETag/Last-Modified are never sent conditionally."""
+    seen_headers: list[httpx.Headers] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers)
+        return httpx.Response(200, text=_feed())
+
+    parser, client = _parser_for(handler)
+    async with client:
+        await parser._get(JSON_URL)
+        await parser._get(JSON_URL)
+
+    assert "If-None-Match" not in seen_headers[1]
+    assert JSON_URL not in base._response_cache
+
+
+async def test_response_cache_evicts_to_byte_limit(monkeypatch) -> None:
+    """Stored bodies are evicted oldest-first once their total size passes the limit."""
+    body = _feed()
+    monkeypatch.setattr(base, "_response_cache_max_bytes", len(body.encode()) * 3 // 2)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=body, headers={"ETag": '"v1"'})
+
+    parser, client = _parser_for(handler)
+    async with client:
+        await parser._get(JSON_URL)
+        await parser._get(JSON_URL + "?week=2")
+
+    assert list(base._response_cache) == [JSON_URL + "?week=2"]
+    assert base._response_cache_bytes == len(body.encode())
+
+
+async def test_fetch_and_parse_records_stage_timings() -> None:
+    """fetch_and_parse fills fetch/parse/validate timings and payload stats."""
+    body = _feed()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=body)
+
+    parser, client = _parser_for(handler)
+    async with client:
+        menu = await parser.fetch_and_parse(TARGET_DATE)
+
+    assert menu is not None
+    timings = parser.timings
+    assert timings.fetch_ms is not None
+    assert timings.parse_ms is not None
+    assert timings.validate_ms is not None
+    assert timings.payload_size == len(body)
+    assert timings.item_count == 1
+    assert timings.persist_ms is None
+
+
+async def test_failed_fetch_still_records_fetch_time() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503)
+
+    parser, client = _parser_for(handler)
+    async with client:
+        assert await parser.fetch_and_parse(TARGET_DATE) is None
+
+    assert parser.timings.fetch_ms is not None
+    assert parser.timings.parse_ms is None
+
+
+async def test_day_without_meals_is_reported_as_no_menu() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=_feed())
+
+    parser, client = _parser_for(handler)
+    async with client:
+        assert await parser.fetch_and_parse(date(2026, 2, 8)) is None
+
+    assert parser.timings.no_menu
+
+
+async def test_invalid_menu_is_not_reported_as_no_menu() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=_feed())
+
+    parser, client = _parser_for(handler)
+    async with client:
+        with patch.object(PomonaParser, "validate", return_value=False):
+            assert await parser.fetch_and_parse(TARGET_DATE) is None
+
+    assert parser.timings.validate_ms is not None
+    assert not parser.timings.no_menu
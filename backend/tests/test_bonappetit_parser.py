@@ -100,6 +100,29 @@ class TestBamcoRegexExtraction:
             collins_parser.parse(html, TARGET_DATE)
 
 
+    def test_bamco_extraction_semicolon_in_description(self, collins_parser):
+        """Semicolons and braces inside strings do not truncate the objects."""
+        menu_items = {
+            "1": {
+                "label": "Pho",
+                "description": "Broth; noodles {house-made}; herbs",
+                "special": 1,
+                "cor_icon": {},
+            }
+        }
+        daypart = {"label": "Lunch", "stations": [{"label": "Global", "items": ["1"]}]}
+        html = (
+            "<script>"
+            f"Bamco.menu_items = {json.dumps(menu_items)};"
+            "Bamco.menu_items_nonce = 'abc';"
+            f"Bamco.dayparts['3'] = {json.dumps(daypart)};"
+            "</script>"
+        )
+        menu = collins_parser.parse(html, TARGET_DATE)
+        assert menu.meals[0].meal == "lunch"
+        assert menu.meals[0].stations[0].items[0].name == "Pho"
+
+
 class TestBamcoAllHalls:
     """Test that all 3 BAMCO halls parse successfully."""
 
@@ -0,0 +1,148 @@
+"""Unit tests for the cache envelope, soft expiry, early refresh and L1."""
+
+import json
+import time
+from unittest.mock import patch
+
+from app.services.cache import (
+    BASE_TTL,
+    JITTER_RANGE,
+    L1_TTL,
+    NEGATIVE_TTL,
+    STALE_TTL,
+    CacheEntry,
+    cache_get,
+    cache_get_entry,
+    cache_set,
+    cache_set_negative,
+    l1_stats,
+)
+
+
+async def test_set_stores_soft_expiry_inside_hard_ttl(fake_redis) -> None:
+    await cache_set(fake_redis, "menu:hoch:2026-02-07:lunch", {"meal": "lunch"})
+
+    entry = await cache_get_entry(fake_redis, "menu:hoch:2026-02-07:lunch")
+    assert entry.data == {"meal": "lunch"}
+    assert not entry.is_stale
+    soft_ttl = entry.soft_expires_at - time.time()
+    assert BASE_TTL - JITTER_RANGE - 1 <= soft_ttl <= BASE_TTL + JITTER_RANGE
+    hard_ttl = await fake_redis.ttl("menu:hoch:2026-02-07:lunch")
+    assert hard_ttl >= soft_ttl + STALE_TTL - 1
+
+
+async def test_entry_past_soft_expiry_is_stale_but_readable(fake_redis) -> None:
+    await fake_redis.set(
+        "k", json.dumps({"data": {"meal": "dinner"}, "soft_expires_at": time.time() - 5})
+    )
+
+    entry = await cache_get_entry(fake_redis, "k")
+    assert entry.is_stale
+    assert await cache_get(fake_redis, "k") == {"meal": "dinner"}
+
+
+async def test_pre_envelope_values_are_fresh(fake_redis) -> None:
+    await fake_redis.set("k", json.dumps({"meal": "lunch"}))
+
+    entry = await cache_get_entry(fake_redis, "k")
+    assert entry.data == {"meal": "lunch"}
+    assert not entry.is_stale
+
+
+async def test_missing_key(fake_redis) -> None:
+    assert await cache_get_entry(fake_redis, "missing") is None
+
+
+def test_should_refresh_scales_with_compute_time_and_proximity() -> None:
+    now = time.time()
+    far = CacheEntry(data={}, soft_expires_at=now + 600, compute_time=0.5)
+    near_cheap = CacheEntry(data={}, soft_expires_at=now + 1, compute_time=0.01)
+    near_costly = CacheEntry(data={}, soft_expires_at=now + 1, compute_time=5.0)
+
+    with patch("app.services.cache.random.random", return_value=0.5):
+        # expected lead is compute_time * ln 2
+        assert not far.should_refresh()
+        assert not near_cheap.should_refresh()
+        assert near_costly.should_refresh()
+        assert not near_costly.should_refresh(beta=0)
+
+
+def test_should_refresh_without_compute_time_waits_for_soft_expiry() -> None:
+    now = time.time()
+    assert not CacheEntry(data={}, soft_expires_at=now + 1).should_refresh(beta=100)
+    assert CacheEntry(data={}, soft_expires_at=now - 1).should_refresh(beta=0)
+
+
+async def test_compute_time_round_trips(fake_redis) -> None:
+    await cache_set(fake_redis, "k", {"meal": "lunch"}, compute_time=1.23456)
+
+    entry = await cache_get_entry(fake_redis, "k")
+    assert entry.compute_time == 1.235
+
+
+async def test_negative_entry(fake_redis) -> None:
+    await cache_set_negative(fake_redis, "k")
+
+    entry = await cache_get_entry(fake_redis, "k")
+    assert entry.is_negative
+    assert await cache_get(fake_redis, "k") is None
+    assert 0 < await fake_redis.ttl("k") <= NEGATIVE_TTL
+
+
+async def test_l1_serves_repeat_reads_without_redis(fake_redis) -> None:
+    await fake_redis.set("k", json.dumps({"data": {"meal": "lunch"}, "soft_expires_at": 1e12}))
+
+    first = await cache_get_entry(fake_redis, "k")
+    await fake_redis.delete("k")
+    second = await cache_get_entry(fake_redis, "k")
+
+    assert second is first
+    stats = l1_stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+
+async def test_l1_replaced_on_write(fake_redis) -> None:
+    await cache_set(fake_redis, "k", {"meal": "lunch"})
+    assert (await cache_get_entry(fake_redis, "k")).data == {"meal": "lunch"}
+
+    await cache_set_negative(fake_redis, "k")
+
+    assert (await cache_get_entry(fake_redis, "k")).is_negative
+    assert l1_stats().entries == 1
+
+
+async def test_l1_expires_after_ttl(fake_redis) -> None:
+    await cache_set(fake_redis, "k", {"meal": "lunch"})
+    await fake_redis.set("k", json.dumps({"data": {"meal": "dinner"}, "soft_expires_at": 1e12}))
+
+    with patch("app.services.cache.time.monotonic", return_value=time.monotonic() + L1_TTL):
+        entry = await cache_get_entry(fake_redis, "k")
+
+    assert entry.data == {"meal": "dinner"}
+    assert l1_stats().expirations == 1
+
+
+async def test_l1_evicts_least_recently_used(fake_redis) -> None:
+    with patch("app.services.cache.L1_MAX_ENTRIES", 2):
+        for key in ("a", "b"):
+            await cache_set(fake_redis, key, {"key": key})
+        await cache_get_entry(fake_redis, "a")  # "b" is now least recent
+        await cache_set(fake_redis, "c", {"key": "c"})
+
+        await fake_redis.delete("a", "b", "c")
+        assert await cache_get_entry(fake_redis, "a") is not None
+        assert await cache_get_entry(fake_redis, "b") is None
+
+    stats = l1_stats()
+    assert stats.evictions == 1
+    assert stats.entries == 2
+
+
+async def test_l1_respects_byte_cap(fake_redis) -> None:
+    with patch("app.services.cache.L1_MAX_BYTES", 200):
+        await cache_set(fake_redis, "small", {"x": "y"})
+        await cache_set(fake_redis, "big", {"x": "y" * 500})
+
+    stats = l1_stats()
+    assert stats.entries == 1
+    assert stats.bytes <= 200
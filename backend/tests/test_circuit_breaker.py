@@ -0,0 +1,129 @@
+"""Unit tests for the Redis-backed per-vendor circuit breaker."""
+
+import datetime as _dt
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.parsers.base import StageTimings
+from app.parsers.fallback import get_menu_with_fallback
+from app.services.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    STATE_TTL_FACTOR,
+    CircuitBreaker,
+)
+
+HOST = "collins-cmc.cafebonappetit.com"
+TARGET_DATE = _dt.date(2026, 2, 7)
+
+
+async def test_opens_after_threshold(fake_redis) -> None:
+    breaker = CircuitBreaker(fake_redis, failure_threshold=3, reset_timeout=60)
+
+    for _ in range(2):
+        await breaker.record_failure(HOST)
+    assert (await breaker.state(HOST)).state == CLOSED
+    assert await breaker.allow(HOST)
+
+    await breaker.record_failure(HOST)
+    state = await breaker.state(HOST)
+    assert state.state == OPEN
+    assert state.failures == 3
+    assert not await breaker.allow(HOST)
+
+
+async def test_success_resets_failure_count(fake_redis) -> None:
+    breaker = CircuitBreaker(fake_redis, failure_threshold=3)
+
+    await breaker.record_failure(HOST)
+    await breaker.record_failure(HOST)
+    await breaker.record_success(HOST)
+    await breaker.record_failure(HOST)
+
+    assert (await breaker.state(HOST)).failures == 1
+
+
+async def test_half_open_allows_a_single_probe(fake_redis) -> None:
+    breaker = CircuitBreaker(fake_redis, failure_threshold=1, reset_timeout=0)
+    await breaker.record_failure(HOST)
+
+    assert (await breaker.state(HOST)).state == HALF_OPEN
+    assert await breaker.allow(HOST)
+    assert not await breaker.allow(HOST)
+
+    await breaker.record_success(HOST)
+    assert (await breaker.state(HOST)).state == CLOSED
+
+
+async def test_failed_probe_reopens(fake_redis) -> None:
+    breaker = CircuitBreaker(fake_redis, failure_threshold=1, reset_timeout=60)
+    await breaker.record_failure(HOST)
+    await fake_redis.hset(f"breaker:{HOST}", "opened_at", 0)  # cooldown elapsed
+
+    assert await breaker.allow(HOST)
+    await breaker.record_failure(HOST)
+
+    assert (await breaker.state(HOST)).state == OPEN
+
+
+async def test_state_expires_after_last_failure(fake_redis) -> None:
+    breaker = CircuitBreaker(fake_redis, failure_threshold=3, reset_timeout=60)
+
+    await breaker.record_failure(HOST)
+    assert 0 < await fake_redis.ttl(f"breaker:{HOST}") <= 60 * STATE_TTL_FACTOR
+
+    for _ in range(2):
+        await breaker.record_failure(HOST)
+    assert 0 < await fake_redis.ttl(f"breaker:{HOST}") <= 60 * STATE_TTL_FACTOR
+
+
+async def test_redis_errors_fail_open() -> None:
+    redis_client = MagicMock()
+    redis_client.hgetall = AsyncMock(side_effect=ConnectionError("redis down"))
+    breaker = CircuitBreaker(redis_client)
+
+    assert await breaker.allow(HOST)
+
+
+async def test_open_circuit_skips_fetch_and_serves_fallback(
+    fake_redis, make_mock_parser
+) -> None:
+    breaker = CircuitBreaker(fake_redis, failure_threshold=1)
+    await breaker.record_failure(HOST)
+    parser = make_mock_parser(vendor_host=HOST)
+    session = AsyncMock()
+    session.add = MagicMock()
+
+    with patch(
+        "app.parsers.fallback.load_latest_menu", new=AsyncMock(return_value=(None, None))
+    ):
+        menu, is_stale, _ = await get_menu_with_fallback(
+            parser, "collins", TARGET_DATE, session, breaker=breaker
+        )
+
+    parser.fetch_and_parse.assert_not_awaited()
+    assert (menu, is_stale) == (None, True)
+    assert session.add.call_args.args[0].status == "fallback"
+
+
+async def test_fetch_failures_open_the_circuit(fake_redis, make_mock_parser) -> None:
+    breaker = CircuitBreaker(fake_redis, failure_threshold=2)
+    session = AsyncMock()
+    session.add = MagicMock()
+
+    with patch(
+        "app.parsers.fallback.load_latest_menu", new=AsyncMock(return_value=(None, None))
+    ):
+        for _ in range(2):
+            await get_menu_with_fallback(
+                make_mock_parser(vendor_host=HOST, timings=StageTimings(fetch_failed=True)),
+                "collins", TARGET_DATE, session, breaker=breaker,
+            )
+        # Vendor answered but had nothing to serve: not a vendor failure
+        await get_menu_with_fallback(
+            make_mock_parser(vendor_host="scripps.cafebonappetit.com"),
+            "malott", TARGET_DATE, session, breaker=breaker,
+        )
+
+    assert (await breaker.state(HOST)).state == OPEN
+    assert (await breaker.state("scripps.cafebonappetit.com")).failures == 0
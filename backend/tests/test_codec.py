@@ -0,0 +1,30 @@
+"""Unit tests for the pluggable JSON codec."""
+
+import json
+
+import pytest
+
+from app import codec
+
+
+def test_round_trip_preserves_unicode() -> None:
+    data = {"name": "Jalapeño Crème", "items": [1, 2.5, None, True]}
+    text = codec.dumps(data)
+
+    assert isinstance(text, str)
+    assert "Jalapeño" in text
+    assert codec.loads(text) == data
+    assert codec.loads(text.encode("utf-8")) == data
+
+
+def test_sorted_output_matches_stdlib_canonical_form() -> None:
+    """Content hashes must not change with the installed backend."""
+    data = {"b": [{"z": 1, "a": "é"}], "a": None}
+    expected = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+    assert codec.dumps(data, sort_keys=True) == expected
+
+
+def test_invalid_json_raises_value_error() -> None:
+    with pytest.raises(ValueError):
+        codec.loads("{not json")
@@ -4,7 +4,9 @@ Uses unittest.mock to mock the database session and parser behavior.
 Verifies the try/except flow and persist/load logic.
 """
 
+import asyncio
 import datetime as _dt
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -16,11 +18,16 @@ from app.models.menu import (
     ParsedMenuItem,
     ParsedStation,
 )
+from app.models.parser_run import ParserRun
+from app.parsers.base import StageTimings
 from app.parsers.fallback import (
     get_menu_with_fallback,
     load_latest_menu,
     persist_menu,
+    serialize_stations,
+    stations_content_hash,
 )
+from app.services.background import drain_background_tasks
 
 TARGET_DATE = _dt.date(2026, 2, 7)
 
@@ -135,6 +142,41 @@ async def test_persist_menu_updates_existing() -> None:
     session.add.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_persist_menu_skips_unchanged() -> None:
+    """persist_menu leaves rows alone when the content hash is unchanged."""
+    session = AsyncMock()
+    menu = _make_menu()
+    stations_data = serialize_stations(menu.meals[0].stations)
+    original_fetched_at = _dt.datetime(2026, 2, 7, 9, 0, 0)
+
+    existing_row = MagicMock()
+    existing_row.content_hash = stations_content_hash(stations_data)
+    existing_row.is_valid = True
+    existing_row.stations_json = stations_data
+    existing_row.fetched_at = original_fetched_at
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = existing_row
+    session.execute.return_value = mock_result
+
+    await persist_menu(session, "frank", TARGET_DATE, menu)
+
+    assert existing_row.fetched_at == original_fetched_at
+    assert existing_row.stations_json is stations_data
+    session.add.assert_not_called()
+
+
+def test_stations_content_hash_is_stable() -> None:
+    """Equal station data hashes identically regardless of key order."""
+    a = [{"name": "Grill", "items": [{"name": "Burger", "tags": ["halal"]}]}]
+    b = [{"items": [{"tags": ["halal"], "name": "Burger"}], "name": "Grill"}]
+    changed = [{"name": "Grill", "items": [{"name": "Hot Dog", "tags": []}]}]
+
+    assert stations_content_hash(a) == stations_content_hash(b)
+    assert stations_content_hash(a) != stations_content_hash(changed)
+    assert len(stations_content_hash(a)) == 64
+
+
 # ---------------------------------------------------------------------------
 # load_latest_menu tests
 # ---------------------------------------------------------------------------
@@ -186,12 +228,11 @@ async def test_load_latest_menu_empty_db() -> None:
 
 
 @pytest.mark.asyncio
-async def test_fresh_parse_persists() -> None:
+async def test_fresh_parse_persists(make_mock_parser) -> None:
     """Successful parse returns fresh data and persists it."""
     fresh_menu = _make_menu()
 
-    parser = MagicMock()
-    parser.fetch_and_parse = AsyncMock(return_value=fresh_menu)
+    parser = make_mock_parser(fresh_menu)
 
     session = AsyncMock()
     # Mock persist_menu's session.execute to return no existing row
@@ -212,13 +253,98 @@ async def test_fresh_parse_persists() -> None:
 
 
 @pytest.mark.asyncio
-async def test_fallback_on_parser_failure() -> None:
-    """When parser fails, returns last-known-good data from DB."""
-    parser = MagicMock()
-    parser.fetch_and_parse = AsyncMock(
-        side_effect=RuntimeError("Network down")
+async def test_fresh_parse_persists_sibling_days(make_mock_parser) -> None:
+    """Other days decoded from the same payload are persisted too."""
+    fresh_menu = _make_menu()
+    sibling = ParsedMenu(
+        hall_id="frank",
+        date=TARGET_DATE + _dt.timedelta(days=1),
+        meals=fresh_menu.meals,
     )
 
+    parser = make_mock_parser(fresh_menu, sibling_menus=[sibling])
+
+    session = AsyncMock()
+
+    with patch("app.parsers.fallback.persist_menu", new=AsyncMock()) as mock_persist:
+        menu, is_stale, _ = await get_menu_with_fallback(
+            parser, "frank", TARGET_DATE, session
+        )
+
+    assert menu is fresh_menu
+    assert is_stale is False
+    persisted_dates = [c.args[2] for c in mock_persist.await_args_list]
+    assert persisted_dates == [TARGET_DATE, sibling.date]
+
+
+@pytest.mark.asyncio
+async def test_stage_timings_recorded_on_parser_run(make_mock_parser) -> None:
+    """Parser stage timings plus persist/cache_write land on the ParserRun."""
+    parser = make_mock_parser(_make_menu())
+    parser.timings = StageTimings(
+        fetch_ms=120, parse_ms=30, validate_ms=1, payload_size=4096, item_count=2
+    )
+    on_success = AsyncMock()
+
+    session = AsyncMock()
+    session.add = MagicMock()
+
+    with patch("app.parsers.fallback.persist_menu", new=AsyncMock()):
+        menu, _, fetched_at = await get_menu_with_fallback(
+            parser, "frank", TARGET_DATE, session, on_success=on_success
+        )
+
+    on_success.assert_awaited_once_with(menu, fetched_at)
+    run = session.add.call_args.args[0]
+    assert isinstance(run, ParserRun)
+    assert (run.fetch_ms, run.parse_ms, run.validate_ms) == (120, 30, 1)
+    assert run.persist_ms is not None
+    assert run.cache_write_ms is not None
+    assert (run.payload_size, run.item_count) == (4096, 2)
+
+
+@pytest.mark.asyncio
+async def test_stage_timings_recorded_when_fetch_fails(make_mock_parser) -> None:
+    """A failed fetch still records the stages that ran."""
+    parser = make_mock_parser(None)
+    parser.timings = StageTimings(fetch_ms=3000, fetch_failed=True)
+
+    session = AsyncMock()
+    session.add = MagicMock()
+
+    with patch(
+        "app.parsers.fallback.load_latest_menu", new=AsyncMock(return_value=(None, None))
+    ):
+        await get_menu_with_fallback(parser, "frank", TARGET_DATE, session)
+
+    run = session.add.call_args.args[0]
+    assert run.status == "no_data"
+    assert run.fetch_ms == 3000
+
+
+@pytest.mark.asyncio
+async def test_failed_cache_write_still_returns_fresh_menu(make_mock_parser) -> None:
+    """An on_success error is logged; the fresh menu is still returned."""
+    fresh_menu = _make_menu()
+    parser = make_mock_parser(fresh_menu)
+    session = AsyncMock()
+    session.add = MagicMock()
+
+    with patch("app.parsers.fallback.persist_menu", new=AsyncMock()):
+        menu, is_stale, _ = await get_menu_with_fallback(
+            parser, "frank", TARGET_DATE, session,
+            on_success=AsyncMock(side_effect=ConnectionError("redis down")),
+        )
+
+    assert menu is fresh_menu
+    assert is_stale is False
+
+
+@pytest.mark.asyncio
+async def test_fallback_on_parser_failure(make_mock_parser) -> None:
+    """When parser fails, returns last-known-good data from DB."""
+    parser = make_mock_parser(side_effect=RuntimeError("Network down"))
+
     stored_row = _make_db_row(
         fetched_at=_dt.datetime(2026, 2, 7, 10, 0, 0)
     )
@@ -242,12 +368,9 @@ async def test_fallback_on_parser_failure() -> None:
 
 
 @pytest.mark.asyncio
-async def test_fallback_no_stored_data() -> None:
+async def test_fallback_no_stored_data(make_mock_parser) -> None:
     """When parser fails and no stored data, returns (None, True, None)."""
-    parser = MagicMock()
-    parser.fetch_and_parse = AsyncMock(
-        side_effect=RuntimeError("Network down")
-    )
+    parser = make_mock_parser(side_effect=RuntimeError("Network down"))
 
     session = AsyncMock()
     mock_result = MagicMock()
@@ -266,10 +389,9 @@ async def test_fallback_no_stored_data() -> None:
 
 
 @pytest.mark.asyncio
-async def test_fallback_when_fetch_returns_none() -> None:
+async def test_fallback_when_fetch_returns_none(make_mock_parser) -> None:
     """When parser returns None (validation failure), falls back to DB."""
-    parser = MagicMock()
-    parser.fetch_and_parse = AsyncMock(return_value=None)
+    parser = make_mock_parser(None)
 
     stored_row = _make_db_row()
 
@@ -287,3 +409,95 @@ async def test_fallback_when_fetch_returns_none() -> None:
     # fetch_and_parse returned None, so should fall back
     assert menu is not None
     assert is_stale is True
+
+
+# ---------------------------------------------------------------------------
+# Deadline hedging
+# ---------------------------------------------------------------------------
+
+
+def _slow_fetch(menu: ParsedMenu, delay: float = 0.05):
+    async def _fetch_and_parse(target_date):
+        await asyncio.sleep(delay)
+        return menu
+
+    return _fetch_and_parse
+
+
+def _session_factory(session):
+    @asynccontextmanager
+    async def _factory():
+        yield session
+
+    return _factory
+
+
+@pytest.mark.asyncio
+async def test_deadline_serves_stored_menu_and_finishes_in_background(
+    make_mock_parser,
+) -> None:
+    """A fetch past the deadline returns stored data; the refresh completes later."""
+    fresh_menu = _make_menu()
+    parser = make_mock_parser(side_effect=_slow_fetch(fresh_menu))
+    stored_menu = _make_menu()
+    stored_at = _dt.datetime(2026, 2, 7, 10, 0, 0)
+    on_success = AsyncMock()
+
+    request_session = AsyncMock()
+    background_session = AsyncMock()
+    background_session.add = MagicMock()
+
+    with (
+        patch(
+            "app.parsers.fallback.load_latest_menu",
+            new=AsyncMock(return_value=(stored_menu, stored_at)),
+        ),
+        patch("app.parsers.fallback.persist_menu", new=AsyncMock()) as mock_persist,
+    ):
+        menu, is_stale, fetched_at = await get_menu_with_fallback(
+            parser, "frank", TARGET_DATE, request_session,
+            on_success=on_success,
+            deadline=0.001,
+            session_factory=_session_factory(background_session),
+        )
+
+        assert (menu, is_stale, fetched_at) == (stored_menu, True, stored_at)
+        on_success.assert_not_awaited()
+
+        await drain_background_tasks(timeout=1)
+
+    mock_persist.assert_awaited_once_with(
+        background_session, "frank", TARGET_DATE, fresh_menu
+    )
+    on_success.assert_awaited_once()
+    assert on_success.await_args.args[0] is fresh_menu
+    run = background_session.add.call_args.args[0]
+    assert run.status == "success"
+    background_session.commit.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_deadline_waits_for_live_fetch_without_stored_menu(make_mock_parser) -> None:
+    """With nothing stored to hedge with, the live result is awaited."""
+    fresh_menu = _make_menu()
+    parser = make_mock_parser(side_effect=_slow_fetch(fresh_menu))
+    session = AsyncMock()
+    session.add = MagicMock()
+    factory = MagicMock()
+
+    with (
+        patch(
+            "app.parsers.fallback.load_latest_menu",
+            new=AsyncMock(return_value=(None, None)),
+        ),
+        patch("app.parsers.fallback.persist_menu", new=AsyncMock()),
+    ):
+        menu, is_stale, _ = await get_menu_with_fallback(
+            parser, "frank", TARGET_DATE, session,
+            deadline=0.001,
+            session_factory=factory,
+        )
+
+    assert menu is fresh_menu
+    assert is_stale is False
+    factory.assert_not_called()
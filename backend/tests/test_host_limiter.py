@@ -0,0 +1,113 @@
+"""Unit tests for the per-host upstream politeness limiter."""
+
+import asyncio
+
+import pytest
+
+from app.main import app
+from app.services.auth_service import require_admin
+from app.services.host_limiter import (
+    HostLimiter,
+    configure_host_limits,
+    get_host_limiter,
+    host_limiter_stats,
+)
+
+
+async def test_caps_concurrency_per_host() -> None:
+    limiter = HostLimiter("example.edu", max_concurrency=2, requests_per_second=1000, burst=10)
+    running = 0
+    peak = 0
+
+    async def fetch() -> None:
+        nonlocal running, peak
+        async with limiter.slot():
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(fetch() for _ in range(6)))
+
+    assert peak == 2
+    stats = limiter.stats()
+    assert stats.total_requests == 6
+    # The first two go straight through; the other four queue
+    assert stats.max_queued == 4
+    assert (stats.in_flight, stats.queued) == (0, 0)
+
+
+async def test_rate_limits_starts_after_burst() -> None:
+    limiter = HostLimiter("example.edu", max_concurrency=10, requests_per_second=50, burst=2)
+    starts: list[float] = []
+
+    async def fetch() -> None:
+        async with limiter.slot():
+            starts.append(asyncio.get_running_loop().time())
+
+    await asyncio.gather(*(fetch() for _ in range(4)))
+
+    # Two burst tokens start at once; the rest wait ~20ms per token
+    assert starts[1] - starts[0] < 0.01
+    assert starts[3] - starts[0] >= 0.035
+    assert limiter.stats().total_wait_ms > 0
+
+
+async def test_cancelled_waiter_releases_its_place() -> None:
+    limiter = HostLimiter("example.edu", max_concurrency=1, requests_per_second=1000, burst=10)
+    release = asyncio.Event()
+
+    async def holder() -> None:
+        async with limiter.slot():
+            await release.wait()
+
+    held = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    assert limiter.queued == 1
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    release.set()
+    await held
+
+    assert (limiter.queued, limiter.in_flight) == (0, 0)
+    async with limiter.slot():
+        assert limiter.in_flight == 1
+
+
+def test_limiters_are_per_host_and_configurable() -> None:
+    configure_host_limits(max_concurrency=3, requests_per_second=5.0, burst=1)
+
+    limiter = get_host_limiter("a.example.edu")
+    assert get_host_limiter("a.example.edu") is limiter
+    assert get_host_limiter("b.example.edu") is not limiter
+    assert (limiter.requests_per_second, limiter.burst) == (5.0, 1)
+    assert [s.host for s in host_limiter_stats()] == ["a.example.edu", "b.example.edu"]
+
+    with pytest.raises(ValueError):
+        configure_host_limits(max_concurrency=0, requests_per_second=1.0, burst=1)
+
+
+async def test_upstream_endpoint_reports_hosts(client) -> None:
+    app.dependency_overrides[require_admin] = lambda: "admin@example.com"
+    try:
+        limiter = get_host_limiter("my.pomona.edu")
+        async with limiter.slot():
+            response = await client.get("/api/v2/admin/upstream")
+    finally:
+        app.dependency_overrides.pop(require_admin, None)
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {
+            "host": "my.pomona.edu",
+            "in_flight": 1,
+            "queued": 0,
+            "max_queued": 1,
+            "total_requests": 1,
+            "avg_wait_ms": 0.0,
+        }
+    ]
@@ -0,0 +1,59 @@
+"""Tests for the off-loop parse executor.
+
+Parses the saved Collins fixture on each executor kind and checks the
+results match inline parsing.
+"""
+
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from app.parsers import executor
+from app.parsers.bonappetit import BonAppetitParser
+
+FIXTURE = Path(__file__).parent / "fixtures" / "bonappetit" / "collins_2026-02-07.html"
+TARGET_DATE = date(2026, 2, 7)
+
+
+@pytest.fixture
+def collins_html() -> str:
+    return FIXTURE.read_text()
+
+
+@pytest.fixture(autouse=True)
+def _reset_executor():
+    yield
+    executor.shutdown_parse_executor()
+
+
+@pytest.mark.parametrize("kind", ["process", "thread", "inline"])
+async def test_run_parse_matches_inline(kind: str, collins_html: str) -> None:
+    parser = BonAppetitParser("collins", "Collins")
+    expected = parser.parse_all(collins_html, TARGET_DATE)
+
+    executor.configure_parse_executor(kind, max_workers=1)
+    result = await executor.run_parse(parser, collins_html, TARGET_DATE)
+
+    assert result == expected
+
+
+async def test_broken_process_pool_is_replaced(collins_html: str) -> None:
+    parser = BonAppetitParser("collins", "Collins")
+    executor.configure_parse_executor("process", max_workers=1)
+    expected = await executor.run_parse(parser, collins_html, TARGET_DATE)
+
+    broken = executor._executor
+    for process in list(broken._processes.values()):
+        process.kill()
+        process.join()
+
+    result = await executor.run_parse(parser, collins_html, TARGET_DATE)
+
+    assert result == expected
+    assert executor._executor is not broken
+
+
+def test_unknown_executor_kind() -> None:
+    with pytest.raises(ValueError, match="Unknown parse executor"):
+        executor.configure_parse_executor("gpu")
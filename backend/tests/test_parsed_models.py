@@ -0,0 +1,48 @@
+"""Unit tests for the slotted parsed-menu records."""
+
+import pickle
+from datetime import date
+
+from app.models.menu import ParsedMeal, ParsedMenu, ParsedMenuItem, ParsedStation
+
+
+def _menu() -> ParsedMenu:
+    return ParsedMenu(
+        hall_id="frank",
+        date=date(2026, 2, 7),
+        meals=[
+            ParsedMeal(
+                meal="lunch",
+                stations=[
+                    ParsedStation(
+                        name="Grill",
+                        items=[ParsedMenuItem(name="Burger", tags=["vegan"])],
+                    )
+                ],
+            )
+        ],
+    )
+
+
+def test_equality_is_structural() -> None:
+    assert _menu() == _menu()
+    assert ParsedMenuItem(name="Burger") != ParsedMenuItem(name="Burger", tags=["vegan"])
+    assert ParsedMenuItem(name="Burger") != ("Burger", ())
+
+
+def test_tags_are_interned_tuples() -> None:
+    tag = "".join(["glu", "ten-free"])
+    a = ParsedMenuItem(name="A", tags=[tag])
+    b = ParsedMenuItem(name="B", tags=["gluten-free"])
+
+    assert a.tags == ("gluten-free",)
+    assert a.tags[0] is b.tags[0]
+
+
+def test_records_have_no_instance_dict() -> None:
+    assert not hasattr(ParsedMenuItem(name="A"), "__dict__")
+
+
+def test_pickle_round_trip() -> None:
+    menu = _menu()
+    assert pickle.loads(pickle.dumps(menu)) == menu
@@ -7,12 +7,15 @@ import json
 from datetime import date
 from pathlib import Path
 
+import httpx
 import pytest
 from selectolax.lexbor import LexborHTMLParser
 
 from app.models.menu import ParsedMenu
+from app.parsers import pomona
 from app.parsers.pomona import PomonaParser
 from app.parsers.station_filters import POMONA_FILTER
+from app.services.host_limiter import host_limiter_stats
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures" / "pomona"
 TARGET_DATE = date(2026, 2, 7)
@@ -23,6 +26,14 @@ TARGET_DATE = date(2026, 2, 7)
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def _clear_json_url_cache():
+    """Discovered JSON URLs are cached module-wide; isolate each test."""
+    pomona._json_url_cache.clear()
+    yield
+    pomona._json_url_cache.clear()
+
+
 @pytest.fixture
 def frank_json() -> str:
     return (FIXTURES_DIR / "frank_2026-02-07.json").read_text()
@@ -330,6 +341,88 @@ def test_pomona_json_url_discovery_fallback() -> None:
     assert "eatec/Frary.json" in url
 
 
+async def test_pomona_fetch_uses_shared_client(frank_page_html: str) -> None:
+    """Both fetch steps go through the injected pooled client."""
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        if request.url.path.endswith(".json"):
+            return httpx.Response(200, text=_make_synthetic_json())
+        return httpx.Response(200, text=frank_page_html)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        parser = PomonaParser("frank", "Frank", client=client)
+        raw = await parser.fetch_raw(TARGET_DATE)
+
+    assert len(requested) == 2
+    assert "eatec/Frank.json" in requested[1]
+    assert parser.parse(raw, TARGET_DATE).meals
+
+
+async def test_pomona_fetch_reuses_cached_json_url(frank_page_html: str) -> None:
+    """A second fetch skips the page request and goes straight to the JSON."""
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        if request.url.path.endswith(".json"):
+            return httpx.Response(200, text=_make_synthetic_json())
+        return httpx.Response(200, text=frank_page_html)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        parser = PomonaParser("frank", "Frank", client=client)
+        await parser.fetch_raw(TARGET_DATE)
+        await parser.fetch_raw(TARGET_DATE)
+
+    assert len(requested) == 3
+    assert requested[2].endswith(".json")
+
+
+async def test_pomona_fetch_rediscovers_after_404(frank_page_html: str) -> None:
+    """A 404 on the cached JSON URL triggers rediscovery from the page."""
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        if request.url.path.endswith("Moved.json"):
+            return httpx.Response(404)
+        if request.url.path.endswith(".json"):
+            return httpx.Response(200, text=_make_synthetic_json())
+        return httpx.Response(200, text=frank_page_html)
+
+    pomona._json_url_cache["frank"] = (
+        "https://my.pomona.edu/eatec/Moved.json",
+        float("inf"),
+    )
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        parser = PomonaParser("frank", "Frank", client=client)
+        raw = await parser.fetch_raw(TARGET_DATE)
+
+    assert parser.parse(raw, TARGET_DATE).meals
+    assert len(requested) == 3
+    assert "eatec/Frank.json" in pomona._json_url_cache["frank"][0]
+
+
+async def test_pomona_fetch_limits_each_host_it_reaches(frank_page_html: str) -> None:
+    """The page and the JSON feed each go through their own host's limiter."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith(".json"):
+            return httpx.Response(200, text=_make_synthetic_json())
+        return httpx.Response(200, text=frank_page_html)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        parser = PomonaParser("frank", "Frank", client=client)
+        assert parser.vendor_host == "www.pomona.edu"
+        await parser.fetch_raw(TARGET_DATE)
+
+    stats = {s.host: s.total_requests for s in host_limiter_stats()}
+    assert stats == {"www.pomona.edu": 1, "my.pomona.edu": 1}
+    # With the feed URL cached, the next fetch starts (and ends) there
+    assert parser.vendor_host == "my.pomona.edu"
+
+
 def test_pomona_wrong_date_returns_empty(frank_parser: PomonaParser) -> None:
     """Parsing for a date not in the fixture returns empty meals."""
     raw = _make_synthetic_json(serve_date="20260301")
@@ -337,6 +430,28 @@ def test_pomona_wrong_date_returns_empty(frank_parser: PomonaParser) -> None:
     assert len(menu.meals) == 0
 
 
+def test_pomona_parse_all_builds_every_served_date(
+    frank_parser: PomonaParser, frank_json: str
+) -> None:
+    """parse_all decodes the feed once and returns a menu per served date."""
+    menus = frank_parser.parse_all(frank_json, TARGET_DATE)
+    by_date = {m.date: m for m in menus}
+
+    assert set(by_date) == {date(2026, 2, 7), date(2026, 2, 8)}
+    for menu_date, menu in by_date.items():
+        assert menu == frank_parser.parse(frank_json, menu_date)
+
+
+def test_pomona_parse_all_includes_target_date(frank_parser: PomonaParser) -> None:
+    """The requested date is present even when the feed does not serve it."""
+    raw = _make_synthetic_json(serve_date="20260301")
+    menus = frank_parser.parse_all(raw, TARGET_DATE)
+    by_date = {m.date: m for m in menus}
+
+    assert by_date[TARGET_DATE].meals == []
+    assert by_date[date(2026, 3, 1)].meals
+
+
 def test_pomona_displayonwebsite_n_filtered(frank_parser: PomonaParser) -> None:
     """Items with @displayonwebsite=N are filtered out."""
     raw = _make_synthetic_json(
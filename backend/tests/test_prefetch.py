@@ -0,0 +1,159 @@
+"""Unit tests for the background prefetch scheduler."""
+
+import asyncio
+import datetime as _dt
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from zoneinfo import ZoneInfo
+
+from app.services.menu_service import HALL_CONFIG
+from app.services.prefetch import PrefetchScheduler
+from app.services.refresh_planner import MealWindow
+
+TZ = ZoneInfo("America/Los_Angeles")
+TODAY = _dt.date(2026, 2, 7)
+NOON = _dt.datetime(2026, 2, 7, 12, 0, tzinfo=TZ)
+
+
+def _scheduler(fake_redis, **kwargs) -> PrefetchScheduler:
+    @asynccontextmanager
+    async def _factory():
+        yield MagicMock()
+
+    scheduler = PrefetchScheduler(fake_redis, _factory, **kwargs)
+    scheduler.now = lambda: NOON
+    return scheduler
+
+
+def _lunch(hall_id: str) -> MealWindow:
+    return MealWindow(
+        hall_id, "lunch",
+        _dt.datetime(2026, 2, 7, 11, 0, tzinfo=TZ),
+        _dt.datetime(2026, 2, 7, 13, 30, tzinfo=TZ),
+    )
+
+
+async def test_first_run_covers_every_hall_and_day(fake_redis) -> None:
+    """With no hours or refresh history, every hall gets the whole week."""
+    async def _refresh(hall_id, target_date, *args):
+        # Sodexo returns the whole week from one fetch
+        if hall_id == "hoch":
+            return [TODAY + _dt.timedelta(days=i) for i in range(7)]
+        return [target_date]
+
+    refresh = AsyncMock(side_effect=_refresh)
+    with (
+        patch("app.services.prefetch.load_meal_windows", new=AsyncMock(return_value={})),
+        patch("app.services.prefetch.refresh_menu", new=refresh),
+    ):
+        refreshed = await _scheduler(fake_redis, days=7).run_due(NOON)
+
+    calls = [(c.args[0], c.args[1]) for c in refresh.await_args_list]
+    assert [d for hall, d in calls if hall == "hoch"] == [TODAY]
+    assert len([d for hall, d in calls if hall == "collins"]) == 7
+    assert refreshed == 7 * len(HALL_CONFIG)
+
+
+async def test_run_due_limits_concurrency_and_survives_failures(fake_redis) -> None:
+    running = 0
+    peak = 0
+
+    async def _refresh(hall_id, target_date, *args):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        if hall_id == "frank":
+            raise RuntimeError("db down")
+        return [target_date]
+
+    with (
+        patch("app.services.prefetch.load_meal_windows", new=AsyncMock(return_value={})),
+        patch("app.services.prefetch.refresh_menu", new=AsyncMock(side_effect=_refresh)),
+    ):
+        refreshed = await _scheduler(fake_redis, days=2, concurrency=3).run_due(NOON)
+
+    assert peak == 3
+    assert refreshed == 2 * (len(HALL_CONFIG) - 1)
+
+
+async def test_run_due_follows_meal_windows(fake_redis) -> None:
+    """Halls mid-service refresh today only; halls without hours get the week."""
+    scheduler = _scheduler(fake_redis, days=3)
+    windows = {hall_id: [_lunch(hall_id)] for hall_id in HALL_CONFIG if hall_id != "frank"}
+    # Collins was refreshed two minutes ago, so it is not due yet
+    await fake_redis.set("prefetch:last:collins", (NOON - _dt.timedelta(minutes=2)).timestamp())
+    await fake_redis.set("prefetch:last:malott", (NOON - _dt.timedelta(minutes=20)).timestamp())
+
+    refresh = AsyncMock(side_effect=lambda hall_id, target_date, *args: [target_date])
+    with (
+        patch("app.services.prefetch.load_meal_windows", new=AsyncMock(return_value=windows)),
+        patch("app.services.prefetch.refresh_menu", new=refresh),
+    ):
+        await scheduler.run_due(NOON)
+
+    dates_by_hall: dict[str, list[_dt.date]] = {}
+    for c in refresh.await_args_list:
+        dates_by_hall.setdefault(c.args[0], []).append(c.args[1])
+    assert "collins" not in dates_by_hall
+    assert dates_by_hall["malott"] == [TODAY]
+    assert len(dates_by_hall["frank"]) == 3
+    assert float(await fake_redis.get("prefetch:last:malott")) == NOON.timestamp()
+    assert await fake_redis.get("prefetch:lock:malott") is None
+
+
+async def test_run_due_skips_closed_halls(fake_redis) -> None:
+    """A hall with hours but none in the loaded days is left alone, even at night."""
+    scheduler = _scheduler(fake_redis, days=3)
+    two_am = NOON.replace(hour=2)
+    await fake_redis.set("prefetch:last:collins", (two_am - _dt.timedelta(minutes=30)).timestamp())
+    windows = {"collins": []}
+
+    refresh = AsyncMock(side_effect=lambda hall_id, target_date, *args: [target_date])
+    with (
+        patch("app.services.prefetch.load_meal_windows", new=AsyncMock(return_value=windows)),
+        patch("app.services.prefetch.refresh_menu", new=refresh),
+    ):
+        await scheduler.run_due(two_am)
+
+    halls = {c.args[0] for c in refresh.await_args_list}
+    assert "collins" not in halls
+    # Halls with no hours on record still get the fallback refresh
+    assert "frank" in halls
+
+
+async def test_hall_locked_by_another_worker_is_skipped(fake_redis) -> None:
+    scheduler = _scheduler(fake_redis, days=1)
+    await fake_redis.set("prefetch:lock:hoch", "1")
+
+    refresh = AsyncMock(side_effect=lambda hall_id, target_date, *args: [target_date])
+    with (
+        patch("app.services.prefetch.load_meal_windows", new=AsyncMock(return_value={})),
+        patch("app.services.prefetch.refresh_menu", new=refresh),
+    ):
+        refreshed = await scheduler.run_due(NOON)
+
+    assert "hoch" not in {c.args[0] for c in refresh.await_args_list}
+    assert refreshed == len(HALL_CONFIG) - 1
+    assert await fake_redis.get("prefetch:last:hoch") is None
+
+
+async def test_start_and_stop(fake_redis) -> None:
+    scheduler = _scheduler(fake_redis, tick=0.01, jitter=0.0, days=1)
+    cycle = asyncio.Event()
+
+    async def _refresh(hall_id, target_date, *args):
+        cycle.set()
+        return [target_date]
+
+    with (
+        patch("app.services.prefetch.load_meal_windows", new=AsyncMock(return_value={})),
+        patch("app.services.prefetch.refresh_menu", new=AsyncMock(side_effect=_refresh)),
+    ):
+        scheduler.start()
+        await asyncio.wait_for(cycle.wait(), timeout=1)
+        await scheduler.stop()
+
+    assert scheduler._task is None
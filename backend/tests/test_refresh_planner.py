@@ -0,0 +1,111 @@
+"""Unit tests for meal-window-aware refresh planning."""
+
+import datetime as _dt
+from zoneinfo import ZoneInfo
+
+from app.models.dining_hours import DiningHoursOverride
+from app.services.refresh_planner import (
+    FALLBACK,
+    IN_SERVICE,
+    PRE_MEAL,
+    MealWindow,
+    PlannedRefresh,
+    RefreshPlanner,
+    load_meal_windows,
+)
+
+TZ = ZoneInfo("America/Los_Angeles")
+MONDAY = _dt.date(2026, 2, 9)
+
+
+def _at(hour: int, minute: int = 0, day: _dt.date = MONDAY) -> _dt.datetime:
+    return _dt.datetime.combine(day, _dt.time(hour, minute), tzinfo=TZ)
+
+
+WINDOWS = [
+    MealWindow("hoch", "lunch", _at(11), _at(13, 30)),
+    MealWindow("hoch", "dinner", _at(17), _at(20)),
+    MealWindow("hoch", "lunch", _at(11, day=MONDAY + _dt.timedelta(days=1)),
+               _at(13, 30, day=MONDAY + _dt.timedelta(days=1))),
+]
+
+planner = RefreshPlanner(
+    lead=_dt.timedelta(minutes=15),
+    service_interval=_dt.timedelta(minutes=10),
+    fallback_interval=_dt.timedelta(minutes=25),
+)
+
+
+def test_never_refreshed_is_due_now() -> None:
+    assert planner.next_refresh(WINDOWS, None, _at(3)) == PlannedRefresh(_at(3), PRE_MEAL)
+
+
+def test_pre_meal_refresh_before_start() -> None:
+    plan = planner.next_refresh(WINDOWS, _at(8), _at(9))
+    assert plan == PlannedRefresh(_at(10, 45), PRE_MEAL)
+    assert plan.full_week
+
+
+def test_refreshes_during_service() -> None:
+    assert planner.next_refresh(WINDOWS, _at(10, 45), _at(10, 46)) == PlannedRefresh(
+        _at(11), IN_SERVICE
+    )
+    plan = planner.next_refresh(WINDOWS, _at(12), _at(12, 1))
+    assert plan == PlannedRefresh(_at(12, 10), IN_SERVICE)
+    assert not plan.full_week
+
+
+def test_next_meal_after_service_ends() -> None:
+    assert planner.next_refresh(WINDOWS, _at(13, 25), _at(13, 26)) == PlannedRefresh(
+        _at(16, 45), PRE_MEAL
+    )
+
+
+def test_overnight_waits_for_next_days_first_meal() -> None:
+    plan = planner.next_refresh(WINDOWS, _at(19, 55), _at(22))
+    assert plan == PlannedRefresh(_at(10, 45, day=MONDAY + _dt.timedelta(days=1)), PRE_MEAL)
+
+
+def test_no_windows_left_means_no_refresh() -> None:
+    assert planner.next_refresh(WINDOWS[:2], _at(20, 5), _at(21)) is None
+
+
+def test_hall_without_hours_uses_fallback_interval() -> None:
+    assert planner.next_refresh(None, _at(9), _at(9, 1)) == PlannedRefresh(_at(9, 25), FALLBACK)
+    assert planner.next_refresh(None, None, _at(9)) == PlannedRefresh(_at(9), FALLBACK)
+
+
+def test_closed_hall_is_not_refreshed() -> None:
+    assert planner.next_refresh([], _at(1, 30), _at(2)) is None
+    assert planner.next_refresh([], None, _at(2)) is None
+
+
+async def test_load_meal_windows_applies_overrides(test_session, seed_hours) -> None:
+    test_session.add(
+        DiningHoursOverride(hall_id="collins", date=MONDAY, meal="lunch", reason="Closed")
+    )
+    test_session.add(
+        DiningHoursOverride(
+            hall_id="hoch", date=MONDAY, meal="dinner",
+            start_time=_dt.time(16, 0), end_time=_dt.time(19, 0),
+        )
+    )
+    await test_session.commit()
+
+    windows = await load_meal_windows(test_session, [MONDAY], TZ)
+
+    assert [(w.meal, w.start, w.end) for w in windows["hoch"]] == [
+        ("lunch", _at(11), _at(13, 30)),
+        ("dinner", _at(16), _at(19)),
+    ]
+    assert [w.meal for w in windows["collins"]] == ["dinner"]
+
+
+async def test_load_meal_windows_keeps_closed_halls(test_session, seed_hours) -> None:
+    """A hall with hours but nothing served maps to []; one with no hours is absent."""
+    sunday = MONDAY - _dt.timedelta(days=1)
+
+    windows = await load_meal_windows(test_session, [sunday], TZ)
+
+    assert windows["hoch"] == [] and windows["collins"] == []
+    assert "frank" not in windows
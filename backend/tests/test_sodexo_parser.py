@@ -3,10 +3,13 @@
 All tests run against a saved HTML fixture -- zero network calls.
 """
 
+import html
+import json
 from datetime import date
 from pathlib import Path
 
 import pytest
+from selectolax.parser import HTMLParser
 
 from app.models.menu import ParsedMenu, ParsedMenuItem, ParsedStation
 from app.parsers.sodexo import SodexoParser
@@ -39,6 +42,34 @@ def parsed_menu(parser: SodexoParser, fixture_html: str) -> ParsedMenu:
     return parser.parse(fixture_html, FIXTURE_DATE)
 
 
+def _make_synthetic_html(day_dates: list[str]) -> str:
+    """Build a minimal Sodexo page with one lunch per day in #nutData."""
+    days = [
+        {
+            "date": f"{day_date}T00:00:00",
+            "dayParts": [
+                {
+                    "dayPartName": "LUNCH",
+                    "courses": [
+                        {
+                            "courseName": "EXHIBITION SCR",
+                            "menuItems": [
+                                {"formalName": f"Dish {day_date}", "isVegan": True},
+                            ],
+                        }
+                    ],
+                }
+            ],
+        }
+        for day_date in day_dates
+    ]
+    payload = html.escape(json.dumps(days))
+    return f'<html><body><div id="nutData">{payload}</div></body></html>'
+
+
+WEEK_DATES = [f"2026-02-{d:02d}" for d in range(1, 8)]
+
+
 # ------------------------------------------------------------------
 # Test: parse returns valid menu structure
 # ------------------------------------------------------------------
@@ -330,6 +361,82 @@ class TestSodexoDateFiltering:
         assert len(menu.meals) >= 1
 
 
+# ------------------------------------------------------------------
+# Test: week fan-out
+# ------------------------------------------------------------------
+
+
+class TestSodexoParseAll:
+    def test_parses_every_day_in_payload(self, parser: SodexoParser) -> None:
+        menus = parser.parse_all(_make_synthetic_html(WEEK_DATES), FIXTURE_DATE)
+        assert sorted(m.date.isoformat() for m in menus) == WEEK_DATES
+        for menu in menus:
+            assert menu.meals[0].stations[0].items[0].name == f"Dish {menu.date}"
+
+    def test_matches_single_day_parse(self, parser: SodexoParser) -> None:
+        raw = _make_synthetic_html(WEEK_DATES)
+        by_date = {m.date: m for m in parser.parse_all(raw, FIXTURE_DATE)}
+        assert by_date[date(2026, 2, 3)] == parser.parse(raw, date(2026, 2, 3))
+
+    def test_target_date_always_present(self, parser: SodexoParser) -> None:
+        menus = parser.parse_all(_make_synthetic_html(WEEK_DATES), date(2099, 1, 1))
+        target = [m for m in menus if m.date == date(2099, 1, 1)]
+        assert len(target) == 1
+        assert target[0].meals == []
+
+    async def test_fetch_and_parse_keeps_siblings(self, parser: SodexoParser) -> None:
+        async def fake_fetch(target_date: date) -> str:
+            return _make_synthetic_html(WEEK_DATES)
+
+        parser.fetch_raw = fake_fetch  # type: ignore[method-assign]
+        menu = await parser.fetch_and_parse(FIXTURE_DATE)
+
+        assert menu is not None
+        assert menu.date == FIXTURE_DATE
+        assert len(parser.sibling_menus) == 6
+        assert FIXTURE_DATE not in {m.date for m in parser.sibling_menus}
+
+
+# ------------------------------------------------------------------
+# Test: #nutData extraction
+# ------------------------------------------------------------------
+
+
+class TestSodexoExtractJson:
+    def test_fast_path_matches_dom(self) -> None:
+        page = _make_synthetic_html(WEEK_DATES)
+        fast = SodexoParser._scan_nutdata(page)
+        dom = HTMLParser(page).css_first("#nutData").text().strip()
+        assert fast is not None
+        assert fast == dom
+        assert fast.startswith("[")
+
+    def test_fast_path_unescapes_like_dom(self) -> None:
+        page = (
+            '<div id="nutData">[{&quot;name&quot;: &quot;Mac &amp; Cheese &lt;3&quot;,'
+            " &quot;note&quot;: &quot;chef&#39;s &eacute;clair&quot;}]</div>"
+        )
+        dom = HTMLParser(page).css_first("#nutData").text().strip()
+        assert SodexoParser._scan_nutdata(page) == dom
+
+    def test_fast_path_handles_attribute_order(self) -> None:
+        page = (
+            "<p>nutData mentioned in text</p>"
+            "<div class='hidden' data-x=\"1\" ID='nutData'> [{&quot;a&quot;: 1}] </div>"
+        )
+        assert SodexoParser._scan_nutdata(page) == '[{"a": 1}]'
+
+    def test_fast_path_declines_unexpected_markup(self) -> None:
+        page = '<div id="nutData"><span>[1]</span></div>'
+        assert SodexoParser._scan_nutdata(page) is None
+        # The DOM fallback still extracts the text
+        assert SodexoParser._extract_json(page) == "[1]"
+
+    def test_missing_div_raises(self) -> None:
+        with pytest.raises(ValueError, match="nutData"):
+            SodexoParser._extract_json("<html><body></body></html>")
+
+
 # ------------------------------------------------------------------
 # Test: build_url
 # ------------------------------------------------------------------
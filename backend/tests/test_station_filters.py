@@ -0,0 +1,76 @@
+"""Equivalence tests for the compiled station filter engine.
+
+``legacy_apply`` (``app.parsers.station_filters_reference``) is the original,
+uncompiled pipeline; the compiled engine must produce identical output
+for every vendor config.
+"""
+
+import random
+
+import pytest
+
+from app.models.menu import ParsedMenuItem, ParsedStation
+from app.parsers.station_filters import (
+    BONAPPETIT_FILTER,
+    POMONA_FILTER,
+    SODEXO_FILTER,
+    StationFilterConfig,
+    apply_station_filters,
+    compile_station_filter,
+)
+from app.parsers.station_filters_reference import legacy_apply
+
+FILTERS = {
+    "sodexo": SODEXO_FILTER,
+    "bonappetit": BONAPPETIT_FILTER,
+    "pomona": POMONA_FILTER,
+}
+
+
+def _station_names(config: StationFilterConfig) -> list[str]:
+    """Every name the config knows about, plus some unknown ones."""
+    names = set(config.hidden) | set(config.ordered) | set(config.truncated)
+    for canonical, aliases in config.combined.items():
+        names.add(canonical)
+        names.update(aliases)
+    names.update(["Unknown Station", "Pop-Up", "Late Night"])
+    return sorted(names)
+
+
+def _random_stations(rng: random.Random, names: list[str]) -> list[ParsedStation]:
+    stations = []
+    for i in range(rng.randint(0, 25)):
+        name = rng.choice(names)
+        name = rng.choice([name, name.upper(), name.title()])
+        items = [
+            ParsedMenuItem(name=f"item {i}-{j}", tags=[]) for j in range(rng.randint(0, 15))
+        ]
+        stations.append(ParsedStation(name=name, items=items))
+    return stations
+
+
+@pytest.mark.parametrize("vendor", FILTERS)
+def test_compiled_matches_legacy_pipeline(vendor: str) -> None:
+    config = FILTERS[vendor]
+    names = _station_names(config)
+    rng = random.Random(vendor)
+    for _ in range(300):
+        stations = _random_stations(rng, names)
+        assert apply_station_filters(stations, config) == legacy_apply(stations, config)
+
+
+def test_input_stations_are_not_mutated() -> None:
+    items = [ParsedMenuItem(name=f"Item {i}", tags=[]) for i in range(8)]
+    stations = [ParsedStation(name="Grill", items=list(items))]
+
+    filtered = apply_station_filters(stations, SODEXO_FILTER)
+
+    assert len(filtered[0].items) == 3
+    assert stations[0].items == items
+
+
+def test_compile_is_cached_per_config() -> None:
+    assert compile_station_filter(SODEXO_FILTER) is compile_station_filter(SODEXO_FILTER)
+    assert compile_station_filter(StationFilterConfig()) is not compile_station_filter(
+        SODEXO_FILTER
+    )
@@ -1,7 +1,14 @@
 "use client"
 
 import { useEffect, useState } from "react"
-import { fetchHealth, type ParserHealthResponse } from "@/lib/admin-api"
+import {
+  fetchCacheStats,
+  fetchHealth,
+  fetchUpstream,
+  type CacheStatsResponse,
+  type ParserHealthResponse,
+  type UpstreamHostStatus,
+} from "@/lib/admin-api"
 
 const HALL_DISPLAY: Record<string, string> = {
   hoch: "Hoch",
@@ -13,6 +20,9 @@ const HALL_DISPLAY: Record<string, string> = {
   oldenborg: "Oldenborg",
 }
 
+// Parser pipeline stages, in order, as reported by /health
+const STAGES = ["fetch", "parse", "validate", "persist", "cache_write", "total"]
+
 function timeAgo(isoString: string | null): string {
   if (!isoString) return "Never"
   const diff = Date.now() - new Date(isoString).getTime()
@@ -43,14 +53,20 @@ function statusColor(entry: ParserHealthResponse): {
 
 export default function HealthPage() {
   const [health, setHealth] = useState<ParserHealthResponse[]>([])
+  const [upstream, setUpstream] = useState<UpstreamHostStatus[]>([])
+  const [cacheStats, setCacheStats] = useState<CacheStatsResponse | null>(null)
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState<string | null>(null)
 
   const loadHealth = () => {
     setError(null)
     setLoading(true)
-    fetchHealth()
-      .then(setHealth)
+    Promise.all([fetchHealth(), fetchUpstream(), fetchCacheStats()])
+      .then(([healthData, upstreamData, cacheData]) => {
+        setHealth(healthData)
+        setUpstream(upstreamData)
+        setCacheStats(cacheData)
+      })
       .catch((e) => setError(e.message))
       .finally(() => setLoading(false))
   }
@@ -142,13 +158,101 @@ export default function HealthPage() {
                         {entry.error_rate.toFixed(1)}%
                       </dd>
                     </div>
+                    {entry.breakers.map((breaker) => (
+                      <div key={breaker.host} className="flex justify-between gap-2">
+                        <dt className="truncate text-gray-500" title={breaker.host}>
+                          Circuit {breaker.host}
+                        </dt>
+                        <dd
+                          className={
+                            breaker.state === "open"
+                              ? "text-red-600"
+                              : breaker.state === "half_open"
+                                ? "text-yellow-600"
+                                : ""
+                          }
+                        >
+                          {breaker.state.replace("_", "-")}
+                          {breaker.state !== "closed" &&
+                            ` since ${timeAgo(breaker.opened_at)}`}
+                        </dd>
+                      </div>
+                    ))}
                   </dl>
+
+                  {Object.keys(entry.stage_latency).length > 0 && (
+                    <table className="mt-3 w-full text-xs">
+                      <thead>
+                        <tr className="text-gray-500">
+                          <th className="text-left font-normal">Stage</th>
+                          <th className="text-right font-normal">p50</th>
+                          <th className="text-right font-normal">p95</th>
+                        </tr>
+                      </thead>
+                      <tbody>
+                        {STAGES.filter((stage) => entry.stage_latency[stage]).map(
+                          (stage) => (
+                            <tr key={stage}>
+                              <td>{stage.replace("_", " ")}</td>
+                              <td className="text-right">
+                                {entry.stage_latency[stage].p50_ms} ms
+                              </td>
+                              <td className="text-right">
+                                {entry.stage_latency[stage].p95_ms} ms
+                              </td>
+                            </tr>
+                          )
+                        )}
+                      </tbody>
+                    </table>
+                  )}
                 </div>
               )
             })}
           </div>
         </>
       )}
+
+      {upstream.length > 0 && (
+        <div className="mt-6">
+          <h2 className="font-semibold mb-2">Upstream hosts</h2>
+          <table className="w-full text-sm">
+            <thead>
+              <tr className="text-gray-500">
+                <th className="text-left font-normal">Host</th>
+                <th className="text-right font-normal">In flight</th>
+                <th className="text-right font-normal">Queued</th>
+                <th className="text-right font-normal">Peak queue</th>
+                <th className="text-right font-normal">Requests</th>
+                <th className="text-right font-normal">Avg wait</th>
+              </tr>
+            </thead>
+            <tbody>
+              {upstream.map((host) => (
+                <tr key={host.host}>
+                  <td>{host.host}</td>
+                  <td className="text-right">{host.in_flight}</td>
+                  <td className="text-right">{host.queued}</td>
+                  <td className="text-right">{host.max_queued}</td>
+                  <td className="text-right">{host.total_requests}</td>
+                  <td className="text-right">{host.avg_wait_ms} ms</td>
+                </tr>
+              ))}
+            </tbody>
+          </table>
+          <p className="mt-1 text-xs text-gray-500">
+            Counts are for the worker that served this page.
+          </p>
+        </div>
+      )}
+
+      {cacheStats && (
+        <p className="mt-4 text-sm text-gray-600 dark:text-gray-400">
+          In-process cache: {cacheStats.hit_rate.toFixed(1)}% hits ({cacheStats.hits} of{" "}
+          {cacheStats.hits + cacheStats.misses}), {cacheStats.entries} entries,{" "}
+          {(cacheStats.bytes / 1024).toFixed(0)} KiB, {cacheStats.evictions} evictions
+        </p>
+      )}
     </div>
   )
 }
@@ -145,14 +145,55 @@ export function deleteOverride(id: number): Promise<MessageResponse> {
 
 // --- Health ---
 
+export interface StageLatency {
+  p50_ms: number
+  p95_ms: number
+}
+
+export interface BreakerStatus {
+  host: string
+  state: "closed" | "open" | "half_open"
+  failures: number
+  opened_at: string | null
+}
+
 export interface ParserHealthResponse {
   hall_id: string
   last_success: string | null
   total_runs_24h: number
   error_count_24h: number
   error_rate: number
+  stage_latency: Record<string, StageLatency>
+  breakers: BreakerStatus[]
 }
 
 export function fetchHealth(): Promise<ParserHealthResponse[]> {
   return adminFetch<ParserHealthResponse[]>("/health")
 }
+
+export interface UpstreamHostStatus {
+  host: string
+  in_flight: number
+  queued: number
+  max_queued: number
+  total_requests: number
+  avg_wait_ms: number
+}
+
+export function fetchUpstream(): Promise<UpstreamHostStatus[]> {
+  return adminFetch<UpstreamHostStatus[]>("/upstream")
+}
+
+export interface CacheStatsResponse {
+  hits: number
+  misses: number
+  hit_rate: number
+  evictions: number
+  expirations: number
+  entries: number
+  bytes: number
+}
+
+export function fetchCacheStats(): Promise<CacheStatsResponse> {
+  return adminFetch<CacheStatsResponse>("/cache")
+}
@@ -23,6 +23,7 @@ export interface MenuResponse {
   stations: StationResponse[]
   is_stale: boolean
   fetched_at: string | null
+  content_hash: string | null
 }
 
 export interface OpenHallResponse {